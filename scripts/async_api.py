@@ -0,0 +1,314 @@
+"""
+API asyncio untuk MAC dan USAC
+
+Pemanggilan compute_mac atau XOR USAC secara langsung memblokir event loop
+untuk payload besar. AsyncMAC dan AsyncUSAC menjalankan input kecil secara
+inline (lebih murah daripada berpindah thread), sedangkan input besar
+dijalankan di executor bersama dengan semaphore sebagai backpressure.
+
+Permintaan MAC kecil yang datang bersamaan dengan kunci yang sama dapat
+digabung (micro-batching) menjadi satu pemanggilan compute_mac_batch;
+batch yang total ukurannya mencapai inline_threshold juga dijalankan di
+executor.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterable, Dict, List, Optional, Tuple, Union
+
+from buffer_utils import MessageInput, as_buffer
+from mac_implementation import MACImplementation
+from usac_implementation import USACImplementation, VerifyResult
+
+# Input di bawah ukuran ini dijalankan langsung di event loop
+INLINE_THRESHOLD = 64 * 1024
+
+DEFAULT_MAX_CONCURRENCY = (os.cpu_count() or 1) * 2
+DEFAULT_BATCH_SIZE = 64
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    """Executor thread bersama untuk semua facade async (dibuat saat pertama dipakai)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY,
+                                           thread_name_prefix='crypto-async')
+        return _executor
+
+
+def shutdown_shared_executor(wait: bool = True):
+    """Matikan executor bersama (dibuat ulang jika dipakai lagi)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+class _Offloader:
+    """Dasar facade async: jalankan inline atau di executor dengan semaphore"""
+
+    def __init__(self, executor: Optional[Executor], max_concurrency: int,
+                 inline_threshold: int):
+        self._executor = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.inline_threshold = inline_threshold
+
+    async def _run(self, size: int, func, *args):
+        """Jalankan func(*args) inline jika kecil, jika tidak di executor"""
+        if size < self.inline_threshold:
+            return func(*args)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            executor = self._executor or shared_executor()
+            return await loop.run_in_executor(executor, functools.partial(func, *args))
+
+
+class _MacBatch:
+    """Pesan MAC yang menunggu digabung untuk satu kunci"""
+
+    __slots__ = ('key', 'items', 'size', 'timer')
+
+    def __init__(self, key: bytes, timer: asyncio.TimerHandle):
+        self.key = key
+        self.items: List[tuple] = []
+        self.size = 0
+        self.timer = timer
+
+
+class AsyncMAC(_Offloader):
+    """
+    Facade asyncio untuk MACImplementation
+    """
+
+    def __init__(self, mac: Optional[MACImplementation] = None,
+                 executor: Optional[Executor] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 inline_threshold: int = INLINE_THRESHOLD,
+                 batch_window: Optional[float] = None,
+                 max_batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            mac: MACImplementation yang dipakai (default sha256)
+            executor: Executor untuk input besar (default executor bersama)
+            max_concurrency: Jumlah maksimum operasi di executor sekaligus
+            inline_threshold: Ukuran input (bytes) yang dijalankan inline
+            batch_window: Jendela micro-batching dalam detik (None = nonaktif)
+            max_batch_size: Jumlah pesan maksimum per batch
+        """
+        super().__init__(executor, max_concurrency, inline_threshold)
+        self.mac = mac or MACImplementation()
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._batches: Dict[Tuple[bytes, bool], _MacBatch] = {}
+        self._flushing = set()
+
+    async def compute(self, message: MessageInput, key: bytes,
+                      raw: bool = False) -> Union[str, bytes]:
+        """
+        Hitung MAC tanpa memblokir event loop
+
+        Args:
+            message: Pesan (str atau objek buffer)
+            key: Kunci rahasia
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+
+        Returns:
+            MAC dalam hex (atau bytes jika raw=True)
+        """
+        buffer = as_buffer(message)
+        if self.batch_window is not None and len(buffer) < self.inline_threshold:
+            return await self._enqueue(buffer, key, raw)
+        return await self._run(len(buffer), self.mac.compute_mac, buffer, key, raw)
+
+    async def verify(self, message: MessageInput, key: bytes,
+                     received_mac: Union[str, bytes]) -> bool:
+        """
+        Verifikasi MAC tanpa memblokir event loop
+
+        Args:
+            message: Pesan (str atau objek buffer)
+            key: Kunci rahasia
+            received_mac: MAC yang diterima (hex str atau bytes)
+
+        Returns:
+            True jika MAC valid
+        """
+        buffer = as_buffer(message)
+        return await self._run(len(buffer), self.mac.verify_mac, buffer, key, received_mac)
+
+    async def compute_stream(self, chunks: AsyncIterable, key: bytes,
+                             raw: bool = False) -> Union[str, bytes]:
+        """
+        Hitung MAC secara inkremental dari async byte stream
+
+        Args:
+            chunks: Async iterable berisi potongan pesan
+            key: Kunci rahasia
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+
+        Returns:
+            MAC dalam hex (atau bytes jika raw=True)
+        """
+        stream = self.mac.new_stream(key)
+        async for chunk in chunks:
+            buffer = as_buffer(chunk)
+            await self._run(len(buffer), stream.update, buffer)
+        return stream.finalize() if raw else stream.hexdigest()
+
+    async def verify_stream(self, chunks: AsyncIterable, key: bytes,
+                            received_mac: Union[str, bytes]) -> bool:
+        """
+        Verifikasi MAC dari async byte stream
+
+        Args:
+            chunks: Async iterable berisi potongan pesan
+            key: Kunci rahasia
+            received_mac: MAC yang diterima (hex str atau bytes)
+
+        Returns:
+            True jika MAC valid
+        """
+        stream = self.mac.new_stream(key)
+        async for chunk in chunks:
+            buffer = as_buffer(chunk)
+            await self._run(len(buffer), stream.update, buffer)
+        return stream.verify(received_mac)
+
+    async def _enqueue(self, buffer, key: bytes, raw: bool):
+        """Tambahkan pesan ke batch yang menunggu untuk kunci yang sama"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch_key = (self.mac.context_cache.fingerprint(key), raw)
+        batch = self._batches.get(batch_key)
+        if batch is None:
+            timer = loop.call_later(self.batch_window, self._flush, batch_key)
+            batch = self._batches[batch_key] = _MacBatch(key, timer)
+        batch.items.append((buffer, future))
+        batch.size += len(buffer)
+        if len(batch.items) >= self.max_batch_size:
+            self._flush(batch_key)
+        return await future
+
+    def _flush(self, batch_key: Tuple[bytes, bool]):
+        """Lepaskan batch dari antrean dan jalankan perhitungannya"""
+        batch = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        # Timer batch ini tidak boleh mem-flush batch berikutnya lebih awal
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._compute_batch(batch, batch_key[1]))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _compute_batch(self, batch: _MacBatch, raw: bool):
+        """Hitung semua MAC dalam batch dengan satu compute_mac_batch"""
+        try:
+            tags = await self._run(batch.size, self.mac.compute_mac_batch,
+                                   [buffer for buffer, _ in batch.items], batch.key, raw, 1)
+        except Exception as error:
+            for _, future in batch.items:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (_, future), tag in zip(batch.items, tags):
+            if not future.done():
+                future.set_result(tag)
+
+
+class AsyncUSAC(_Offloader):
+    """
+    Facade asyncio untuk USACImplementation
+    """
+
+    def __init__(self, usac: Optional[USACImplementation] = None,
+                 executor: Optional[Executor] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 inline_threshold: int = INLINE_THRESHOLD):
+        """
+        Args:
+            usac: USACImplementation yang dipakai
+            executor: Executor untuk input besar (default executor bersama)
+            max_concurrency: Jumlah maksimum operasi di executor sekaligus
+            inline_threshold: Ukuran input (bytes) yang dijalankan inline
+        """
+        super().__init__(executor, max_concurrency, inline_threshold)
+        self.usac = usac or USACImplementation()
+
+    async def generate_key(self, length: int) -> bytes:
+        """
+        Generate one-time key (di executor jika memakai KeyPool, yang dapat menunggu refill)
+
+        Args:
+            length: Panjang kunci dalam bytes
+
+        Returns:
+            One-time key
+        """
+        size = self.inline_threshold if self.usac.key_pool is not None else length
+        return await self._run(size, self.usac.generate_one_time_key, length)
+
+    async def encode(self, message: MessageInput, key: bytes,
+                     raw: bool = False) -> Tuple[bytes, Union[str, bytes]]:
+        """
+        Encode pesan tanpa memblokir event loop
+
+        Args:
+            message: Pesan (str atau objek buffer)
+            key: One-time key
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+
+        Returns:
+            Tuple berisi (encoded_message, authentication_tag)
+        """
+        buffer = as_buffer(message)
+        return await self._run(len(buffer), self.usac.encode_message, buffer, key, raw)
+
+    async def decode(self, encoded_message, key: bytes,
+                     as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Decode pesan tanpa memblokir event loop
+
+        Args:
+            encoded_message: Pesan yang di-encode (objek buffer)
+            key: One-time key
+            as_bytes: True untuk mengembalikan bytes tanpa decode UTF-8
+
+        Returns:
+            Pesan asli
+        """
+        buffer = as_buffer(encoded_message)
+        return await self._run(len(buffer), self.usac.decode_message, buffer, key, as_bytes)
+
+    async def verify(self, encoded_message, key: bytes, received_tag: Union[str, bytes],
+                     original_length: int) -> bool:
+        """
+        Verifikasi autentisitas tanpa memblokir event loop
+
+        Args:
+            encoded_message: Pesan yang di-encode (objek buffer)
+            key: One-time key
+            received_tag: Tag autentikasi yang diterima (hex str atau bytes)
+            original_length: Panjang pesan asli
+
+        Returns:
+            True jika autentik
+        """
+        result = await self.verify_detailed(encoded_message, key, received_tag,
+                                            original_length)
+        return result is VerifyResult.VALID
+
+    async def verify_detailed(self, encoded_message, key: bytes,
+                              received_tag: Union[str, bytes],
+                              original_length: int) -> VerifyResult:
+        """Seperti verify, tetapi mengembalikan VerifyResult"""
+        buffer = as_buffer(encoded_message)
+        return await self._run(len(buffer), self.usac.verify_authenticity_detailed,
+                               buffer, key, received_tag, original_length)
@@ -0,0 +1,203 @@
+"""
+Simulasi serangan brute force terhadap MAC
+
+Kunci target diambil dari keyspace yang diperkecil (key_bits bit) agar
+serangan benar-benar dapat berhasil dalam waktu terbatas. Kandidat kunci
+diturunkan dari counter (bukan syscall entropi per percobaan), digest
+dibandingkan sebagai bytes mentah dengan hmac.digest, dan keyspace dibagi
+ke beberapa proses. Begitu satu proses menemukan kunci, event stop
+bersama menghentikan tugas lain yang sedang berjalan pada pemeriksaan
+blok berikutnya.
+
+Laju percobaan per core yang terukur dipakai untuk memproyeksikan waktu
+pemecahan untuk ukuran kunci sebenarnya (kurva keamanan vs biaya).
+"""
+
+import hmac
+import os
+import secrets
+import time
+from typing import List, Optional, Tuple
+
+DEFAULT_KEY_LENGTH = 32
+DEFAULT_SLICE_SIZE = 1 << 16
+PROJECTED_KEY_BITS = (32, 56, 64, 80, 128, 256)
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+
+# Event stop bersama milik proses worker (diset oleh _init_worker)
+_stop_event = None
+
+
+def candidate_key(counter: int, key_length: int = DEFAULT_KEY_LENGTH) -> bytes:
+    """Turunkan kandidat kunci dari counter"""
+    return counter.to_bytes(key_length, 'big')
+
+
+def search_range(message: bytes, target: bytes, algorithm: str, key_length: int,
+                 start: int, stop: int, deadline: float,
+                 stop_event=None) -> Tuple[Optional[int], int, float]:
+    """
+    Coba semua kandidat kunci dalam [start, stop)
+
+    Args:
+        message: Pesan yang diketahui penyerang
+        target: Digest MAC target (bytes)
+        algorithm: Algoritma hash HMAC
+        key_length: Panjang kunci dalam bytes
+        start: Counter awal
+        stop: Counter akhir (eksklusif)
+        deadline: Batas waktu time.time() untuk berhenti
+        stop_event: Event opsional; pencarian berhenti jika sudah diset
+                    (diperiksa setiap blok, bersama deadline)
+
+    Returns:
+        Tuple berisi (counter_ditemukan atau None, jumlah_percobaan, detik)
+    """
+    digest = hmac.digest
+    began = time.perf_counter()
+    attempts = 0
+    step = 4096
+    for block_start in range(start, stop, step):
+        if time.time() > deadline or (stop_event is not None and stop_event.is_set()):
+            break
+        block_stop = min(block_start + step, stop)
+        for counter in range(block_start, block_stop):
+            if digest(counter.to_bytes(key_length, 'big'), message, algorithm) == target:
+                if stop_event is not None:
+                    stop_event.set()
+                return counter, attempts + counter - block_start + 1, time.perf_counter() - began
+        attempts += block_stop - block_start
+    return None, attempts, time.perf_counter() - began
+
+
+def _init_worker(stop_event):
+    """Initializer ProcessPoolExecutor: simpan event stop bersama"""
+    global _stop_event
+    _stop_event = stop_event
+
+
+def _search_task(args) -> Tuple[Optional[int], int, float]:
+    """Worker ProcessPoolExecutor untuk search_range"""
+    return search_range(*args, stop_event=_stop_event)
+
+
+def simulate_bruteforce(key_bits: int = 16, message: bytes = b"Transfer $1000 to account 12345",
+                        algorithm: str = 'sha256', workers: Optional[int] = None,
+                        max_seconds: float = 10.0, key_length: int = DEFAULT_KEY_LENGTH,
+                        slice_size: int = DEFAULT_SLICE_SIZE) -> dict:
+    """
+    Jalankan brute force terhadap kunci target dari keyspace key_bits bit
+
+    Args:
+        key_bits: Entropi kunci target dalam bit
+        message: Pesan yang diketahui penyerang
+        algorithm: Algoritma hash HMAC
+        workers: Jumlah proses (None = os.cpu_count(), 1 = tanpa proses)
+        max_seconds: Batas waktu total serangan
+        key_length: Panjang kunci dalam bytes
+        slice_size: Jumlah kandidat per tugas worker
+
+    Returns:
+        Dictionary laporan: ditemukan, percobaan, waktu, laju per core,
+        dan proyeksi waktu pemecahan
+    """
+    workers = workers or os.cpu_count() or 1
+    target_counter = secrets.randbelow(1 << key_bits)
+    target = hmac.digest(candidate_key(target_counter, key_length), message, algorithm)
+    deadline = time.time() + max_seconds
+    tasks = [(message, target, algorithm, key_length, start,
+              min(start + slice_size, 1 << key_bits), deadline)
+             for start in range(0, 1 << key_bits, slice_size)]
+
+    found = None
+    attempts = 0
+    busy_seconds = 0.0
+    started = time.perf_counter()
+    if workers == 1:
+        for task in tasks:
+            counter, tried, seconds = search_range(*task)
+            attempts += tried
+            busy_seconds += seconds
+            if counter is not None:
+                found = counter
+                break
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        stop_event = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(stop_event,)) as executor:
+            futures = [executor.submit(_search_task, task) for task in tasks]
+            for future in as_completed(futures):
+                counter, tried, seconds = future.result()
+                attempts += tried
+                busy_seconds += seconds
+                if counter is not None:
+                    found = counter
+                    stop_event.set()
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    elapsed = time.perf_counter() - started
+
+    per_core = attempts / busy_seconds if busy_seconds else 0.0
+    total_rate = attempts / elapsed if elapsed else 0.0
+    return {
+        'key_bits': key_bits,
+        'algorithm': algorithm,
+        'workers': workers,
+        'found': found is not None,
+        'attempts': attempts,
+        'keyspace': 1 << key_bits,
+        'elapsed_seconds': elapsed,
+        'attempts_per_second': total_rate,
+        'attempts_per_second_per_core': per_core,
+        'projections': project_break_times(total_rate),
+    }
+
+
+def project_break_times(attempts_per_second: float,
+                        key_bits: Tuple[int, ...] = PROJECTED_KEY_BITS) -> List[dict]:
+    """
+    Proyeksi waktu rata-rata pemecahan (setengah keyspace) per ukuran kunci
+
+    Args:
+        attempts_per_second: Laju percobaan total
+        key_bits: Daftar ukuran kunci dalam bit
+
+    Returns:
+        Daftar {'key_bits', 'expected_seconds', 'expected_years'}
+    """
+    projections = []
+    for bits in key_bits:
+        seconds = (2 ** (bits - 1)) / attempts_per_second if attempts_per_second else float('inf')
+        projections.append({
+            'key_bits': bits,
+            'expected_seconds': seconds,
+            'expected_years': seconds / SECONDS_PER_YEAR,
+        })
+    return projections
+
+
+def security_curve(bits_list: Tuple[int, ...] = (8, 12, 16, 20), **kwargs) -> List[dict]:
+    """
+    Jalankan simulasi untuk beberapa ukuran keyspace kecil
+
+    Args:
+        bits_list: Daftar entropi kunci target yang disimulasikan
+        **kwargs: Diteruskan ke simulate_bruteforce
+
+    Returns:
+        Daftar laporan simulasi
+    """
+    return [simulate_bruteforce(bits, **kwargs) for bits in bits_list]
+
+
+def format_duration(seconds: float) -> str:
+    """Format durasi menjadi teks yang mudah dibaca"""
+    if seconds < 60:
+        return f"{seconds:.2f} detik"
+    if seconds < SECONDS_PER_YEAR:
+        return f"{seconds / 3600:.1f} jam"
+    return f"{seconds / SECONDS_PER_YEAR:.3g} tahun"
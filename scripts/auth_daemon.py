@@ -0,0 +1,653 @@
+"""
+Daemon autentikasi lokal - MAC dan USAC melalui socket
+
+Daemon menyimpan konteks kunci MAC (cache LRU MACImplementation) dan state
+pad USAC (PadStore) sehingga biaya setup kunci dibagi ke semua klien.
+Klien mendaftarkan kunci sekali lalu memakai key_id per request. key_id
+adalah handle acak 16 byte yang tidak dapat ditebak; kunci yang sama yang
+didaftarkan dua kali mendapat handle berbeda, sehingga daemon tidak
+membocorkan apakah dua klien memakai kunci yang sama.
+
+Protokol biner dengan prefix panjang (network byte order):
+
+    request : panjang_payload u32 | opcode u8 | request_id u32 | payload
+    response: panjang_payload u32 | status u8 | request_id u32 | payload
+
+Klien boleh mengirim banyak request tanpa menunggu response (pipelining);
+response membawa request_id yang sama dan dapat datang tidak berurutan.
+Operasi MAC diproses paralel; operasi pad USAC diserialisasi per pad sesuai
+urutan kedatangan, karena PadStore penerima hanya dapat maju.
+
+Payload per opcode:
+
+    PING          : -                           -> -
+    REGISTER_KEY  : kunci                       -> key_id 16B
+    UNREGISTER_KEY: key_id 16B                  -> dihapus u8
+    MAC_COMPUTE   : key_id 16B | pesan          -> tag
+    MAC_VERIFY    : key_id 16B | len_tag u16 | tag | pesan -> valid u8
+    USAC_ENCODE   : pesan                       -> offset u64 | len_tag u16 | tag | encoded
+    USAC_DECODE   : offset u64 | len_tag u16 | tag | encoded -> pesan
+
+Status selain STATUS_OK membawa pesan error UTF-8.
+
+Secara default daemon mendengarkan di unix socket milik user (mode 0600),
+sehingga hanya proses user yang sama yang dapat memakai pad dan kunci
+daemon. Alamat TCP memerlukan shared secret: setelah koneksi dibuka daemon
+mengirim nonce acak 16 byte, dan klien harus membalas dengan
+HMAC-SHA256(secret, nonce) sebelum request pertama. Alamat TCP juga
+dibatasi ke loopback kecuali allow_remote=True (--allow-remote).
+"""
+
+import argparse
+import asyncio
+import hmac
+import ipaddress
+import os
+import queue
+import secrets
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+HEADER = struct.Struct('!IBI')
+KEY_ID = struct.Struct('!16s')
+TAG_LEN = struct.Struct('!H')
+OFFSET_TAG = struct.Struct('!QH')
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+MAX_IN_FLIGHT = 128
+DEFAULT_MAX_KEYS = 10000
+DEFAULT_SOCKET_PATH = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                                   f"crypto-auth-{os.getuid()}.sock")
+DEFAULT_ADDRESS = f"unix:{DEFAULT_SOCKET_PATH}"
+SOCKET_MODE = 0o600
+
+# Handshake shared secret: nonce dari daemon, bukti HMAC-SHA256 dari klien
+AUTH_NONCE_SIZE = 16
+AUTH_PROOF_SIZE = 32
+AUTH_TIMEOUT = 10.0
+
+OP_PING = 0
+OP_REGISTER_KEY = 1
+OP_MAC_COMPUTE = 2
+OP_MAC_VERIFY = 3
+OP_USAC_ENCODE = 4
+OP_USAC_DECODE = 5
+OP_UNREGISTER_KEY = 6
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+class DaemonError(Exception):
+    """Error yang dikembalikan daemon untuk satu request"""
+
+
+def _is_loopback(host: str) -> bool:
+    """True jika host adalah alamat loopback"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def parse_address(address: str,
+                  allow_remote: bool = False) -> Tuple[int, Union[str, Tuple[str, int]]]:
+    """
+    Ubah teks alamat menjadi (family, alamat socket)
+
+    Args:
+        address: 'unix:/path/socket' atau 'host:port' (host default 127.0.0.1)
+        allow_remote: True untuk mengizinkan host TCP selain loopback
+
+    Returns:
+        Tuple berisi (socket family, alamat)
+
+    Raises:
+        ValueError: Jika host bukan loopback dan allow_remote False
+    """
+    if address.startswith('unix:'):
+        return socket.AF_UNIX, address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    host = host or '127.0.0.1'
+    if not allow_remote and not _is_loopback(host):
+        raise ValueError(f"Alamat {host} bukan loopback (gunakan allow_remote)")
+    return socket.AF_INET, (host, int(port))
+
+
+def auth_proof(secret: bytes, nonce: bytes) -> bytes:
+    """Bukti handshake klien: HMAC-SHA256(secret, nonce)"""
+    return hmac.digest(secret, nonce, 'sha256')
+
+
+def _encode_frame(code: int, request_id: int, payload: bytes = b'') -> bytes:
+    """Susun satu frame (header + payload)"""
+    return HEADER.pack(len(payload), code, request_id) + payload
+
+
+class AuthDaemon:
+    """
+    Server asyncio untuk operasi MAC dan USAC
+    """
+
+    def __init__(self, mac=None, usac=None, send_pad=None, recv_pad=None,
+                 secret: Optional[bytes] = None, max_keys: int = DEFAULT_MAX_KEYS):
+        """
+        Args:
+            mac: MACImplementation (default sha256)
+            usac: USACImplementation untuk operasi pad (default tag polinomial 64 bit)
+            send_pad: PadStore untuk USAC_ENCODE (sisi pengirim)
+            recv_pad: PadStore untuk USAC_DECODE (sisi penerima)
+            secret: Shared secret handshake (wajib untuk alamat TCP)
+            max_keys: Jumlah kunci terdaftar maksimum
+        """
+        from async_api import AsyncMAC
+        from mac_implementation import MACImplementation
+        from usac_implementation import POLY_TAG_BITS, USACImplementation
+
+        self.mac = mac or MACImplementation()
+        self.usac = usac or USACImplementation(tag_bits=POLY_TAG_BITS)
+        self.send_pad = send_pad
+        self.recv_pad = recv_pad
+        self.secret = secret
+        self.max_keys = max_keys
+        self._async_mac = AsyncMAC(self.mac)
+        self._keys: Dict[bytes, bytes] = {}
+        self._pad_locks = {'send': asyncio.Lock(), 'recv': asyncio.Lock()}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers = {
+            OP_PING: self._ping,
+            OP_REGISTER_KEY: self._register_key,
+            OP_UNREGISTER_KEY: self._unregister_key,
+            OP_MAC_COMPUTE: self._mac_compute,
+            OP_MAC_VERIFY: self._mac_verify,
+            OP_USAC_ENCODE: self._usac_encode,
+            OP_USAC_DECODE: self._usac_decode,
+        }
+
+    async def start(self, address: str = DEFAULT_ADDRESS,
+                    allow_remote: bool = False) -> asyncio.AbstractServer:
+        """
+        Mulai mendengarkan pada alamat (unix:/path atau host:port loopback)
+
+        Unix socket dibuat dengan mode 0600. Alamat TCP dapat dihubungi
+        semua user lokal, sehingga memerlukan secret.
+
+        Raises:
+            ValueError: Jika alamat TCP dipakai tanpa secret
+            FileExistsError: Jika path unix sudah dipakai file selain socket
+        """
+        family, target = parse_address(address, allow_remote)
+        if family == socket.AF_UNIX:
+            # Hanya socket lama yang dihapus; file lain di path itu tidak disentuh
+            try:
+                if not stat.S_ISSOCK(os.lstat(target).st_mode):
+                    raise FileExistsError(f"{target} sudah ada dan bukan socket")
+                os.unlink(target)
+            except FileNotFoundError:
+                pass
+            # umask membuat socket langsung 0600, tanpa jeda sebelum chmod
+            previous = os.umask(0o777 & ~SOCKET_MODE)
+            try:
+                self._server = await asyncio.start_unix_server(self._serve_connection, target)
+            finally:
+                os.umask(previous)
+            os.chmod(target, SOCKET_MODE)
+        else:
+            if self.secret is None:
+                raise ValueError("Alamat TCP memerlukan secret (--secret-file); "
+                                 "gunakan unix socket untuk akses tanpa secret")
+            self._server = await asyncio.start_server(self._serve_connection, *target)
+        return self._server
+
+    async def serve_forever(self, address: str = DEFAULT_ADDRESS, allow_remote: bool = False):
+        """Jalankan daemon sampai dihentikan"""
+        server = await self.start(address, allow_remote)
+        async with server:
+            await server.serve_forever()
+
+    async def _serve_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """Baca frame dari satu koneksi dan proses secara pipelined"""
+        in_flight = asyncio.Semaphore(MAX_IN_FLIGHT)
+        tasks = set()
+        try:
+            if self.secret is not None and not await self._authenticate(reader, writer):
+                return
+            while True:
+                try:
+                    header = await reader.readexactly(HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                length, opcode, request_id = HEADER.unpack(header)
+                if length > MAX_FRAME_SIZE:
+                    writer.write(_encode_frame(STATUS_ERROR, request_id,
+                                               b"Frame terlalu besar"))
+                    break
+                payload = await reader.readexactly(length)
+                await in_flight.acquire()
+                task = asyncio.ensure_future(
+                    self._respond(writer, opcode, request_id, payload, in_flight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _authenticate(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> bool:
+        """Handshake shared secret: kirim nonce, verifikasi bukti HMAC klien"""
+        nonce = secrets.token_bytes(AUTH_NONCE_SIZE)
+        writer.write(nonce)
+        await writer.drain()
+        try:
+            proof = await asyncio.wait_for(reader.readexactly(AUTH_PROOF_SIZE), AUTH_TIMEOUT)
+        except asyncio.TimeoutError:
+            return False
+        return hmac.compare_digest(proof, auth_proof(self.secret, nonce))
+
+    async def _respond(self, writer: asyncio.StreamWriter, opcode: int, request_id: int,
+                       payload: bytes, in_flight: asyncio.Semaphore):
+        """Jalankan satu request lalu tulis response-nya"""
+        try:
+            handler = self._handlers.get(opcode)
+            if handler is None:
+                raise ValueError(f"Opcode tidak dikenal: {opcode}")
+            frame = _encode_frame(STATUS_OK, request_id, await handler(memoryview(payload)))
+        except Exception as error:
+            frame = _encode_frame(STATUS_ERROR, request_id, str(error).encode('utf-8'))
+        finally:
+            in_flight.release()
+        writer.write(frame)
+        await writer.drain()
+
+    def _key(self, payload: memoryview) -> bytes:
+        """Ambil kunci terdaftar dari key_id di awal payload"""
+        if len(payload) < KEY_ID.size:
+            raise ValueError("Payload terlalu pendek untuk key_id")
+        key_id, = KEY_ID.unpack_from(payload)
+        try:
+            return self._keys[key_id]
+        except KeyError:
+            raise ValueError("key_id tidak dikenal") from None
+
+    async def _ping(self, payload: memoryview) -> bytes:
+        return b''
+
+    async def _register_key(self, payload: memoryview) -> bytes:
+        key = bytes(payload)
+        if not key:
+            raise ValueError("Kunci kosong")
+        if len(self._keys) >= self.max_keys:
+            raise ValueError(f"Jumlah kunci terdaftar mencapai batas {self.max_keys}")
+        # Handle acak per pendaftaran, tanpa dedup antar klien
+        key_id = secrets.token_bytes(KEY_ID.size)
+        while key_id in self._keys:
+            key_id = secrets.token_bytes(KEY_ID.size)
+        self._keys[key_id] = key
+        return KEY_ID.pack(key_id)
+
+    async def _unregister_key(self, payload: memoryview) -> bytes:
+        if len(payload) != KEY_ID.size:
+            raise ValueError("Payload harus berisi key_id")
+        key_id, = KEY_ID.unpack_from(payload)
+        return b'\x01' if self._keys.pop(key_id, None) is not None else b'\x00'
+
+    async def _mac_compute(self, payload: memoryview) -> bytes:
+        key = self._key(payload)
+        return await self._async_mac.compute(payload[KEY_ID.size:], key, raw=True)
+
+    async def _mac_verify(self, payload: memoryview) -> bytes:
+        key = self._key(payload)
+        tag_length, = TAG_LEN.unpack_from(payload, KEY_ID.size)
+        start = KEY_ID.size + TAG_LEN.size
+        tag = bytes(payload[start:start + tag_length])
+        valid = await self._async_mac.verify(payload[start + tag_length:], key, tag)
+        return b'\x01' if valid else b'\x00'
+
+    async def _usac_encode(self, payload: memoryview) -> bytes:
+        if self.send_pad is None:
+            raise ValueError("Daemon tidak memiliki pad pengirim")
+        from async_api import shared_executor
+        loop = asyncio.get_running_loop()
+        async with self._pad_locks['send']:
+            offset, encoded, tag = await loop.run_in_executor(
+                shared_executor(), self.usac.encode_from_pad, payload, self.send_pad, True)
+        return OFFSET_TAG.pack(offset, len(tag)) + tag + encoded
+
+    async def _usac_decode(self, payload: memoryview) -> bytes:
+        if self.recv_pad is None:
+            raise ValueError("Daemon tidak memiliki pad penerima")
+        from async_api import shared_executor
+        offset, tag_length = OFFSET_TAG.unpack_from(payload)
+        tag = bytes(payload[OFFSET_TAG.size:OFFSET_TAG.size + tag_length])
+        encoded = payload[OFFSET_TAG.size + tag_length:]
+        loop = asyncio.get_running_loop()
+        # Lock asyncio bersifat FIFO dan tidak ada await sebelum acquire,
+        # sehingga region pad diklaim sesuai urutan request diterima
+        async with self._pad_locks['recv']:
+            return await loop.run_in_executor(
+                shared_executor(), self.usac.decode_from_pad, encoded, self.recv_pad,
+                offset, tag, True)
+
+
+def _recv_exact(sock: socket.socket, length: int) -> bytes:
+    """Baca tepat length bytes dari socket"""
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    received = 0
+    while received < length:
+        n = sock.recv_into(view[received:])
+        if not n:
+            raise ConnectionError("Koneksi ditutup daemon")
+        received += n
+    return bytes(buffer)
+
+
+class AuthConnection:
+    """
+    Satu koneksi sinkron ke daemon dengan dukungan pipelining
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: Optional[float] = 30.0,
+                 allow_remote: bool = False, secret: Optional[bytes] = None):
+        family, target = parse_address(address, allow_remote)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(target)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if secret is not None:
+            nonce = _recv_exact(self.sock, AUTH_NONCE_SIZE)
+            self.sock.sendall(auth_proof(secret, nonce))
+        self._next_id = 0
+
+    def close(self):
+        self.sock.close()
+
+    def pipeline(self, requests: Sequence[Tuple[int, bytes]]) -> List[bytes]:
+        """
+        Kirim banyak request sekaligus lalu baca semua response
+
+        Args:
+            requests: Daftar (opcode, payload)
+
+        Returns:
+            Payload response dengan urutan yang sama dengan requests
+
+        Raises:
+            DaemonError: Jika salah satu request gagal
+        """
+        ids = []
+        frames = []
+        for opcode, payload in requests:
+            self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+            ids.append(self._next_id)
+            frames.append(_encode_frame(opcode, self._next_id, bytes(payload)))
+        self.sock.sendall(b''.join(frames))
+
+        responses = {}
+        for _ in ids:
+            length, status, request_id = HEADER.unpack(_recv_exact(self.sock, HEADER.size))
+            responses[request_id] = (status, _recv_exact(self.sock, length))
+        results = []
+        for request_id in ids:
+            status, payload = responses[request_id]
+            if status != STATUS_OK:
+                raise DaemonError(payload.decode('utf-8', 'replace'))
+            results.append(payload)
+        return results
+
+    def request(self, opcode: int, payload: bytes = b'') -> bytes:
+        """Kirim satu request dan tunggu response-nya"""
+        return self.pipeline([(opcode, payload)])[0]
+
+
+class AuthClient:
+    """
+    Klien daemon dengan connection pool (thread-safe)
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, pool_size: int = 4,
+                 timeout: Optional[float] = 30.0, allow_remote: bool = False,
+                 secret: Optional[bytes] = None):
+        """
+        Args:
+            address: Alamat daemon (unix:/path atau host:port)
+            pool_size: Jumlah koneksi maksimum yang disimpan untuk dipakai ulang
+            timeout: Timeout socket dalam detik
+            allow_remote: True untuk mengizinkan daemon di host selain loopback
+            secret: Shared secret handshake (jika daemon memakainya)
+        """
+        self.address = address
+        self.timeout = timeout
+        self.allow_remote = allow_remote
+        self.secret = secret
+        self._pool: 'queue.LifoQueue[AuthConnection]' = queue.LifoQueue(pool_size)
+
+    def __enter__(self) -> 'AuthClient':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _acquire(self) -> AuthConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return AuthConnection(self.address, self.timeout, self.allow_remote, self.secret)
+
+    def _release(self, connection: AuthConnection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def pipeline(self, requests: Sequence[Tuple[int, bytes]]) -> List[bytes]:
+        """Jalankan banyak request pada satu koneksi dari pool"""
+        connection = self._acquire()
+        try:
+            results = connection.pipeline(requests)
+        except DaemonError:
+            self._release(connection)
+            raise
+        except Exception:
+            connection.close()
+            raise
+        self._release(connection)
+        return results
+
+    def close(self):
+        """Tutup semua koneksi di pool"""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def ping(self):
+        self.pipeline([(OP_PING, b'')])
+
+    def register_key(self, key: bytes) -> bytes:
+        """Daftarkan kunci MAC di daemon dan kembalikan key_id (handle 16 byte)"""
+        return KEY_ID.unpack(self.pipeline([(OP_REGISTER_KEY, key)])[0])[0]
+
+    def unregister_key(self, key_id: bytes) -> bool:
+        """Hapus kunci terdaftar; False jika key_id tidak dikenal"""
+        return self.pipeline([(OP_UNREGISTER_KEY, KEY_ID.pack(key_id))])[0] == b'\x01'
+
+    def compute_mac(self, key_id: bytes, message: bytes) -> bytes:
+        """Hitung MAC (raw) untuk pesan dengan kunci terdaftar"""
+        return self.pipeline([(OP_MAC_COMPUTE, KEY_ID.pack(key_id) + message)])[0]
+
+    def compute_mac_many(self, key_id: bytes, messages: Sequence[bytes]) -> List[bytes]:
+        """Hitung MAC untuk banyak pesan dalam satu pipeline"""
+        prefix = KEY_ID.pack(key_id)
+        return self.pipeline([(OP_MAC_COMPUTE, prefix + message) for message in messages])
+
+    def verify_mac(self, key_id: bytes, message: bytes, tag: bytes) -> bool:
+        """Verifikasi MAC (raw) untuk pesan dengan kunci terdaftar"""
+        payload = KEY_ID.pack(key_id) + TAG_LEN.pack(len(tag)) + tag + message
+        return self.pipeline([(OP_MAC_VERIFY, payload)])[0] == b'\x01'
+
+    def usac_encode(self, message: bytes) -> Tuple[int, bytes, bytes]:
+        """Encode pesan dengan pad pengirim daemon: (offset, encoded, tag)"""
+        response = self.pipeline([(OP_USAC_ENCODE, message)])[0]
+        offset, tag_length = OFFSET_TAG.unpack_from(response)
+        tag = response[OFFSET_TAG.size:OFFSET_TAG.size + tag_length]
+        return offset, response[OFFSET_TAG.size + tag_length:], tag
+
+    def usac_decode(self, offset: int, encoded: bytes, tag: bytes) -> bytes:
+        """Verifikasi dan decode pesan dengan pad penerima daemon"""
+        payload = OFFSET_TAG.pack(offset, len(tag)) + tag + encoded
+        return self.pipeline([(OP_USAC_DECODE, payload)])[0]
+
+
+def run_load(address: str = DEFAULT_ADDRESS, connections: int = 4, duration: float = 5.0,
+             message_size: int = 256, pipeline_depth: int = 16,
+             secret: Optional[bytes] = None) -> dict:
+    """
+    Load generator MAC_COMPUTE: ukur req/s dan latensi ekor
+
+    Setiap thread memakai satu koneksi dan mengirim pipeline_depth request
+    per putaran; latensi per request adalah waktu putaran tersebut.
+
+    Args:
+        address: Alamat daemon
+        connections: Jumlah koneksi (thread) paralel
+        duration: Lama pengujian dalam detik
+        message_size: Ukuran pesan per request
+        pipeline_depth: Jumlah request per putaran pipeline
+        secret: Shared secret handshake (jika daemon memakainya)
+
+    Returns:
+        Dictionary berisi jumlah request, req/s dan persentil latensi
+    """
+    from instrumentation import LatencyHistogram
+
+    histogram = LatencyHistogram()
+    lock = threading.Lock()
+    totals = {'requests': 0, 'errors': 0}
+    message = os.urandom(message_size)
+    client = AuthClient(address, pool_size=connections, secret=secret)
+    key_id = client.register_key(os.urandom(32))
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        local = LatencyHistogram()
+        done = errors = 0
+        while time.perf_counter() < deadline:
+            start = time.perf_counter_ns()
+            try:
+                client.compute_mac_many(key_id, [message] * pipeline_depth)
+            except (DaemonError, OSError):
+                errors += pipeline_depth
+                continue
+            elapsed = time.perf_counter_ns() - start
+            for _ in range(pipeline_depth):
+                local.record(elapsed)
+            done += pipeline_depth
+        with lock:
+            totals['requests'] += done
+            totals['errors'] += errors
+            for index, count in local.counts.items():
+                histogram.counts[index] = histogram.counts.get(index, 0) + count
+            histogram.total += local.total
+            histogram.sum_ns += local.sum_ns
+            histogram.max_ns = max(histogram.max_ns, local.max_ns)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    client.unregister_key(key_id)
+    client.close()
+
+    return {
+        'requests': totals['requests'],
+        'errors': totals['errors'],
+        'seconds': elapsed,
+        'requests_per_second': totals['requests'] / elapsed if elapsed else 0.0,
+        'p50_us': histogram.percentile(0.50) / 1e3,
+        'p99_us': histogram.percentile(0.99) / 1e3,
+        'p999_us': histogram.percentile(0.999) / 1e3,
+        'max_us': histogram.max_ns / 1e3,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI daemon dan load generator"""
+    parser = argparse.ArgumentParser(description="Daemon autentikasi MAC/USAC")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve = subparsers.add_parser('serve', help="Jalankan daemon")
+    serve.add_argument('--address', default=DEFAULT_ADDRESS,
+                       help=f"unix:/path atau host:port (default {DEFAULT_ADDRESS})")
+    serve.add_argument('--allow-remote', action='store_true',
+                       help="Izinkan mendengarkan di alamat selain loopback")
+    serve.add_argument('--secret-file',
+                       help="File shared secret handshake (wajib untuk alamat TCP)")
+    serve.add_argument('--max-keys', type=int, default=DEFAULT_MAX_KEYS)
+    serve.add_argument('--algorithm', default='sha256')
+    serve.add_argument('--send-pad', help="File pad untuk USAC_ENCODE")
+    serve.add_argument('--recv-pad', help="File pad untuk USAC_DECODE")
+
+    load = subparsers.add_parser('load', help="Jalankan load generator")
+    load.add_argument('--address', default=DEFAULT_ADDRESS)
+    load.add_argument('--secret-file', help="File shared secret handshake")
+    load.add_argument('--connections', type=int, default=4)
+    load.add_argument('--duration', type=float, default=5.0)
+    load.add_argument('--size', type=int, default=256)
+    load.add_argument('--pipeline', type=int, default=16)
+
+    args = parser.parse_args(argv)
+    secret = None
+    if args.secret_file:
+        with open(args.secret_file, 'rb') as f:
+            secret = f.read()
+        if not secret:
+            parser.error("file secret kosong")
+
+    if args.command == 'serve':
+        from mac_implementation import MACImplementation
+        from pad_store import PadStore
+
+        send_pad = PadStore(args.send_pad) if args.send_pad else None
+        recv_pad = PadStore(args.recv_pad) if args.recv_pad else None
+        daemon = AuthDaemon(MACImplementation(args.algorithm), send_pad=send_pad,
+                            recv_pad=recv_pad, secret=secret, max_keys=args.max_keys)
+        print(f"Daemon mendengarkan di {args.address}")
+        try:
+            asyncio.run(daemon.serve_forever(args.address, args.allow_remote))
+        except KeyboardInterrupt:
+            pass
+        except (ValueError, FileExistsError) as error:
+            print(f"Error: {error}", file=sys.stderr)
+            return 2
+        return 0
+
+    report = run_load(args.address, args.connections, args.duration,
+                      args.size, args.pipeline, secret)
+    print(f"{report['requests']:,} request dalam {report['seconds']:.2f} s "
+          f"({report['requests_per_second']:,.0f} req/s, {report['errors']} error)")
+    print(f"latensi p50 {report['p50_us']:.1f} us  p99 {report['p99_us']:.1f} us  "
+          f"p99.9 {report['p999_us']:.1f} us  max {report['max_us']:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Benchmark MAC dan USAC
+
+Pengukuran memakai time.perf_counter_ns dengan warmup, pengulangan, dan
+statistik median/persentil. Setiap sampel mengukur beberapa pemanggilan
+(dikalibrasi otomatis) agar operasi kecil tidak tenggelam dalam resolusi
+timer. Pembuatan kunci dan data uji dilakukan di luar area yang diukur.
+
+Hasil dapat disimpan ke JSON/CSV, dan mode compare menandai regresi antara
+dua file hasil.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from mac_implementation import MACImplementation
+from usac_implementation import USACImplementation
+from xor_engine import available_backends
+
+# 16 B sampai 256 MB, kelipatan 4
+DEFAULT_SIZES = [16 * 4 ** i for i in range(13)]
+
+# Lebar tag polinomial USAC yang diukur selain tag lama 8 bit
+POLY_TAG_WIDTHS = (32, 64, 128)
+
+# Backend referensi per-byte terlalu lambat untuk pesan besar
+LOOP_BACKEND_MAX_SIZE = 1024 * 1024
+
+MIN_SAMPLE_NS = 1_000_000
+
+
+def parse_size(text: str) -> int:
+    """Ubah teks ukuran ('64K', '16M', '1G') menjadi bytes"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Persentil dengan interpolasi linear"""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    position = fraction * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def _calibrate(func: Callable, min_sample_ns: int) -> int:
+    """Cari jumlah pemanggilan per sampel agar sampel >= min_sample_ns"""
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter_ns() - start
+        if elapsed >= min_sample_ns or number >= 1 << 20:
+            return number
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_sample_ns / elapsed) + 1))
+
+
+def measure(func: Callable, size: int, warmup: int = 3, repeat: int = 20,
+            max_seconds: float = 10.0) -> dict:
+    """
+    Ukur waktu satu operasi
+
+    Args:
+        func: Operasi tanpa argumen yang akan diukur
+        size: Ukuran payload (bytes) untuk menghitung throughput
+        warmup: Jumlah sampel pemanasan yang dibuang
+        repeat: Jumlah sampel yang diukur
+        max_seconds: Batas waktu pengukuran; sampel dikurangi jika terlampaui
+
+    Returns:
+        Dictionary statistik dalam nanodetik per operasi dan MB/s
+    """
+    number = _calibrate(func, MIN_SAMPLE_NS)
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+
+    samples = []
+    deadline = time.perf_counter() + max_seconds
+    for i in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter_ns() - start) / number)
+        if i >= 2 and time.perf_counter() > deadline:
+            break
+
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        'size': size,
+        'samples': len(samples),
+        'number': number,
+        'median_ns': median,
+        'mean_ns': statistics.fmean(ordered),
+        'stdev_ns': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'min_ns': ordered[0],
+        'max_ns': ordered[-1],
+        'p5_ns': _percentile(ordered, 0.05),
+        'p95_ns': _percentile(ordered, 0.95),
+        'p99_ns': _percentile(ordered, 0.99),
+        'throughput_mb_s': size / median * 1e3 if median else 0.0,
+    }
+
+
+def _mac_targets(sizes: Iterable[int]) -> Iterable[tuple]:
+    """Target benchmark untuk setiap algoritma MAC: (nama, ukuran, setup)"""
+    key = MACImplementation().generate_key()
+    for algorithm in MACImplementation().supported_algorithms:
+        impl = MACImplementation(algorithm)
+        for size in sizes:
+            def setup(impl=impl, size=size):
+                payload = os.urandom(size)
+                return lambda: impl.compute_mac(payload, key)
+            yield f"mac-{algorithm}", size, setup
+
+
+def _usac_targets(sizes: Iterable[int]) -> Iterable[tuple]:
+    """
+    Target benchmark USAC: encode per backend XOR (tag lama), lalu encode
+    dan verify untuk tag lama dan setiap lebar tag polinomial
+    """
+    for backend in ['auto'] + available_backends():
+        usac = USACImplementation(xor_backend=backend)
+        for size in sizes:
+            if backend == 'loop' and size > LOOP_BACKEND_MAX_SIZE:
+                continue
+            def setup(usac=usac, size=size):
+                payload = os.urandom(size)
+                key = os.urandom(usac.required_key_length(size))
+                return lambda: usac.encode_message(payload, key)
+            yield f"usac-encode-{backend}", size, setup
+
+    for tag_bits in (None,) + POLY_TAG_WIDTHS:
+        usac = USACImplementation() if tag_bits is None else USACImplementation(tag_bits=tag_bits)
+        suffix = "" if tag_bits is None else f"-poly{tag_bits}"
+        for size in sizes:
+            if tag_bits is not None:
+                def setup(usac=usac, size=size):
+                    payload = os.urandom(size)
+                    key = os.urandom(usac.required_key_length(size))
+                    return lambda: usac.encode_message(payload, key, raw=True)
+                yield f"usac-encode{suffix}", size, setup
+
+            def setup(usac=usac, size=size):
+                payload = os.urandom(size)
+                key = os.urandom(usac.required_key_length(size))
+                encoded, tag = usac.encode_message(payload, key, raw=True)
+                return lambda: usac.verify_authenticity(encoded, key, tag, size)
+            yield f"usac-verify{suffix}", size, setup
+
+
+def run_suite(sizes: Optional[List[int]] = None, warmup: int = 3, repeat: int = 20,
+              max_seconds: float = 10.0, targets: Optional[List[str]] = None,
+              progress: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Jalankan seluruh benchmark
+
+    Args:
+        sizes: Daftar ukuran payload (default 16 B - 256 MB)
+        warmup: Jumlah sampel pemanasan
+        repeat: Jumlah sampel per pengukuran
+        max_seconds: Batas waktu per pengukuran
+        targets: Filter awalan nama target (misalnya ['mac', 'usac-encode'])
+        progress: Callback yang dipanggil untuk setiap hasil
+
+    Returns:
+        Dictionary berisi metadata environment dan daftar hasil
+    """
+    sizes = sizes or DEFAULT_SIZES
+    results = []
+    for source in (_mac_targets, _usac_targets):
+        for name, size, setup in source(sizes):
+            if targets and not any(name.startswith(prefix) for prefix in targets):
+                continue
+            result = {'name': name}
+            result.update(measure(setup(), size, warmup, repeat, max_seconds))
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def write_json(report: dict, path: str):
+    """Simpan hasil benchmark ke file JSON"""
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+
+def write_csv(report: dict, path: str):
+    """Simpan hasil benchmark ke file CSV"""
+    results = report['results']
+    if not results:
+        return
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_results(path: str) -> dict:
+    """Baca file hasil benchmark (JSON)"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.10) -> List[dict]:
+    """
+    Bandingkan dua hasil benchmark berdasarkan median
+
+    Args:
+        baseline: Hasil acuan
+        current: Hasil baru
+        threshold: Perlambatan relatif yang dianggap regresi (0.10 = 10%)
+
+    Returns:
+        Daftar perbandingan per (name, size) dengan flag 'regression'
+    """
+    reference: Dict[tuple, dict] = {(r['name'], r['size']): r for r in baseline['results']}
+    comparisons = []
+    for result in current['results']:
+        base = reference.get((result['name'], result['size']))
+        if base is None or not base['median_ns']:
+            continue
+        change = result['median_ns'] / base['median_ns'] - 1
+        comparisons.append({
+            'name': result['name'],
+            'size': result['size'],
+            'baseline_ns': base['median_ns'],
+            'current_ns': result['median_ns'],
+            'change': change,
+            'regression': change > threshold,
+        })
+    return comparisons
+
+
+def format_size(size: int) -> str:
+    """Format ukuran bytes menjadi teks singkat"""
+    for unit in ('B', 'K', 'M', 'G'):
+        if size < 1024 or unit == 'G':
+            return f"{size}{unit}" if unit == 'B' else f"{size:g}{unit}"
+        size /= 1024
+    return str(size)
+
+
+def print_result(result: dict):
+    """Cetak satu baris hasil benchmark"""
+    print(f"{result['name']:<22} {format_size(result['size']):>6} "
+          f"median {result['median_ns'] / 1e3:>12.2f} us  "
+          f"p95 {result['p95_ns'] / 1e3:>12.2f} us  "
+          f"{result['throughput_mb_s']:>10.2f} MB/s")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark MAC dan USAC")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run = subparsers.add_parser('run', help="Jalankan benchmark")
+    run.add_argument('--min-size', default='16', help="Ukuran minimum (default 16)")
+    run.add_argument('--max-size', default='256M', help="Ukuran maksimum (default 256M)")
+    run.add_argument('--warmup', type=int, default=3)
+    run.add_argument('--repeat', type=int, default=20)
+    run.add_argument('--max-seconds', type=float, default=10.0)
+    run.add_argument('--target', action='append', help="Filter awalan nama target")
+    run.add_argument('--json', help="Simpan hasil ke file JSON")
+    run.add_argument('--csv', help="Simpan hasil ke file CSV")
+
+    compare = subparsers.add_parser('compare', help="Bandingkan dua file hasil")
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help="Perlambatan relatif yang dianggap regresi")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        low, high = parse_size(args.min_size), parse_size(args.max_size)
+        sizes = [size for size in DEFAULT_SIZES if low <= size <= high]
+        report = run_suite(sizes, args.warmup, args.repeat, args.max_seconds,
+                           args.target, print_result)
+        if args.json:
+            write_json(report, args.json)
+        if args.csv:
+            write_csv(report, args.csv)
+        return 0
+
+    comparisons = compare_results(load_results(args.baseline),
+                                  load_results(args.current), args.threshold)
+    regressions = 0
+    for item in comparisons:
+        flag = "REGRESI" if item['regression'] else "ok"
+        regressions += item['regression']
+        print(f"{item['name']:<22} {format_size(item['size']):>6} "
+              f"{item['baseline_ns'] / 1e3:>12.2f} -> {item['current_ns'] / 1e3:>12.2f} us "
+              f"({item['change'] * 100:+.1f}%) {flag}")
+    print(f"\n{regressions} regresi dari {len(comparisons)} pengukuran")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Utilitas buffer untuk jalur input bytes-native
+
+MAC dan USAC menerima str (di-encode UTF-8) maupun objek apa pun yang
+mendukung buffer protocol (bytes, bytearray, memoryview, mmap) tanpa
+menyalin isinya.
+"""
+
+from typing import Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+MessageInput = Union[str, bytes, bytearray, memoryview]
+
+
+def as_buffer(data) -> BytesLike:
+    """
+    Ubah input pesan menjadi buffer bytes tanpa salinan jika memungkinkan
+
+    Args:
+        data: str atau objek buffer protocol
+
+    Returns:
+        bytes (untuk str) atau memoryview byte-per-byte atas data asli
+    """
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if isinstance(data, bytes):
+        return data
+    view = memoryview(data)
+    if view.format != 'B' or view.ndim != 1:
+        view = view.cast('B')
+    return view
@@ -0,0 +1,453 @@
+"""
+CLI massal untuk tag, verifikasi, dan encoding file dengan MAC/USAC
+
+Subcommand:
+    tag          Hitung MAC file/direktori/stdin, tulis sidecar atau manifest
+    verify       Verifikasi file terhadap sidecar atau manifest
+    usac-encode  Encode file ke format USAC berbingkai dengan PadStore
+    usac-decode  Verifikasi dan decode file berbingkai USAC
+    bench        Jalankan benchmark MAC/USAC
+
+File dibaca per chunk (memori konstan) dan direktori diproses dengan
+worker pool thread. Dengan --json, laporan (throughput dan daftar
+kegagalan) ditulis ke stdout sebagai JSON; exit code 1 jika ada kegagalan,
+2 jika manifest tidak dapat dibaca.
+
+Format manifest sama dengan sha256sum ('<tag hex>  <path>') dengan baris
+komentar '# algorithm: <nama>'. Sidecar ditulis sebagai <file>.mac.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+SIDECAR_SUFFIX = '.mac'
+FRAMED_SUFFIX = '.usf'
+STDIN = '-'
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+# Lebar tag format berbingkai; usac-decode memakai nilai yang sama kecuali
+# diberikan --tag-bits (lebar tag tidak pernah diambil dari header stream)
+DEFAULT_FRAMED_TAG_BITS = 64
+
+
+def iter_inputs(paths: Iterable[str], skip_suffixes: Tuple[str, ...] = ()) -> Iterator[str]:
+    """Semua file dari daftar path (direktori ditelusuri), '-' untuk stdin"""
+    from integrity_index import walk_files
+
+    for path in paths:
+        if path == STDIN:
+            yield path
+            continue
+        for file_path in walk_files(path):
+            if not file_path.endswith(skip_suffixes):
+                yield file_path
+
+
+def read_key(path: str) -> bytes:
+    """Baca kunci MAC dari file"""
+    with open(path, 'rb') as f:
+        key = f.read()
+    if not key:
+        raise ValueError(f"File kunci kosong: {path}")
+    return key
+
+
+def parallel_map(func, items: List, workers: int) -> Iterator:
+    """Jalankan func untuk setiap item (paralel jika workers > 1), urutan dipertahankan"""
+    if workers <= 1 or len(items) <= 1:
+        return map(func, items)
+    from concurrent.futures import ThreadPoolExecutor
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    def results():
+        with executor:
+            yield from executor.map(func, items)
+    return results()
+
+
+def _file_size(path: str) -> int:
+    return 0 if path == STDIN else os.path.getsize(path)
+
+
+def read_manifest(path: str) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    Baca manifest tag
+
+    Returns:
+        Tuple (algoritma atau None, dictionary path -> tag hex)
+
+    Raises:
+        ValueError: Jika ada baris tanpa pemisah '<tag>  <path>'
+    """
+    algorithm = None
+    tags = {}
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if line.startswith('# algorithm:'):
+                algorithm = line.split(':', 1)[1].strip()
+            elif line and not line.startswith('#'):
+                if '  ' not in line:
+                    raise ValueError(f"Baris {number} tidak valid "
+                                     "(format '<tag>  <path>')")
+                tag, file_path = line.split('  ', 1)
+                tags[file_path] = tag
+    return algorithm, tags
+
+
+def write_manifest(path: str, algorithm: str, tags: Dict[str, str]):
+    """Tulis manifest tag secara atomik"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"# algorithm: {algorithm}\n")
+        for file_path, tag in tags.items():
+            f.write(f"{tag}  {file_path}\n")
+    os.replace(tmp_path, path)
+
+
+def _report(command: str, results: List[dict], started: float) -> dict:
+    """Ringkasan hasil dalam bentuk dictionary yang dapat di-serialize"""
+    elapsed = time.perf_counter() - started
+    total = sum(result.get('bytes', 0) for result in results)
+    failures = [result for result in results if not result['ok']]
+    return {
+        'command': command,
+        'files': len(results),
+        'bytes': total,
+        'seconds': elapsed,
+        'throughput_mb_s': total / elapsed / 1e6 if elapsed else 0.0,
+        'failures': failures,
+        'results': results,
+    }
+
+
+def _emit(report: dict, as_json: bool):
+    """Cetak laporan sebagai JSON (stdout) atau ringkasan teks (stderr)"""
+    if as_json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+    for failure in report['failures']:
+        print(f"GAGAL {failure['path']}: {failure.get('error', 'tag tidak cocok')}",
+              file=sys.stderr)
+    print(f"{report['command']}: {report['files']} file, {report['bytes']:,} bytes, "
+          f"{report['seconds']:.2f} s ({report['throughput_mb_s']:.1f} MB/s), "
+          f"{len(report['failures'])} gagal", file=sys.stderr)
+
+
+def command_tag(args) -> int:
+    """Hitung MAC untuk semua input"""
+    from mac_implementation import MACImplementation
+
+    mac = MACImplementation(args.algorithm)
+    key = read_key(args.key_file)
+    paths = list(iter_inputs(args.paths or [STDIN], (SIDECAR_SUFFIX,)))
+    if args.manifest:
+        paths = [path for path in paths
+                 if path == STDIN or os.path.abspath(path) != os.path.abspath(args.manifest)]
+
+    def tag_one(path: str) -> dict:
+        try:
+            if path == STDIN:
+                stream = mac.new_stream(key)
+                size = 0
+                for chunk in _read_chunks(sys.stdin.buffer, args.chunk_size):
+                    stream.update(chunk)
+                    size += len(chunk)
+                return {'path': path, 'ok': True, 'tag': stream.hexdigest(), 'bytes': size}
+            tag = mac.compute_mac_file(path, key, args.chunk_size)
+            return {'path': path, 'ok': True, 'tag': tag, 'bytes': _file_size(path)}
+        except OSError as error:
+            return {'path': path, 'ok': False, 'error': str(error)}
+
+    started = time.perf_counter()
+    results = []
+    for result in parallel_map(tag_one, paths, args.workers):
+        results.append(result)
+        if not result['ok']:
+            continue
+        if args.sidecar and result['path'] != STDIN:
+            with open(result['path'] + SIDECAR_SUFFIX, 'w', encoding='utf-8') as f:
+                f.write(f"{result['tag']}  {os.path.basename(result['path'])}\n")
+        elif not args.manifest and not args.json:
+            print(f"{result['tag']}  {result['path']}")
+
+    if args.manifest:
+        write_manifest(args.manifest, mac.algorithm,
+                       {result['path']: result['tag'] for result in results if result['ok']})
+    _emit(_report('tag', results, started), args.json)
+    return 1 if any(not result['ok'] for result in results) else 0
+
+
+def command_verify(args) -> int:
+    """Verifikasi file terhadap manifest atau sidecar"""
+    from mac_implementation import MACImplementation
+
+    key = read_key(args.key_file)
+    algorithm = args.algorithm
+    if args.manifest:
+        try:
+            manifest_algorithm, expected = read_manifest(args.manifest)
+        except (OSError, ValueError) as error:
+            print(f"GAGAL {args.manifest}: {error}", file=sys.stderr)
+            return 2
+        algorithm = manifest_algorithm or algorithm
+        paths = list(expected) if not args.paths else list(iter_inputs(args.paths,
+                                                                       (SIDECAR_SUFFIX,)))
+    else:
+        expected = None
+        paths = list(iter_inputs(args.paths, (SIDECAR_SUFFIX,)))
+    mac = MACImplementation(algorithm)
+
+    def expected_tag(path: str) -> str:
+        if expected is not None:
+            if path not in expected:
+                raise KeyError("tidak ada di manifest")
+            return expected[path]
+        with open(path + SIDECAR_SUFFIX, encoding='utf-8') as f:
+            return f.read().split()[0]
+
+    def verify_one(path: str) -> dict:
+        try:
+            tag = expected_tag(path)
+            ok = mac.verify_mac_file(path, key, tag, args.chunk_size)
+            result = {'path': path, 'ok': ok, 'bytes': _file_size(path)}
+            if not ok:
+                result['error'] = 'tag tidak cocok'
+            return result
+        except (OSError, KeyError, IndexError, TypeError, ValueError) as error:
+            # TypeError/ValueError: tag rusak (mis. non-ASCII atau bukan hex)
+            return {'path': path, 'ok': False, 'error': str(error)}
+
+    started = time.perf_counter()
+    results = list(parallel_map(verify_one, paths, args.workers))
+    _emit(_report('verify', results, started), args.json)
+    return 1 if any(not result['ok'] for result in results) else 0
+
+
+def _output_path(path: str, root: Optional[str], out: str, suffix: str, strip: bool) -> str:
+    """Path output di direktori out dengan struktur relatif terhadap root"""
+    relative = os.path.relpath(path, root) if root else os.path.basename(path)
+    if strip and relative.endswith(suffix):
+        relative = relative[:-len(suffix)]
+    elif not strip:
+        relative += suffix
+    target = os.path.join(out, relative)
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    return target
+
+
+def _usac_jobs(paths: List[str], out: Optional[str], suffix: str,
+               strip: bool) -> List[Tuple[str, str]]:
+    """Pasangan (input, output) untuk usac-encode/usac-decode"""
+    if len(paths) == 1 and not os.path.isdir(paths[0]):
+        return [(paths[0], out or STDIN)]
+    if not out:
+        raise SystemExit("-o/--output DIR wajib untuk banyak file atau direktori")
+    jobs = []
+    for root in paths:
+        base = root if os.path.isdir(root) else None
+        for path in iter_inputs([root]):
+            jobs.append((path, _output_path(path, base, out, suffix, strip)))
+    return jobs
+
+
+def _read_chunks(source, chunk_size: int) -> Iterator[bytes]:
+    """Baca file biner per chunk"""
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _open_pair(path: str, output: str):
+    source = sys.stdin.buffer if path == STDIN else open(path, 'rb')
+    target = sys.stdout.buffer if output == STDIN else open(output, 'wb')
+    return source, target
+
+
+def _close_pair(source, target):
+    if source is not sys.stdin.buffer:
+        source.close()
+    if target is not sys.stdout.buffer:
+        target.close()
+
+
+def command_usac_encode(args) -> int:
+    """Encode file ke format USAC berbingkai"""
+    from pad_store import PadStore
+    from usac_implementation import USACImplementation
+
+    usac = USACImplementation(tag_bits=args.tag_bits)
+    jobs = _usac_jobs(args.paths or [STDIN], args.output, FRAMED_SUFFIX, False)
+    started = time.perf_counter()
+    results = []
+    # Region pad dicadangkan berurutan, sehingga file diproses satu per satu
+    with PadStore(args.pad, wipe=args.wipe) as pad:
+        for path, output in jobs:
+            source, target = _open_pair(path, output)
+            written = 0
+            try:
+                for frame in usac.encode_stream(_read_chunks(source, args.chunk_size), pad,
+                                                args.frame_size):
+                    target.write(frame)
+                    written += len(frame)
+                results.append({'path': path, 'output': output, 'ok': True,
+                                'bytes': written})
+            except (OSError, ValueError) as error:
+                results.append({'path': path, 'output': output, 'ok': False,
+                                'error': str(error)})
+            finally:
+                _close_pair(source, target)
+        remaining = pad.remaining()
+    report = _report('usac-encode', results, started)
+    report['pad_remaining'] = remaining
+    _emit(report, args.json)
+    return 1 if report['failures'] else 0
+
+
+def _finish_output(staging: str, output: str, ok: bool):
+    """Pindahkan file sementara ke output jika berhasil, hapus jika gagal"""
+    if staging == output:
+        return
+    if ok:
+        os.replace(staging, output)
+    elif os.path.exists(staging):
+        os.remove(staging)
+
+
+def _first_pad_offset(path: str) -> int:
+    """Offset pad awal stream, untuk mengurutkan file sesuai urutan encode"""
+    from usac_framing import STREAM_HEADER
+
+    with open(path, 'rb') as f:
+        header = f.read(STREAM_HEADER.size)
+    if len(header) < STREAM_HEADER.size:
+        return -1
+    return STREAM_HEADER.unpack(header)[4]
+
+
+def command_usac_decode(args) -> int:
+    """Verifikasi dan decode file berbingkai USAC"""
+    from pad_store import PadStore
+    from usac_framing import FrameAuthenticationError
+    from usac_implementation import USACImplementation
+
+    usac = USACImplementation(tag_bits=args.tag_bits)
+    jobs = _usac_jobs(args.paths or [STDIN], args.output, FRAMED_SUFFIX, True)
+    # PadStore penerima hanya maju, jadi file didekode sesuai urutan offset pad
+    jobs.sort(key=lambda job: -1 if job[0] == STDIN else _first_pad_offset(job[0]))
+    started = time.perf_counter()
+    results = []
+    with PadStore(args.pad, wipe=args.wipe) as pad:
+        for path, output in jobs:
+            # Output file ditulis ke file sementara dan baru dipindahkan setelah
+            # seluruh stream terverifikasi, sehingga decode gagal tidak
+            # meninggalkan output parsial (stdout tetap ditulis langsung)
+            staging = output if output == STDIN else output + '.tmp'
+            source, target = _open_pair(path, staging)
+            written = 0
+            error = None
+            try:
+                for plaintext in usac.decode_stream(_read_chunks(source, args.chunk_size),
+                                                    pad):
+                    target.write(plaintext)
+                    written += len(plaintext)
+            except (OSError, FrameAuthenticationError, ValueError) as exc:
+                error = exc
+            finally:
+                _close_pair(source, target)
+            try:
+                _finish_output(staging, output, error is None)
+            except OSError as exc:
+                error = error or exc
+            if error is None:
+                results.append({'path': path, 'output': output, 'ok': True,
+                                'bytes': written})
+            else:
+                results.append({'path': path, 'output': output, 'ok': False,
+                                'error': str(error)})
+    report = _report('usac-decode', results, started)
+    _emit(report, args.json)
+    return 1 if report['failures'] else 0
+
+
+def command_bench(args) -> int:
+    """Jalankan benchmark (lihat benchmark.py)"""
+    import benchmark
+
+    low, high = benchmark.parse_size(args.min_size), benchmark.parse_size(args.max_size)
+    sizes = [size for size in benchmark.DEFAULT_SIZES if low <= size <= high]
+    progress = None if args.json else benchmark.print_result
+    report = benchmark.run_suite(sizes, repeat=args.repeat, max_seconds=args.max_seconds,
+                                 targets=args.target, progress=progress)
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Parser argumen CLI"""
+    parser = argparse.ArgumentParser(description="Tag, verifikasi, dan encode file dengan MAC/USAC")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--json', action='store_true', help="Laporan JSON ke stdout")
+    common.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    common.add_argument('--chunk-size', type=int, default=1024 * 1024)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    tag = subparsers.add_parser('tag', parents=[common], help="Hitung MAC file")
+    tag.add_argument('paths', nargs='*', help="File, direktori, atau '-' (stdin)")
+    tag.add_argument('--key-file', required=True)
+    tag.add_argument('--algorithm', default='sha256')
+    output = tag.add_mutually_exclusive_group()
+    output.add_argument('--sidecar', action='store_true', help="Tulis <file>.mac")
+    output.add_argument('--manifest', help="Tulis semua tag ke satu file manifest")
+    tag.set_defaults(func=command_tag)
+
+    verify = subparsers.add_parser('verify', parents=[common], help="Verifikasi MAC file")
+    verify.add_argument('paths', nargs='*', help="Default: semua path di manifest")
+    verify.add_argument('--key-file', required=True)
+    verify.add_argument('--algorithm', default='sha256',
+                        help="Algoritma untuk sidecar (manifest mencatat algoritmanya)")
+    verify.add_argument('--manifest', help="Verifikasi terhadap manifest, bukan sidecar")
+    verify.set_defaults(func=command_verify)
+
+    for name, func, help_text in [('usac-encode', command_usac_encode, "Encode dengan USAC"),
+                                  ('usac-decode', command_usac_decode, "Decode USAC")]:
+        sub = subparsers.add_parser(name, parents=[common], help=help_text)
+        sub.add_argument('paths', nargs='*', help="File, direktori, atau '-' (stdin)")
+        sub.add_argument('--pad', required=True, help="File pad (PadStore)")
+        sub.add_argument('-o', '--output', help="File atau direktori output (default stdout)")
+        sub.add_argument('--wipe', action='store_true', help="Wipe region pad yang terpakai")
+        sub.add_argument('--tag-bits', type=int, default=DEFAULT_FRAMED_TAG_BITS,
+                         choices=[32, 64, 128],
+                         help=f"Lebar tag (default {DEFAULT_FRAMED_TAG_BITS}); "
+                              "usac-decode menolak stream dengan lebar lain")
+        if name == 'usac-encode':
+            sub.add_argument('--frame-size', type=int, default=64 * 1024)
+        sub.set_defaults(func=func)
+
+    bench = subparsers.add_parser('bench', help="Benchmark MAC/USAC")
+    bench.add_argument('--json', action='store_true')
+    bench.add_argument('--min-size', default='16')
+    bench.add_argument('--max-size', default='16M')
+    bench.add_argument('--repeat', type=int, default=10)
+    bench.add_argument('--max-seconds', type=float, default=5.0)
+    bench.add_argument('--target', action='append', help="Filter awalan nama target")
+    bench.set_defaults(func=command_bench)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
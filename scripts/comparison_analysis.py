@@ -1,6 +1,4 @@
 import time
-import matplotlib.pyplot as plt
-import numpy as np
 from mac_implementation import MACImplementation
 from usac_implementation import USACImplementation
 
@@ -20,37 +18,29 @@ class CryptographicComparison:
         print("=" * 60)
         
         
-        message_sizes = [10, 50, 100, 500, 1000, 5000]
-        mac_times = []
-        usac_times = []
+        from benchmark import run_suite
         
-        print("Pengujian Performa dengan Berbagai Ukuran Pesan:")
+        message_sizes = [16, 256, 4096, 65536]
+        print("Pengujian Performa dengan Berbagai Ukuran Pesan (median, warmup + 10 sampel):")
         print("-" * 50)
         
+        report = run_suite(message_sizes, warmup=2, repeat=10, max_seconds=2.0,
+                           targets=['mac-sha256', 'usac-encode-auto'])
+        medians = {(r['name'], r['size']): r for r in report['results']}
+        
+        ratios = []
         for size in message_sizes:
-            
-            test_message = "A" * size
-            
-            
-            mac_key = self.mac.generate_key()
-            start_time = time.time()
-            mac_tag = self.mac.compute_mac(test_message, mac_key)
-            mac_time = (time.time() - start_time) * 1000
-            mac_times.append(mac_time)
-            
-            
-            usac_key = self.usac.generate_one_time_key(size + 32)
-            start_time = time.time()
-            encoded_msg, auth_tag = self.usac.encode_message(test_message, usac_key)
-            usac_time = (time.time() - start_time) * 1000
-            usac_times.append(usac_time)
-            
-            print(f"Ukuran {size:>4} chars: MAC {mac_time:>8.4f}ms | USAC {usac_time:>8.4f}ms")
-        
-        
-        print(f"\nRata-rata waktu MAC: {np.mean(mac_times):.4f} ms")
-        print(f"Rata-rata waktu USAC: {np.mean(usac_times):.4f} ms")
-        print(f"USAC {np.mean(usac_times)/np.mean(mac_times):.2f}x lebih lambat dari MAC")
+            mac_result = medians[('mac-sha256', size)]
+            usac_result = medians[('usac-encode-auto', size)]
+            ratios.append(usac_result['median_ns'] / mac_result['median_ns'])
+            print(f"Ukuran {size:>6} B: MAC {mac_result['median_ns'] / 1e3:>10.2f} us "
+                  f"({mac_result['throughput_mb_s']:>8.1f} MB/s) | "
+                  f"USAC {usac_result['median_ns'] / 1e3:>10.2f} us "
+                  f"({usac_result['throughput_mb_s']:>8.1f} MB/s)")
+        
+        
+        print(f"\nRasio median USAC/MAC: {min(ratios):.2f}x - {max(ratios):.2f}x")
+        print("Benchmark lengkap (16 B - 256 MB, JSON/CSV, regresi): python benchmark.py run")
     
     def security_analysis(self):
         """Analisis keamanan MAC vs USAC"""
@@ -73,6 +63,16 @@ class CryptographicComparison:
         print("- Kerentanan: Tidak ada (secara teoritis)")
         print("- Kunci: Harus digunakan sekali (one-time)")
         print("- Efisiensi: Kurang efisien, memerlukan manajemen kunci kompleks")
+        
+        print("\nPELUANG PEMALSUAN TAG USAC (Monte Carlo, 95% CI):")
+        try:
+            from forgery_analysis import estimate, format_result
+            for scheme, attack, trials, tag_bits in [('legacy', 'random', 200_000, 8),
+                                                     ('legacy', 'pairflip', 200_000, 8),
+                                                     ('poly', 'random', 1_000_000, 16)]:
+                print("- " + format_result(estimate(scheme, attack, trials, tag_bits)))
+        except ImportError as e:
+            print(f"- Dilewati: {e}")
     
     def practical_applications(self):
         """Aplikasi praktis MAC vs USAC"""
@@ -106,26 +106,25 @@ class CryptographicComparison:
         
         
         print("1. SERANGAN TERHADAP MAC:")
-        mac_key = self.mac.generate_key()
-        mac_tag = self.mac.compute_mac(original_message, mac_key)
+        from attack_simulation import format_duration, simulate_bruteforce
         
         
-        print("   - Brute force attack simulation...")
-        attempts = 0
-        max_attempts = 1000000  
+        key_bits = 16
+        print(f"   - Brute force attack simulation (kunci target {key_bits} bit)...")
+        report = simulate_bruteforce(key_bits, original_message.encode('utf-8'),
+                                     self.mac.algorithm, max_seconds=10.0)
         
-        start_time = time.time()
-        for i in range(max_attempts):
-            fake_key = self.mac.generate_key()
-            fake_mac = self.mac.compute_mac(original_message, fake_key)
-            attempts += 1
-            if fake_mac == mac_tag:  
-                break
-        end_time = time.time()
-        
-        print(f"   - Attempts made: {attempts:,}")
-        print(f"   - Time taken: {end_time - start_time:.2f} seconds")
-        print("   - Result: MAC tetap aman (collision tidak ditemukan)")
+        print(f"   - Attempts made: {report['attempts']:,} dari {report['keyspace']:,}")
+        print(f"   - Time taken: {report['elapsed_seconds']:.2f} seconds "
+              f"({report['workers']} proses)")
+        print(f"   - Laju: {report['attempts_per_second']:,.0f} percobaan/detik "
+              f"({report['attempts_per_second_per_core']:,.0f} per core)")
+        print(f"   - Kunci {key_bits} bit: {'DITEMUKAN' if report['found'] else 'tidak ditemukan'}")
+        print("   - Proyeksi waktu rata-rata pemecahan dengan laju ini:")
+        for projection in report['projections']:
+            print(f"       {projection['key_bits']:>3} bit: "
+                  f"{format_duration(projection['expected_seconds'])}")
+        print(f"   - Result: MAC {self.mac.algorithm} dengan kunci 256 bit tetap aman")
         
         
         print("\n2. SERANGAN TERHADAP USAC:")
@@ -150,7 +149,3 @@ class CryptographicComparison:
         print("MAC: Praktis, efisien, cocok untuk sebagian besar aplikasi")
         print("USAC: Keamanan maksimal, cocok untuk aplikasi critical/high-security")
         print("Pilihan tergantung pada: threat model, resources, dan security requirements")
-
-
-comparison = CryptographicComparison()
-comparison.run_complete_analysis()
@@ -144,6 +144,3 @@ def educational_demonstration():
     print("   • Kunci: One-time pad, panjang ≥ pesan")
     print("   • Efisiensi: Kurang efisien, memerlukan manajemen kunci kompleks")
     print("   • Penggunaan: Aplikasi militer, komunikasi high-security")
-
-
-educational_demonstration()
@@ -0,0 +1,346 @@
+"""
+Analisis keamanan empiris: peluang pemalsuan tag USAC (Monte Carlo)
+
+Setiap percobaan memilih pesan dan one-time key acak, menghitung tag,
+lalu penyerang memodifikasi ciphertext (yang, karena one-time pad, sama
+dengan XOR delta pada plaintext) dan tetap memakai tag asli. Percobaan
+berhasil jika tag pesan termodifikasi sama dengan tag asli.
+
+Skema yang tersedia:
+- 'legacy'    : tag XOR fold 8 bit (skema lama), dihitung persis
+- 'poly'      : model tag polinomial dengan parameter yang diperkecil
+                (p = 2^31 - 1, blok 3 byte) agar dapat divektorisasi
+                dengan aritmetika uint64 NumPy; strukturnya sama dengan
+                tag sebenarnya: tag = (h + s) mod 2^w
+- 'reference' : tag sebenarnya dari usac_tag (p = 2^130 - 5), dipotong ke
+                w bit; tidak divektorisasi, dipakai untuk validasi model
+
+Serangan: 'random' (delta acak), 'bitflip' (satu bit), 'pairflip'
+(delta yang sama pada dua posisi), dan 'tag_guess' (pesan diubah, tag
+ditebak acak).
+
+Percobaan dibagi menjadi batch dengan seed turunan SeedSequence sehingga
+hasil dapat direproduksi dan tidak bergantung pada jumlah proses.
+Interval kepercayaan memakai skor Wilson.
+"""
+
+import math
+import os
+import sys
+import time
+from typing import List, Optional, Sequence
+
+DEFAULT_BATCH_SIZE = 1 << 16
+DEFAULT_MESSAGE_LENGTH = 32
+
+MODEL_PRIME = (1 << 31) - 1
+MODEL_BLOCK_SIZE = 3
+
+ATTACKS = ('random', 'bitflip', 'pairflip', 'tag_guess')
+
+
+def _load_numpy():
+    """Import NumPy (wajib untuk skema yang divektorisasi)"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Analisis pemalsuan memerlukan NumPy (pip install numpy)") from None
+    return numpy
+
+
+def _deltas(np, rng, trials: int, length: int, attack: str):
+    """Buat delta modifikasi (trials, length) yang tidak nol"""
+    delta = np.zeros((trials, length), dtype=np.uint8)
+    rows = np.arange(trials)
+    if attack == 'random' or attack == 'tag_guess':
+        delta[:] = rng.integers(0, 256, size=(trials, length), dtype=np.uint8)
+        zero = ~delta.any(axis=1)
+        delta[zero, 0] = 1
+    elif attack == 'bitflip':
+        positions = rng.integers(0, length, size=trials)
+        bits = rng.integers(0, 8, size=trials).astype(np.uint8)
+        delta[rows, positions] = np.left_shift(np.uint8(1), bits)
+    elif attack == 'pairflip':
+        if length < 2:
+            raise ValueError("pairflip memerlukan pesan minimal 2 byte")
+        first = rng.integers(0, length, size=trials)
+        second = (first + rng.integers(1, length, size=trials)) % length
+        values = rng.integers(1, 256, size=trials, dtype=np.uint8)
+        delta[rows, first] = values
+        delta[rows, second] = values
+    else:
+        raise ValueError(f"Serangan tidak dikenal: {attack}")
+    return delta
+
+
+def _legacy_successes(np, rng, trials: int, length: int, attack: str, tag_bits: int) -> int:
+    """Skema lama: tag = fold(m) ^ fold(k); pemalsuan berhasil jika fold(m') == fold(m)"""
+    messages = rng.integers(0, 256, size=(trials, length), dtype=np.uint8)
+    keys = rng.integers(0, 256, size=(trials, length), dtype=np.uint8)
+    forged = messages ^ _deltas(np, rng, trials, length, attack)
+    key_fold = np.bitwise_xor.reduce(keys, axis=1)
+    tags = np.bitwise_xor.reduce(messages, axis=1) ^ key_fold
+    forged_tags = np.bitwise_xor.reduce(forged, axis=1) ^ key_fold
+    if attack == 'tag_guess':
+        guesses = rng.integers(0, 256, size=trials, dtype=np.uint8)
+        return int(np.count_nonzero(guesses == forged_tags))
+    return int(np.count_nonzero(forged_tags == tags))
+
+
+def _model_hash(np, data, r):
+    """Hash polinomial model mod 2^31 - 1 atas blok 3 byte dengan bit penanda"""
+    trials, length = data.shape
+    acc = np.zeros(trials, dtype=np.uint64)
+    p = np.uint64(MODEL_PRIME)
+    for start in range(0, length, MODEL_BLOCK_SIZE):
+        block = data[:, start:start + MODEL_BLOCK_SIZE].astype(np.uint64)
+        value = np.full(trials, 1 << (8 * block.shape[1]), dtype=np.uint64)
+        for i in range(block.shape[1]):
+            value |= block[:, i] << np.uint64(8 * i)
+        acc = (acc + value) * r % p
+    return acc
+
+
+def _poly_successes(np, rng, trials: int, length: int, attack: str, tag_bits: int) -> int:
+    """Model tag polinomial: tag = (h(m) + s) mod 2^w"""
+    messages = rng.integers(0, 256, size=(trials, length), dtype=np.uint8)
+    forged = messages ^ _deltas(np, rng, trials, length, attack)
+    r = rng.integers(0, MODEL_PRIME, size=trials, dtype=np.uint64)
+    s = rng.integers(0, 1 << tag_bits, size=trials, dtype=np.uint64)
+    mask = np.uint64((1 << tag_bits) - 1)
+    tags = (_model_hash(np, messages, r) + s) & mask
+    forged_tags = (_model_hash(np, forged, r) + s) & mask
+    if attack == 'tag_guess':
+        guesses = rng.integers(0, 1 << tag_bits, size=trials, dtype=np.uint64)
+        return int(np.count_nonzero(guesses == forged_tags))
+    return int(np.count_nonzero(forged_tags == tags))
+
+
+def _reference_successes(np, rng, trials: int, length: int, attack: str,
+                         tag_bits: int) -> int:
+    """Tag polinomial sebenarnya (usac_tag.compute_tag), dipotong ke tag_bits"""
+    from usac_tag import compute_tag, tag_key_length
+
+    full_bits = 128 if tag_bits > 64 else 64
+    key_length = tag_key_length(full_bits)
+    mask = (1 << tag_bits) - 1
+    messages = rng.integers(0, 256, size=(trials, length), dtype=np.uint8)
+    forged = messages ^ _deltas(np, rng, trials, length, attack)
+    keys = rng.integers(0, 256, size=(trials, key_length), dtype=np.uint8)
+    # Tebakan diambil selebar tag penuh (64/128 bit) lalu dipotong dengan
+    # mask yang sama seperti tag, agar tag_bits > 63 tidak bias
+    guesses = rng.integers(0, 256, size=(trials, full_bits // 8), dtype=np.uint8)
+    successes = 0
+    for i in range(trials):
+        key = keys[i].tobytes()
+        forged_tag = int.from_bytes(compute_tag(forged[i].tobytes(), key, full_bits),
+                                    'little') & mask
+        if attack == 'tag_guess':
+            successes += forged_tag == int.from_bytes(guesses[i].tobytes(), 'little') & mask
+            continue
+        tag = int.from_bytes(compute_tag(messages[i].tobytes(), key, full_bits), 'little') & mask
+        successes += tag == forged_tag
+    return successes
+
+
+SCHEMES = {
+    'legacy': _legacy_successes,
+    'poly': _poly_successes,
+    'reference': _reference_successes,
+}
+
+
+def theoretical_probability(scheme: str, attack: str, tag_bits: int, length: int) -> float:
+    """
+    Peluang keberhasilan teoretis untuk pembanding
+
+    Args:
+        scheme: Nama skema
+        attack: Nama serangan
+        tag_bits: Lebar tag dalam bit
+        length: Panjang pesan dalam bytes
+
+    Returns:
+        Peluang (untuk skema polinomial: batas atas 2^-w + blok/p)
+    """
+    if attack == 'tag_guess':
+        return 2.0 ** -tag_bits
+    if scheme == 'legacy':
+        return {'random': 1 / 256, 'bitflip': 0.0, 'pairflip': 1.0}[attack]
+    if scheme == 'poly':
+        blocks = -(-length // MODEL_BLOCK_SIZE)
+        return min(1.0, 2.0 ** -tag_bits + blocks / MODEL_PRIME)
+    blocks = -(-length // 16)
+    return min(1.0, 2.0 ** -tag_bits + blocks / float((1 << 130) - 5))
+
+
+def wilson_interval(successes: int, trials: int, z: float = 1.96) -> tuple:
+    """
+    Interval kepercayaan skor Wilson untuk proporsi
+
+    Args:
+        successes: Jumlah keberhasilan
+        trials: Jumlah percobaan
+        z: Kuantil normal (1.96 = 95%)
+
+    Returns:
+        Tuple (batas_bawah, batas_atas)
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _run_batch(args) -> int:
+    """Worker: jalankan satu batch percobaan dengan seed turunan"""
+    scheme, attack, trials, length, tag_bits, seed = args
+    np = _load_numpy()
+    rng = np.random.default_rng(seed)
+    return SCHEMES[scheme](np, rng, trials, length, attack, tag_bits)
+
+
+def estimate(scheme: str = 'poly', attack: str = 'random', trials: int = 1_000_000,
+             tag_bits: int = 16, length: int = DEFAULT_MESSAGE_LENGTH,
+             seed: int = 0, workers: Optional[int] = 1,
+             batch_size: int = DEFAULT_BATCH_SIZE, confidence_z: float = 1.96) -> dict:
+    """
+    Estimasi peluang pemalsuan dengan Monte Carlo
+
+    Args:
+        scheme: 'legacy', 'poly' atau 'reference'
+        attack: 'random', 'bitflip', 'pairflip' atau 'tag_guess'
+        trials: Jumlah percobaan
+        tag_bits: Lebar tag yang dianalisis (legacy selalu 8)
+        length: Panjang pesan dalam bytes
+        seed: Seed utama (hasil sama untuk seed yang sama)
+        workers: Jumlah proses (None = os.cpu_count())
+        batch_size: Percobaan per batch
+        confidence_z: Kuantil normal untuk interval kepercayaan
+
+    Returns:
+        Dictionary hasil: successes, probability, ci_low, ci_high,
+        theoretical, trials_per_second
+    """
+    np = _load_numpy()
+    if scheme not in SCHEMES:
+        raise ValueError(f"Skema tidak dikenal: {scheme}")
+    if attack not in ATTACKS:
+        raise ValueError(f"Serangan tidak dikenal: {attack}")
+    if scheme == 'legacy':
+        tag_bits = 8
+    if scheme == 'poly' and not 1 <= tag_bits <= 31:
+        raise ValueError("Model polinomial mendukung tag 1-31 bit")
+
+    batches = [min(batch_size, trials - start) for start in range(0, trials, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    tasks = [(scheme, attack, count, length, tag_bits, child)
+             for count, child in zip(batches, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            successes = sum(executor.map(_run_batch, tasks))
+    else:
+        successes = sum(_run_batch(task) for task in tasks)
+    elapsed = time.perf_counter() - start
+
+    ci_low, ci_high = wilson_interval(successes, trials, confidence_z)
+    return {
+        'scheme': scheme,
+        'attack': attack,
+        'tag_bits': tag_bits,
+        'length': length,
+        'trials': trials,
+        'successes': successes,
+        'probability': successes / trials if trials else 0.0,
+        'ci_low': ci_low,
+        'ci_high': ci_high,
+        'theoretical': theoretical_probability(scheme, attack, tag_bits, length),
+        'seed': seed,
+        'seconds': elapsed,
+        'trials_per_second': trials / elapsed if elapsed else 0.0,
+    }
+
+
+def sweep(scheme: str = 'poly', attack: str = 'random',
+          tag_bits_list: Sequence[int] = (4, 8, 12, 16), **kwargs) -> List[dict]:
+    """Jalankan estimate untuk beberapa lebar tag"""
+    return [estimate(scheme, attack, tag_bits=bits, **kwargs) for bits in tag_bits_list]
+
+
+def plot_results(results: List[dict], path: str):
+    """
+    Plot peluang empiris (dengan interval kepercayaan) vs teoretis per lebar tag
+
+    Memerlukan matplotlib.
+
+    Args:
+        results: Hasil dari sweep()
+        path: File gambar tujuan
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise ImportError("Plot memerlukan matplotlib (pip install matplotlib)") from None
+
+    bits = [result['tag_bits'] for result in results]
+    probability = [result['probability'] for result in results]
+    errors = [[result['probability'] - result['ci_low'] for result in results],
+              [result['ci_high'] - result['probability'] for result in results]]
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    ax.errorbar(bits, probability, yerr=errors, fmt='o', capsize=4, label='Empiris (95% CI)')
+    ax.plot(bits, [result['theoretical'] for result in results], '--', label='Teoretis')
+    ax.set_yscale('log')
+    ax.set_xlabel('Lebar tag (bit)')
+    ax.set_ylabel('Peluang pemalsuan')
+    ax.set_title(f"{results[0]['scheme']} / {results[0]['attack']}")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def format_result(result: dict) -> str:
+    """Ringkasan satu hasil estimasi dalam satu baris"""
+    return (f"{result['scheme']:<9} {result['attack']:<9} w={result['tag_bits']:>3}  "
+            f"{result['successes']:>8}/{result['trials']:<9} "
+            f"p={result['probability']:.3e} "
+            f"[{result['ci_low']:.2e}, {result['ci_high']:.2e}] "
+            f"teori {result['theoretical']:.2e}  "
+            f"({result['trials_per_second'] / 1e6:.1f} M/s)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI analisis pemalsuan"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Monte Carlo peluang pemalsuan tag USAC")
+    parser.add_argument('--scheme', choices=sorted(SCHEMES), default='poly')
+    parser.add_argument('--attack', choices=ATTACKS, default='random')
+    parser.add_argument('--tag-bits', type=int, nargs='+', default=[16])
+    parser.add_argument('--trials', type=int, default=1_000_000)
+    parser.add_argument('--length', type=int, default=DEFAULT_MESSAGE_LENGTH)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--plot', help="Simpan plot ke file (memerlukan matplotlib)")
+    args = parser.parse_args(argv)
+
+    results = sweep(args.scheme, args.attack, args.tag_bits, trials=args.trials,
+                    length=args.length, seed=args.seed, workers=args.workers)
+    for result in results:
+        print(format_result(result))
+    if args.plot:
+        plot_results(results, args.plot)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""
+Instrumentasi operasi MAC dan USAC
+
+Instrumentasi bersifat opt-in. Selama enable() belum dipanggil, method
+MACImplementation dan USACImplementation tidak disentuh sama sekali,
+sehingga overhead saat nonaktif adalah nol. enable() membungkus method
+hot path (compute/verify/encode/decode/keygen, termasuk MACContext dan
+MACStream) dengan pencatat yang menyimpan jumlah panggilan, jumlah error,
+jumlah bytes, dan histogram latensi; disable() mengembalikan method asli.
+
+Histogram memakai bucket bergaya HDR (log-linear): setiap rentang pangkat
+dua dibagi menjadi SUB_BUCKETS bucket linear, sehingga galat relatif
+persentil dibatasi sekitar 1 / SUB_BUCKETS di semua skala latensi.
+
+Kode lain dapat diukur dengan context manager timer() atau decorator
+instrument(), dan hasilnya diambil dengan snapshot() atau
+export_prometheus().
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from buffer_utils import as_buffer
+
+# Sub-bucket linear per pangkat dua (galat relatif ~12.5%)
+SUB_BUCKET_BITS = 3
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Batas bucket yang diekspor ke format Prometheus (detik)
+PROMETHEUS_BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3,
+                      1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+
+def _payload_size(message) -> int:
+    """Ukuran pesan dalam bytes (0 jika tidak dapat ditentukan)"""
+    try:
+        return len(as_buffer(message))
+    except TypeError:
+        return 0
+
+
+def _batch_size(messages) -> int:
+    """Total ukuran pesan dalam satu batch"""
+    return sum(_payload_size(message) for message in messages)
+
+
+# (modul, kelas) -> {method: (nama operasi, nama parameter ukuran, fungsi ukuran)}
+# Parameter ukuran diambil menurut signature method, sehingga argumen
+# keyword dan nilai default ikut terhitung. Operasi bertingkat (misalnya
+# mac.compute yang memanggil mac.context.compute) dicatat di kedua nama.
+INSTRUMENTED_METHODS = {
+    ('mac_implementation', 'MACImplementation'): {
+        'generate_key': ('mac.keygen', 'length', int),
+        'compute_mac': ('mac.compute', 'message', _payload_size),
+        'compute_mac_tag': ('mac.compute_tag', 'message', _payload_size),
+        'verify_mac': ('mac.verify', 'message', _payload_size),
+        'compute_mac_batch': ('mac.compute_batch', 'messages', _batch_size),
+        'verify_mac_batch': ('mac.verify_batch', 'messages', _batch_size),
+        'compute_mac_file': ('mac.compute_file', None, None),
+    },
+    ('mac_implementation', 'MACContext'): {
+        'compute': ('mac.context.compute', 'message', _payload_size),
+        'verify': ('mac.context.verify', 'message', _payload_size),
+    },
+    ('mac_implementation', 'MACStream'): {
+        'update': ('mac.stream.update', 'chunk', _payload_size),
+        'finalize': ('mac.stream.finalize', None, None),
+        'verify': ('mac.stream.verify', None, None),
+    },
+    ('usac_implementation', 'USACImplementation'): {
+        'generate_one_time_key': ('usac.keygen', 'length', int),
+        'encode_message': ('usac.encode', 'message', _payload_size),
+        'decode_message': ('usac.decode', 'encoded_message', _payload_size),
+        'encode_message_bulk': ('usac.encode_bulk', 'message', _payload_size),
+        'decode_message_bulk': ('usac.decode_bulk', 'encoded_message', _payload_size),
+        'verify_authenticity': ('usac.verify', 'encoded_message', _payload_size),
+        'verify_authenticity_detailed': ('usac.verify_detailed', 'encoded_message',
+                                         _payload_size),
+    },
+}
+
+
+class LatencyHistogram:
+    """
+    Histogram latensi log-linear (gaya HDR) dalam nanodetik
+
+    Nilai v < SUB_BUCKETS disimpan di bucket v. Nilai lebih besar dengan
+    bit tertinggi e disimpan di bucket (e - SUB_BUCKET_BITS + 1) *
+    SUB_BUCKETS + sub, dengan sub = SUB_BUCKET_BITS bit di bawah bit
+    tertinggi.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.sum_ns = 0
+        self.min_ns: Optional[int] = None
+        self.max_ns = 0
+
+    @staticmethod
+    def bucket_index(value_ns: int) -> int:
+        """Indeks bucket untuk nilai dalam nanodetik"""
+        if value_ns < SUB_BUCKETS:
+            return max(value_ns, 0)
+        shift = value_ns.bit_length() - 1 - SUB_BUCKET_BITS
+        return (shift + 1) * SUB_BUCKETS + ((value_ns >> shift) - SUB_BUCKETS)
+
+    @staticmethod
+    def bucket_upper(index: int) -> int:
+        """Batas atas (inklusif) bucket dalam nanodetik"""
+        if index < SUB_BUCKETS:
+            return index
+        shift = index // SUB_BUCKETS - 1
+        sub = index % SUB_BUCKETS + SUB_BUCKETS
+        return ((sub + 1) << shift) - 1
+
+    def record(self, value_ns: int):
+        """Catat satu sampel latensi"""
+        index = self.bucket_index(value_ns)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_ns += value_ns
+        if self.min_ns is None or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Persentil latensi (batas atas bucket, dibatasi nilai maksimum)
+
+        Args:
+            fraction: Persentil dalam rentang 0..1 (0.99 = p99)
+
+        Returns:
+            Latensi dalam nanodetik (0 jika belum ada sampel)
+        """
+        if not self.total:
+            return 0
+        rank = max(1, int(fraction * self.total + 0.5))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_upper(index), self.max_ns)
+        return self.max_ns
+
+    def cumulative(self, bounds_ns: List[int]) -> List[int]:
+        """Jumlah sampel kumulatif dengan latensi <= setiap batas"""
+        result = []
+        ordered = sorted(self.counts.items())
+        for bound in bounds_ns:
+            result.append(sum(count for index, count in ordered
+                              if self.bucket_upper(index) <= bound))
+        return result
+
+
+class OperationStats:
+    """Statistik satu jenis operasi"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        """Ringkasan statistik dalam bentuk dictionary"""
+        latency = self.latency
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'bytes': self.bytes,
+            'latency_ns': {
+                'min': latency.min_ns or 0,
+                'mean': latency.sum_ns / latency.total if latency.total else 0.0,
+                'p50': latency.percentile(0.50),
+                'p90': latency.percentile(0.90),
+                'p99': latency.percentile(0.99),
+                'p999': latency.percentile(0.999),
+                'max': latency.max_ns,
+                'sum': latency.sum_ns,
+            },
+        }
+
+
+class MetricsRegistry:
+    """
+    Kumpulan statistik per operasi (thread-safe)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationStats] = {}
+        self._hooks: List[Callable[[str, int, int, bool], None]] = []
+
+    def record(self, operation: str, elapsed_ns: int, nbytes: int = 0,
+               error: bool = False):
+        """
+        Catat satu operasi
+
+        Args:
+            operation: Nama operasi (misalnya 'mac.compute')
+            elapsed_ns: Latensi dalam nanodetik
+            nbytes: Jumlah bytes yang diproses
+            error: True jika operasi berakhir dengan exception
+        """
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = OperationStats()
+            stats.count += 1
+            stats.errors += error
+            stats.bytes += nbytes
+            stats.latency.record(elapsed_ns)
+        for hook in self._hooks:
+            hook(operation, elapsed_ns, nbytes, error)
+
+    def add_hook(self, hook: Callable[[str, int, int, bool], None]):
+        """Daftarkan callback hook(operation, elapsed_ns, nbytes, error)"""
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, int, int, bool], None]):
+        """Hapus callback yang sudah didaftarkan"""
+        self._hooks.remove(hook)
+
+    @contextmanager
+    def timer(self, operation: str, nbytes: int = 0) -> Iterator[None]:
+        """
+        Context manager untuk mengukur satu blok kode
+
+        Args:
+            operation: Nama operasi
+            nbytes: Jumlah bytes yang diproses blok tersebut
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        except BaseException:
+            self.record(operation, time.perf_counter_ns() - start, nbytes, True)
+            raise
+        self.record(operation, time.perf_counter_ns() - start, nbytes)
+
+    def instrument(self, operation: str,
+                   size: Optional[Callable[..., int]] = None) -> Callable:
+        """
+        Decorator untuk mengukur setiap pemanggilan fungsi
+
+        Args:
+            operation: Nama operasi
+            size: Fungsi opsional yang menerima argumen pemanggilan dan
+                  mengembalikan jumlah bytes yang diproses
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                nbytes = size(*args, **kwargs) if size else 0
+                start = time.perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException:
+                    self.record(operation, time.perf_counter_ns() - start, nbytes, True)
+                    raise
+                self.record(operation, time.perf_counter_ns() - start, nbytes)
+                return result
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Salinan statistik semua operasi"""
+        with self._lock:
+            return {name: stats.to_dict()
+                    for name, stats in sorted(self._operations.items())}
+
+    def reset(self):
+        """Hapus semua statistik"""
+        with self._lock:
+            self._operations.clear()
+
+    def export_prometheus(self, prefix: str = 'crypto') -> str:
+        """
+        Ekspor statistik dalam format teks Prometheus
+
+        Args:
+            prefix: Awalan nama metrik
+
+        Returns:
+            Teks exposition format Prometheus
+        """
+        bounds_ns = [int(bound * 1e9) for bound in PROMETHEUS_BUCKETS]
+        with self._lock:
+            items = [(name, stats.count, stats.errors, stats.bytes,
+                      stats.latency.cumulative(bounds_ns), stats.latency.sum_ns)
+                     for name, stats in sorted(self._operations.items())]
+
+        lines = [
+            f"# HELP {prefix}_operations_total Jumlah operasi",
+            f"# TYPE {prefix}_operations_total counter",
+        ]
+        lines += [f'{prefix}_operations_total{{operation="{name}"}} {count}'
+                  for name, count, _, _, _, _ in items]
+        lines += [
+            f"# HELP {prefix}_errors_total Jumlah operasi yang gagal",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        lines += [f'{prefix}_errors_total{{operation="{name}"}} {errors}'
+                  for name, _, errors, _, _, _ in items]
+        lines += [
+            f"# HELP {prefix}_bytes_total Jumlah bytes yang diproses",
+            f"# TYPE {prefix}_bytes_total counter",
+        ]
+        lines += [f'{prefix}_bytes_total{{operation="{name}"}} {nbytes}'
+                  for name, _, _, nbytes, _, _ in items]
+        lines += [
+            f"# HELP {prefix}_latency_seconds Latensi operasi",
+            f"# TYPE {prefix}_latency_seconds histogram",
+        ]
+        for name, count, _, _, cumulative, sum_ns in items:
+            for bound, value in zip(PROMETHEUS_BUCKETS, cumulative):
+                lines.append(f'{prefix}_latency_seconds_bucket'
+                             f'{{operation="{name}",le="{bound:g}"}} {value}')
+            lines.append(f'{prefix}_latency_seconds_bucket'
+                         f'{{operation="{name}",le="+Inf"}} {count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{operation="{name}"}} {sum_ns / 1e9:.9f}')
+            lines.append(f'{prefix}_latency_seconds_count{{operation="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+# Registry default dan method asli yang sedang dibungkus
+registry = MetricsRegistry()
+_originals: Dict[tuple, Callable] = {}
+_patch_lock = threading.Lock()
+
+
+def _argument_getter(method: Callable, parameter: str) -> Callable[[tuple, dict], object]:
+    """
+    Pengambil satu argumen method menurut signature-nya
+
+    Posisi dan nilai default parameter dicari sekali dengan
+    inspect.signature, sehingga setiap panggilan cukup mengambil dari
+    args atau kwargs tanpa bind() penuh. Hasilnya sama dengan
+    signature.bind(self, *args, **kwargs) + apply_defaults().
+
+    Args:
+        method: Method yang dibungkus (parameter pertama adalah self)
+        parameter: Nama parameter yang diambil
+
+    Returns:
+        Fungsi get(args, kwargs) untuk args tanpa self
+    """
+    parameters = inspect.signature(method).parameters
+    position = list(parameters).index(parameter) - 1
+    default = parameters[parameter].default
+    if default is inspect.Parameter.empty:
+        default = None
+
+    def get(args: tuple, kwargs: dict):
+        if position < len(args):
+            return args[position]
+        return kwargs.get(parameter, default)
+    return get
+
+
+def _wrap_method(method: Callable, operation: str, parameter: Optional[str],
+                 size: Optional[Callable], target: MetricsRegistry) -> Callable:
+    """Bungkus method dengan pencatat metrik"""
+    record = target.record
+    perf_counter_ns = time.perf_counter_ns
+    argument = _argument_getter(method, parameter) if parameter else None
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        nbytes = 0
+        if argument is not None:
+            try:
+                nbytes = size(argument(args, kwargs))
+            except (TypeError, ValueError):
+                pass
+        start = perf_counter_ns()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            record(operation, perf_counter_ns() - start, nbytes, True)
+            raise
+        record(operation, perf_counter_ns() - start, nbytes)
+        return result
+    return wrapper
+
+
+def enable(target: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """
+    Aktifkan instrumentasi pada MACImplementation dan USACImplementation
+
+    Args:
+        target: Registry tujuan (default: registry modul)
+
+    Returns:
+        Registry yang dipakai
+    """
+    import importlib
+
+    target = target or registry
+    with _patch_lock:
+        if _originals:
+            _restore()
+        for (module_name, class_name), methods in INSTRUMENTED_METHODS.items():
+            cls = getattr(importlib.import_module(module_name), class_name)
+            for method_name, (operation, parameter, size) in methods.items():
+                original = cls.__dict__[method_name]
+                _originals[(cls, method_name)] = original
+                setattr(cls, method_name,
+                        _wrap_method(original, operation, parameter, size, target))
+    return target
+
+
+def _restore():
+    """Kembalikan semua method asli"""
+    for (cls, method_name), original in _originals.items():
+        setattr(cls, method_name, original)
+    _originals.clear()
+
+
+def disable():
+    """Nonaktifkan instrumentasi dan kembalikan method asli"""
+    with _patch_lock:
+        _restore()
+
+
+def is_enabled() -> bool:
+    """True jika instrumentasi sedang aktif"""
+    return bool(_originals)
+
+
+def timer(operation: str, nbytes: int = 0):
+    """Context manager timer() pada registry default"""
+    return registry.timer(operation, nbytes)
+
+
+def instrument(operation: str, size: Optional[Callable[..., int]] = None) -> Callable:
+    """Decorator instrument() pada registry default"""
+    return registry.instrument(operation, size)
+
+
+def snapshot() -> Dict[str, dict]:
+    """Snapshot registry default"""
+    return registry.snapshot()
+
+
+def export_prometheus(prefix: str = 'crypto') -> str:
+    """Ekspor registry default dalam format Prometheus"""
+    return registry.export_prometheus(prefix)
@@ -0,0 +1,350 @@
+"""
+Indeks integritas untuk verifikasi ulang objek yang tersimpan
+
+Setiap file dipecah menjadi chunk berukuran tetap. Tag MAC per chunk
+(terikat pada indeks chunk) dan tag objek (MAC atas ukuran dan semua tag
+chunk, seperti akar Merkle satu tingkat) disimpan di sqlite bersama ukuran
+dan mtime file.
+
+Scan verifikasi bersifat inkremental:
+- mode cepat: file dengan ukuran dan mtime yang sama dianggap tidak
+  berubah tanpa dibaca (hanya stat), sehingga scan ulang seluruh korpus
+  sebagian besar hanya I/O metadata;
+- mode penuh: semua chunk dibaca ulang dan dibandingkan per chunk untuk
+  mendeteksi kerusakan diam-diam (bit rot), dan chunk yang rusak dilaporkan.
+
+Pembacaan dan hashing chunk dijalankan di ThreadPoolExecutor (os.pread
+dan hashlib melepas GIL); hanya thread utama yang mengakses database.
+"""
+
+import argparse
+import os
+import sqlite3
+import struct
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from mac_implementation import MACImplementation
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# Jumlah chunk yang dibaca satu tugas worker
+CHUNKS_PER_TASK = 8
+DEFAULT_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+CHUNK_INDEX = struct.Struct('>Q')
+
+STATUS_OK = 'ok'
+STATUS_UNCHANGED = 'unchanged'
+STATUS_NEW = 'new'
+STATUS_MODIFIED = 'modified'
+STATUS_CORRUPT = 'corrupt'
+STATUS_MISSING = 'missing'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    chunk_size INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    chunk_tags BLOB NOT NULL,
+    object_tag BLOB NOT NULL,
+    indexed_at REAL NOT NULL
+)
+"""
+
+
+def _read_at(fd: int, view: memoryview, offset: int) -> int:
+    """Baca ke buffer dari offset tanpa memindahkan posisi file"""
+    if hasattr(os, 'preadv'):
+        return os.preadv(fd, [view], offset)
+    data = os.pread(fd, len(view), offset)
+    view[:len(data)] = data
+    return len(data)
+
+
+class AlgorithmMismatchError(ValueError):
+    """Entri indeks dibuat dengan algoritma MAC yang berbeda"""
+
+
+class IntegrityIndex:
+    """
+    Indeks tag chunk dan tag objek di database sqlite
+    """
+
+    def __init__(self, db_path: str, key: bytes, algorithm: str = 'sha256',
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            db_path: Path database sqlite
+            key: Kunci MAC
+            algorithm: Algoritma MAC (lihat MACImplementation)
+            chunk_size: Ukuran chunk untuk file yang baru diindeks
+            workers: Jumlah thread pembaca
+        """
+        self.db_path = db_path
+        self.mac = MACImplementation(algorithm)
+        self.context = self.mac.bind(key)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.tag_size = len(self.context.compute(b'', True))
+        self._db = sqlite3.connect(db_path)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+
+    def __enter__(self) -> 'IntegrityIndex':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Tutup database"""
+        self._db.close()
+
+    def _chunk_tag(self, index: int, chunk) -> bytes:
+        """Tag chunk: MAC(indeks u64 || isi chunk)"""
+        return self.context.stream().update(CHUNK_INDEX.pack(index)).update(chunk).finalize()
+
+    def _object_tag(self, size: int, chunk_tags: bytes) -> bytes:
+        """Tag objek: MAC('root' || ukuran || tag chunk)"""
+        return self.context.compute(b'root' + CHUNK_INDEX.pack(size) + chunk_tags, True)
+
+    def _hash_range(self, path: str, first: int, count: int, chunk_size: int) -> List[bytes]:
+        """Baca dan hitung tag untuk chunk [first, first + count) dari file"""
+        tags = []
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            for index in range(first, first + count):
+                n = _read_at(fd, view, index * chunk_size)
+                tags.append(self._chunk_tag(index, view[:n]))
+        finally:
+            os.close(fd)
+        return tags
+
+    def _hash_files(self, jobs: List[tuple]) -> Dict[str, bytes]:
+        """
+        Hitung tag chunk untuk banyak file secara paralel
+
+        Args:
+            jobs: Daftar (path, ukuran, chunk_size)
+
+        Returns:
+            Dictionary path -> gabungan tag chunk
+        """
+        tasks = []
+        for path, size, chunk_size in jobs:
+            chunks = max(1, -(-size // chunk_size))
+            for first in range(0, chunks, CHUNKS_PER_TASK):
+                tasks.append((path, first, min(CHUNKS_PER_TASK, chunks - first), chunk_size))
+
+        def run(task):
+            return self._hash_range(*task)
+
+        if self.workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(run, tasks))
+        else:
+            results = [run(task) for task in tasks]
+
+        tags: Dict[str, List[bytes]] = {}
+        for (path, _, _, _), chunk_tags in zip(tasks, results):
+            tags.setdefault(path, []).extend(chunk_tags)
+        return {path: b''.join(chunk_tags) for path, chunk_tags in tags.items()}
+
+    def _store(self, path: str, stat: os.stat_result, chunk_size: int, chunk_tags: bytes):
+        """Simpan atau ganti entri indeks satu file"""
+        self._db.execute(
+            'INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (path, stat.st_size, stat.st_mtime_ns, chunk_size, self.mac.algorithm,
+             chunk_tags, self._object_tag(stat.st_size, chunk_tags), time.time()))
+
+    def entry(self, path: str) -> Optional[dict]:
+        """Entri indeks untuk path (None jika belum diindeks)"""
+        row = self._db.execute(
+            'SELECT size, mtime_ns, chunk_size, algorithm, chunk_tags, object_tag '
+            'FROM objects WHERE path = ?', (path,)).fetchone()
+        if row is None:
+            return None
+        keys = ('size', 'mtime_ns', 'chunk_size', 'algorithm', 'chunk_tags', 'object_tag')
+        return dict(zip(keys, row))
+
+    def add(self, paths: Iterable[str]) -> int:
+        """
+        Indeks (atau indeks ulang) file
+
+        Args:
+            paths: Daftar path file
+
+        Returns:
+            Jumlah file yang diindeks
+        """
+        stats = {}
+        for path in paths:
+            path = os.path.abspath(path)
+            stats[path] = os.stat(path)
+        hashed = self._hash_files([(path, stat.st_size, self.chunk_size)
+                                   for path, stat in stats.items()])
+        with self._db:
+            for path, stat in stats.items():
+                self._store(path, stat, self.chunk_size, hashed[path])
+        return len(stats)
+
+    def indexed_paths(self) -> List[str]:
+        """Semua path yang ada di indeks"""
+        return [row[0] for row in self._db.execute('SELECT path FROM objects ORDER BY path')]
+
+    def _changed_chunks(self, old_tags: bytes, new_tags: bytes) -> List[int]:
+        """Indeks chunk yang tag-nya berbeda"""
+        size = self.tag_size
+        count = max(len(old_tags), len(new_tags)) // size
+        return [index for index in range(count)
+                if old_tags[index * size:(index + 1) * size]
+                != new_tags[index * size:(index + 1) * size]]
+
+    def scan(self, paths: Optional[Iterable[str]] = None, full: bool = False,
+             update: bool = False) -> Iterator[dict]:
+        """
+        Verifikasi file terhadap indeks
+
+        Args:
+            paths: Path yang diperiksa (default semua path di indeks); path
+                   yang belum diindeks dilaporkan sebagai 'new'
+            full: True untuk membaca ulang semua chunk meskipun metadata sama
+            update: True untuk menyimpan tag baru file 'new' dan 'modified'
+
+        Yields:
+            Dictionary hasil per file: path, status, changed_chunks
+
+        Raises:
+            AlgorithmMismatchError: Jika entri indeks memakai algoritma lain
+                                    (sebelum ada file yang dibaca)
+        """
+        paths = [os.path.abspath(path) for path in paths] if paths is not None \
+            else self.indexed_paths()
+        entries = {}
+        results = {}
+        jobs = []
+        for path in paths:
+            entry = self.entry(path)
+            if entry is not None and entry['algorithm'] != self.mac.algorithm:
+                raise AlgorithmMismatchError(
+                    f"{path} diindeks dengan {entry['algorithm']}, "
+                    f"scan memakai {self.mac.algorithm}")
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                results[path] = {'path': path, 'status': STATUS_MISSING, 'changed_chunks': []}
+                continue
+            entries[path] = (entry, stat)
+            if entry is None:
+                jobs.append((path, stat.st_size, self.chunk_size))
+                continue
+            unchanged = entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+            if unchanged and not full:
+                results[path] = {'path': path, 'status': STATUS_UNCHANGED, 'changed_chunks': []}
+            else:
+                jobs.append((path, stat.st_size, entry['chunk_size']))
+
+        hashed = self._hash_files(jobs)
+        with self._db:
+            for path, size, chunk_size in jobs:
+                entry, stat = entries[path]
+                tags = hashed[path]
+                if entry is None:
+                    status, changed = STATUS_NEW, []
+                else:
+                    metadata_same = (entry['size'] == stat.st_size
+                                     and entry['mtime_ns'] == stat.st_mtime_ns)
+                    root_same = self.context.verify(
+                        b'root' + CHUNK_INDEX.pack(stat.st_size) + tags, entry['object_tag'])
+                    changed = [] if root_same else self._changed_chunks(entry['chunk_tags'], tags)
+                    if root_same:
+                        status = STATUS_OK
+                    else:
+                        status = STATUS_CORRUPT if metadata_same else STATUS_MODIFIED
+                if update and status in (STATUS_NEW, STATUS_MODIFIED):
+                    self._store(path, stat, chunk_size, tags)
+                results[path] = {'path': path, 'status': status, 'changed_chunks': changed}
+
+        for path in paths:
+            yield results[path]
+
+    def remove(self, path: str) -> bool:
+        """Hapus path dari indeks"""
+        with self._db:
+            cursor = self._db.execute('DELETE FROM objects WHERE path = ?',
+                                      (os.path.abspath(path),))
+        return cursor.rowcount > 0
+
+
+def walk_files(root: str) -> Iterator[str]:
+    """Semua file reguler di bawah root (atau root itu sendiri jika file)"""
+    if os.path.isfile(root):
+        yield root
+        return
+    for directory, _, files in os.walk(root):
+        for name in sorted(files):
+            yield os.path.join(directory, name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point CLI indeks integritas"""
+    parser = argparse.ArgumentParser(description="Indeks integritas berbasis MAC")
+    parser.add_argument('database', help="Path database sqlite")
+    parser.add_argument('--key-file', required=True, help="File berisi kunci MAC")
+    parser.add_argument('--algorithm', default='sha256')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add = subparsers.add_parser('add', help="Indeks file atau direktori")
+    add.add_argument('roots', nargs='+')
+    add.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    scan = subparsers.add_parser('scan', help="Verifikasi terhadap indeks")
+    scan.add_argument('roots', nargs='*', help="Default: semua path di indeks")
+    scan.add_argument('--full', action='store_true',
+                      help="Baca ulang semua chunk meskipun metadata sama")
+    scan.add_argument('--update', action='store_true',
+                      help="Simpan tag baru untuk file baru/berubah")
+
+    args = parser.parse_args(argv)
+    with open(args.key_file, 'rb') as f:
+        key = f.read()
+
+    chunk_size = getattr(args, 'chunk_size', DEFAULT_CHUNK_SIZE)
+    with IntegrityIndex(args.database, key, args.algorithm, chunk_size, args.workers) as index:
+        if args.command == 'add':
+            paths = [path for root in args.roots for path in walk_files(root)]
+            start = time.perf_counter()
+            count = index.add(paths)
+            print(f"{count} file diindeks dalam {time.perf_counter() - start:.2f} s")
+            return 0
+
+        paths = [path for root in args.roots for path in walk_files(root)] or None
+        counts: Dict[str, int] = {}
+        start = time.perf_counter()
+        try:
+            for result in index.scan(paths, args.full, args.update):
+                counts[result['status']] = counts.get(result['status'], 0) + 1
+                if result['status'] not in (STATUS_OK, STATUS_UNCHANGED):
+                    chunks = result['changed_chunks']
+                    detail = f" chunk {chunks}" if chunks else ""
+                    print(f"{result['status']:<10} {result['path']}{detail}")
+        except AlgorithmMismatchError as error:
+            print(f"Konfigurasi salah: {error} (gunakan --algorithm yang sama)",
+                  file=sys.stderr)
+            return 2
+        summary = ', '.join(f"{status} {count}" for status, count in sorted(counts.items()))
+        print(f"Scan selesai dalam {time.perf_counter() - start:.2f} s: {summary}")
+        bad = counts.get(STATUS_CORRUPT, 0) + counts.get(STATUS_MISSING, 0)
+        return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
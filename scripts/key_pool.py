@@ -0,0 +1,190 @@
+"""
+Key Pool - pra-generate materi one-time pad untuk USAC
+
+Thread latar belakang mengisi ring buffer terbatas dengan secrets.token_bytes
+sehingga pengambilan kunci pada jalur request tidak menunggu entropi OS.
+Setiap byte hanya diberikan satu kali: posisi baca selalu maju, dan region
+yang sudah diberikan langsung dinolkan di ring buffer.
+"""
+
+import secrets
+import threading
+import time
+from typing import Callable, Optional
+
+DEFAULT_CAPACITY = 4 * 1024 * 1024
+DEFAULT_REFILL_CHUNK = 64 * 1024
+
+
+class KeyPool:
+    """
+    Pool materi kunci one-time dengan pengisian ulang di latar belakang
+
+    Pengisian dimulai saat isi pool turun ke low_watermark dan berhenti
+    setelah mencapai high_watermark.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 low_watermark: Optional[int] = None,
+                 high_watermark: Optional[int] = None,
+                 refill_chunk: int = DEFAULT_REFILL_CHUNK,
+                 entropy: Callable[[int], bytes] = secrets.token_bytes,
+                 start: bool = True):
+        """
+        Args:
+            capacity: Ukuran ring buffer dalam bytes
+            low_watermark: Batas bawah yang memicu pengisian (default 25%)
+            high_watermark: Batas atas pengisian (default kapasitas penuh)
+            refill_chunk: Jumlah bytes yang di-generate per langkah pengisian
+            entropy: Sumber entropi, fungsi length -> bytes
+            start: Jalankan thread pengisi segera
+        """
+        self.capacity = capacity
+        self.low_watermark = capacity // 4 if low_watermark is None else low_watermark
+        self.high_watermark = capacity if high_watermark is None else high_watermark
+        if not 0 <= self.low_watermark < self.high_watermark <= capacity:
+            raise ValueError("Watermark harus memenuhi 0 <= low < high <= capacity")
+        self.refill_chunk = refill_chunk
+        self._entropy = entropy
+
+        self._ring = bytearray(capacity)
+        self._head = 0
+        self._count = 0
+        self._demand = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._needs_refill = threading.Condition(self._lock)
+
+        self.bytes_served = 0
+        self.bytes_generated = 0
+        self.refill_seconds = 0.0
+        self.stalls = 0
+        self.direct_draws = 0
+
+        self._thread = threading.Thread(target=self._refill_loop,
+                                        name="KeyPool-refill", daemon=True)
+        if start:
+            self._thread.start()
+
+    def __enter__(self) -> 'KeyPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _refill_loop(self):
+        """Thread latar belakang: isi ring buffer sampai high watermark"""
+        while True:
+            with self._lock:
+                while (not self._closed and self._count > self.low_watermark
+                       and self._count >= self._demand):
+                    self._needs_refill.wait()
+                if self._closed:
+                    return
+                target = self.high_watermark
+            while True:
+                with self._lock:
+                    missing = target - self._count
+                if self._closed or missing <= 0:
+                    break
+                size = min(self.refill_chunk, missing)
+                start = time.perf_counter()
+                material = self._entropy(size)
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    if self._closed:
+                        return
+                    self._write(material)
+                    self.bytes_generated += size
+                    self.refill_seconds += elapsed
+                    self._available.notify_all()
+
+    def _write(self, material: bytes):
+        """Tulis materi baru setelah region yang tersedia (dengan wrap)"""
+        tail = (self._head + self._count) % self.capacity
+        first = min(len(material), self.capacity - tail)
+        self._ring[tail:tail + first] = material[:first]
+        self._ring[:len(material) - first] = material[first:]
+        self._count += len(material)
+
+    def _read(self, length: int) -> bytes:
+        """Ambil dan nolkan region berikutnya (dengan wrap)"""
+        head = self._head
+        first = min(length, self.capacity - head)
+        rest = length - first
+        material = bytes(self._ring[head:head + first]) + bytes(self._ring[:rest])
+        self._ring[head:head + first] = bytes(first)
+        self._ring[:rest] = bytes(rest)
+        self._head = (head + length) % self.capacity
+        self._count -= length
+        return material
+
+    def take(self, length: int, timeout: Optional[float] = None) -> bytes:
+        """
+        Ambil materi kunci yang belum pernah diberikan
+
+        Jika pool kosong, permintaan menunggu pengisian sampai timeout lalu
+        jatuh kembali ke secrets.token_bytes langsung. Permintaan yang lebih
+        besar dari kapasitas selalu di-generate langsung.
+
+        Args:
+            length: Jumlah bytes yang dibutuhkan
+            timeout: Waktu tunggu maksimum dalam detik (None = tunggu terus,
+                     0 = tidak pernah menunggu)
+
+        Returns:
+            Materi kunci dalam bentuk bytes
+        """
+        if length > self.high_watermark:
+            with self._lock:
+                self.direct_draws += 1
+            return self._entropy(length)
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("KeyPool sudah ditutup")
+            if self._count < length:
+                self.stalls += 1
+                self._demand += length
+                self._needs_refill.notify()
+                ready = self._available.wait_for(
+                    lambda: self._closed or self._count >= length, timeout)
+                self._demand -= length
+                if self._closed:
+                    raise ValueError("KeyPool sudah ditutup")
+                if not ready:
+                    self.direct_draws += 1
+                    return self._entropy(length)
+            material = self._read(length)
+            self.bytes_served += length
+            if self._count <= self.low_watermark:
+                self._needs_refill.notify()
+            return material
+
+    def metrics(self) -> dict:
+        """Metrik pool: kedalaman, laju pengisian, stall"""
+        with self._lock:
+            rate = self.bytes_generated / self.refill_seconds if self.refill_seconds else 0.0
+            return {
+                'depth': self._count,
+                'capacity': self.capacity,
+                'low_watermark': self.low_watermark,
+                'high_watermark': self.high_watermark,
+                'bytes_served': self.bytes_served,
+                'bytes_generated': self.bytes_generated,
+                'refill_rate_bytes_per_sec': rate,
+                'stalls': self.stalls,
+                'direct_draws': self.direct_draws,
+            }
+
+    def close(self):
+        """Hentikan thread pengisi dan nolkan sisa materi di ring buffer"""
+        with self._lock:
+            self._closed = True
+            self._ring[:] = bytes(self.capacity)
+            self._count = 0
+            self._needs_refill.notify_all()
+            self._available.notify_all()
+        if self._thread.is_alive():
+            self._thread.join()
@@ -0,0 +1,255 @@
+"""
+Key ring MAC multi-tenant dengan rotasi berversi
+
+Setiap tenant memiliki key ID pendek (maksimum 255 bytes UTF-8) dan satu
+atau lebih versi kunci. Tag baru selalu dibuat dengan versi terbaru;
+verifikasi menerima versi terbaru dan `retain` versi sebelumnya. State
+HMAC (MACContext) setiap versi dihitung sekali saat kunci ditambahkan.
+
+Tag diberi prefix key ID dan versi, sehingga verifikasi langsung mencari
+konteks yang tepat dengan dua lookup dictionary O(1), tanpa mencoba kunci
+satu per satu berapa pun jumlah tenant:
+
+    tag = panjang_key_id u8 | key_id | versi u32 | digest MAC
+
+Prefix ikut di-MAC (digest = MAC(K, prefix || pesan)), sehingga tag tidak
+dapat dipindahkan ke key ID atau versi lain.
+"""
+
+import hmac
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from buffer_utils import MessageInput, as_buffer
+from mac_implementation import MACContext, MACImplementation
+
+DEFAULT_RETAIN = 1
+MAX_KEY_ID_LENGTH = 255
+VERSION = struct.Struct('!I')
+
+
+def _encode_key_id(key_id: Union[str, bytes]) -> bytes:
+    """Key ID dalam bentuk bytes yang dipakai di prefix tag dan indeks"""
+    encoded = key_id.encode('utf-8') if isinstance(key_id, str) else bytes(key_id)
+    if not 0 < len(encoded) <= MAX_KEY_ID_LENGTH:
+        raise ValueError(f"Key ID harus 1..{MAX_KEY_ID_LENGTH} bytes")
+    return encoded
+
+
+def tag_prefix(key_id: Union[str, bytes], version: int) -> bytes:
+    """Prefix tag: panjang_key_id u8 | key_id | versi u32"""
+    encoded = _encode_key_id(key_id)
+    return bytes([len(encoded)]) + encoded + VERSION.pack(version)
+
+
+def parse_tag(tag: Union[str, bytes]) -> Tuple[bytes, int, bytes]:
+    """
+    Pisahkan tag berprefix menjadi (key_id, versi, digest)
+
+    Args:
+        tag: Tag berprefix (bytes atau hex)
+
+    Returns:
+        Tuple (key_id bytes, versi, digest)
+
+    Raises:
+        ValueError: Jika tag terpotong atau hex tidak valid
+    """
+    data = bytes.fromhex(tag) if isinstance(tag, str) else as_buffer(tag)
+    if not data:
+        raise ValueError("Tag kosong")
+    end = 1 + data[0]
+    if len(data) < end + VERSION.size:
+        raise ValueError("Tag terpotong")
+    (version,) = VERSION.unpack_from(data, end)
+    return bytes(data[1:end]), version, bytes(data[end + VERSION.size:])
+
+
+class _Tenant:
+    """Semua versi kunci satu key ID"""
+
+    __slots__ = ('current', 'contexts', 'prefixes')
+
+    def __init__(self):
+        self.current = 0
+        self.contexts: Dict[int, MACContext] = {}
+        self.prefixes: Dict[int, bytes] = {}
+
+
+class KeyRing:
+    """
+    Kumpulan kunci MAC per key ID dengan rotasi dan verifikasi O(1)
+    """
+
+    def __init__(self, algorithm: str = 'sha256', retain: int = DEFAULT_RETAIN,
+                 tag_bits: Optional[int] = None):
+        """
+        Args:
+            algorithm: Algoritma MAC (lihat MACImplementation)
+            retain: Jumlah versi sebelumnya yang masih diterima saat verifikasi
+            tag_bits: Panjang digest dalam bit (None = digest penuh)
+        """
+        if retain < 0:
+            raise ValueError("retain tidak boleh negatif")
+        # Konteks disimpan di key ring, bukan di cache LRU MACImplementation
+        self.mac = MACImplementation(algorithm, cache_size=0, tag_bits=tag_bits)
+        self.algorithm = self.mac.algorithm
+        self.retain = retain
+        self._tenants: Dict[bytes, _Tenant] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, key_id: Union[str, bytes]) -> bool:
+        return _encode_key_id(key_id) in self._tenants
+
+    def key_ids(self) -> Iterator[str]:
+        """Semua key ID yang terdaftar"""
+        return (key_id.decode('utf-8', 'replace') for key_id in list(self._tenants))
+
+    def add_key(self, key_id: Union[str, bytes], key: bytes,
+                version: Optional[int] = None) -> int:
+        """
+        Tambahkan kunci sebagai versi terbaru key ID
+
+        Hanya `retain` + 1 versi terbaru (menurut urutan nomor) yang disimpan.
+
+        Args:
+            key_id: Key ID tenant
+            key: Kunci rahasia
+            version: Nomor versi (default versi terbaru + 1); harus naik
+
+        Returns:
+            Nomor versi kunci
+        """
+        encoded = _encode_key_id(key_id)
+        context = self.mac.bind(key)
+        with self._lock:
+            tenant = self._tenants.get(encoded)
+            if tenant is None:
+                tenant = _Tenant()
+            if version is None:
+                version = tenant.current + 1
+            if version <= tenant.current or not version < 1 << 32:
+                raise ValueError(f"Versi {version} harus lebih besar dari {tenant.current}")
+            tenant.contexts[version] = context
+            tenant.prefixes[version] = tag_prefix(encoded, version)
+            tenant.current = version
+            # Simpan retain + 1 versi terbaru berdasarkan urutan, bukan selisih
+            # nomor, sehingga versi yang melompat tidak membuang kunci sebelumnya
+            for old in sorted(tenant.contexts)[:-(self.retain + 1)]:
+                del tenant.contexts[old]
+                del tenant.prefixes[old]
+            self._tenants[encoded] = tenant
+        return version
+
+    def rotate(self, key_id: Union[str, bytes], key: Optional[bytes] = None) -> Tuple[int, bytes]:
+        """
+        Rotasi kunci key ID ke versi baru
+
+        Args:
+            key_id: Key ID tenant
+            key: Kunci baru (default dibuat acak)
+
+        Returns:
+            Tuple (versi baru, kunci baru)
+        """
+        if key is None:
+            key = self.mac.generate_key()
+        return self.add_key(key_id, key), key
+
+    def revoke(self, key_id: Union[str, bytes], version: Optional[int] = None) -> bool:
+        """
+        Cabut satu versi kunci, atau seluruh key ID jika version None
+
+        Returns:
+            True jika ada yang dicabut
+        """
+        encoded = _encode_key_id(key_id)
+        with self._lock:
+            if version is None:
+                return self._tenants.pop(encoded, None) is not None
+            tenant = self._tenants.get(encoded)
+            if tenant is None or version not in tenant.contexts:
+                return False
+            del tenant.contexts[version]
+            del tenant.prefixes[version]
+            return True
+
+    def versions(self, key_id: Union[str, bytes]) -> List[int]:
+        """Versi yang masih diterima untuk key ID, terlama lebih dulu"""
+        tenant = self._tenants.get(_encode_key_id(key_id))
+        return sorted(tenant.contexts) if tenant else []
+
+    def current_version(self, key_id: Union[str, bytes]) -> int:
+        """Versi yang dipakai untuk tag baru"""
+        tenant = self._tenants.get(_encode_key_id(key_id))
+        if tenant is None or tenant.current not in tenant.contexts:
+            raise KeyError(f"Tidak ada kunci aktif untuk {key_id!r}")
+        return tenant.current
+
+    def compute_mac(self, key_id: Union[str, bytes], message: MessageInput,
+                    raw: bool = False) -> Union[str, bytes]:
+        """
+        Menghitung tag berprefix key ID dengan versi kunci terbaru
+
+        Args:
+            key_id: Key ID tenant
+            message: Pesan yang akan di-MAC (str atau objek buffer)
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+
+        Returns:
+            Tag berprefix dalam format hexadecimal (atau bytes jika raw=True)
+
+        Raises:
+            KeyError: Jika key ID tidak memiliki kunci aktif
+        """
+        encoded = _encode_key_id(key_id)
+        tenant = self._tenants.get(encoded)
+        if tenant is None or tenant.current not in tenant.contexts:
+            raise KeyError(f"Tidak ada kunci aktif untuk {key_id!r}")
+        version = tenant.current
+        prefix = tenant.prefixes[version]
+        stream = tenant.contexts[version].stream()
+        tag = prefix + stream.update(prefix).update(as_buffer(message)).finalize()
+        return tag if raw else tag.hex()
+
+    def verify_mac(self, message: MessageInput, tag: Union[str, bytes]) -> bool:
+        """
+        Verifikasi tag berprefix dengan lookup key ID dan versi O(1)
+
+        Tag dengan key ID tidak dikenal, versi yang sudah dirotasi keluar
+        atau dicabut, atau format tidak valid ditolak.
+
+        Args:
+            message: Pesan asli (str atau objek buffer)
+            tag: Tag berprefix (bytes atau hex)
+
+        Returns:
+            True jika tag valid, False jika tidak
+        """
+        try:
+            key_id, version, digest = parse_tag(tag)
+        except ValueError:
+            return False
+        tenant = self._tenants.get(key_id)
+        if tenant is None:
+            return False
+        context = tenant.contexts.get(version)
+        prefix = tenant.prefixes.get(version)
+        if context is None or prefix is None:
+            return False
+        expected = context.stream().update(prefix).update(as_buffer(message)).finalize()
+        return hmac.compare_digest(expected, digest)
+
+    def stats(self) -> dict:
+        """Jumlah key ID dan jumlah versi kunci yang aktif"""
+        with self._lock:
+            return {
+                'key_ids': len(self._tenants),
+                'keys': sum(len(tenant.contexts) for tenant in self._tenants.values()),
+                'retain': self.retain,
+                'algorithm': self.algorithm,
+            }
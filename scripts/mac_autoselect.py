@@ -0,0 +1,160 @@
+"""
+Pemilihan algoritma MAC otomatis (algorithm='auto')
+
+Semua algoritma yang memenuhi tingkat keamanan yang diminta diukur sekali
+dengan micro-benchmark singkat, dan hasilnya disimpan di disk sehingga
+proses berikutnya tidak perlu mengukur ulang. Cache diindeks dengan versi
+Python, versi OpenSSL, dan arsitektur mesin; jika salah satunya berubah,
+pengukuran diulang.
+
+Lokasi cache: $MAC_AUTOSELECT_CACHE, atau
+$XDG_CACHE_HOME/cryptography-mac/autoselect.json (default ~/.cache).
+"""
+
+import json
+import os
+import platform
+import ssl
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Ukuran pesan representatif dan durasi pengukuran per algoritma
+BENCH_MESSAGE_SIZE = 16 * 1024
+BENCH_SECONDS = 0.05
+
+CACHE_ENV = 'MAC_AUTOSELECT_CACHE'
+
+_selected: Dict[tuple, str] = {}
+
+
+def cache_path() -> str:
+    """Path file cache hasil micro-benchmark"""
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'cryptography-mac', 'autoselect.json')
+
+
+def environment_id() -> str:
+    """Identitas environment yang mempengaruhi kecepatan hashlib"""
+    return '|'.join([sys.version.split()[0], ssl.OPENSSL_VERSION,
+                     platform.machine(), platform.system()])
+
+
+def benchmark_algorithms(algorithms: Sequence[str],
+                         message_size: int = BENCH_MESSAGE_SIZE,
+                         seconds: float = BENCH_SECONDS) -> Dict[str, float]:
+    """
+    Ukur throughput compute_mac setiap algoritma
+
+    Args:
+        algorithms: Daftar algoritma yang diukur
+        message_size: Ukuran pesan dalam bytes
+        seconds: Durasi pengukuran per algoritma
+
+    Returns:
+        Dictionary algoritma -> throughput dalam MB/s
+    """
+    from mac_implementation import MACImplementation
+
+    message = os.urandom(message_size)
+    key = os.urandom(32)
+    results = {}
+    for algorithm in algorithms:
+        context = MACImplementation(algorithm).bind(key)
+        context.compute(message, True)
+        count = 0
+        start = time.perf_counter()
+        deadline = start + seconds
+        while True:
+            for _ in range(16):
+                context.compute(message, True)
+            count += 16
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+        results[algorithm] = count * message_size / (now - start) / 1e6
+    return results
+
+
+def _load_cache(path: str) -> Optional[Dict[str, float]]:
+    """Baca hasil micro-benchmark dari cache jika environment sama"""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('environment') != environment_id():
+        return None
+    return data.get('throughput_mb_s')
+
+
+def _store_cache(path: str, throughput: Dict[str, float]):
+    """Simpan hasil micro-benchmark secara atomik (gagal tulis diabaikan)"""
+    data = {'environment': environment_id(), 'message_size': BENCH_MESSAGE_SIZE,
+            'throughput_mb_s': throughput}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def load_throughput(algorithms: Sequence[str], refresh: bool = False) -> Dict[str, float]:
+    """
+    Throughput per algoritma dari cache, diukur ulang jika belum lengkap
+
+    Args:
+        algorithms: Algoritma yang dibutuhkan
+        refresh: True untuk mengabaikan cache
+
+    Returns:
+        Dictionary algoritma -> throughput dalam MB/s
+    """
+    path = cache_path()
+    cached = None if refresh else _load_cache(path)
+    if cached is not None and all(algorithm in cached for algorithm in algorithms):
+        return cached
+    throughput = dict(cached or {})
+    missing = [algorithm for algorithm in algorithms if algorithm not in throughput]
+    throughput.update(benchmark_algorithms(missing))
+    _store_cache(path, throughput)
+    return throughput
+
+
+def candidates(security_bits: int, algorithms: Sequence[str]) -> List[str]:
+    """Algoritma yang memenuhi tingkat keamanan minimum"""
+    from mac_implementation import ALGORITHM_SECURITY_BITS
+
+    return [algorithm for algorithm in algorithms
+            if ALGORITHM_SECURITY_BITS.get(algorithm, 0) >= security_bits]
+
+
+def select_algorithm(security_bits: int, algorithms: Sequence[str],
+                     refresh: bool = False) -> str:
+    """
+    Pilih algoritma tercepat yang memenuhi tingkat keamanan
+
+    Args:
+        security_bits: Tingkat keamanan minimum dalam bit
+        algorithms: Algoritma yang didukung
+        refresh: True untuk mengukur ulang meskipun ada cache
+
+    Returns:
+        Nama algoritma terpilih
+    """
+    eligible = candidates(security_bits, algorithms)
+    if not eligible:
+        raise ValueError(f"Tidak ada algoritma dengan keamanan >= {security_bits} bit")
+    memo_key = (security_bits, tuple(eligible))
+    if not refresh and memo_key in _selected:
+        return _selected[memo_key]
+    throughput = load_throughput(eligible, refresh)
+    choice = max(eligible, key=lambda algorithm: throughput.get(algorithm, 0.0))
+    _selected[memo_key] = choice
+    return choice
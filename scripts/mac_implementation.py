@@ -1,8 +1,275 @@
 import hashlib
 import hmac
 import secrets
+import threading
 import time
-from typing import Tuple, Optional
+from collections import OrderedDict
+from typing import BinaryIO, Iterable, List, Sequence, Tuple, Optional, Union
+
+from buffer_utils import MessageInput, as_buffer
+from tag_types import MacTag, TagArray, algorithm_id
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# hashlib melepas GIL untuk buffer di atas ~2 KB, sehingga batch dengan
+# pesan sebesar ini (dan total yang cukup besar) layak dibagi ke thread
+PARALLEL_MIN_MESSAGE_SIZE = 2048
+PARALLEL_MIN_BATCH_BYTES = 1024 * 1024
+
+DEFAULT_CONTEXT_CACHE_SIZE = 128
+
+# Algoritma berbasis HMAC (RFC 2104)
+HMAC_ALGORITHMS = ('sha256', 'sha1', 'md5', 'sha512')
+# BLAKE2 dengan mode keyed native (tanpa hash ganda HMAC)
+BLAKE2_ALGORITHMS = ('blake2b', 'blake2s')
+# SHA-3 dengan prefix kunci bergaya KMAC (SHA-3 tahan length extension)
+SHA3_ALGORITHMS = ('sha3_256', 'sha3_512')
+
+# Tingkat keamanan (bit) yang dideklarasikan per algoritma, dipakai oleh
+# algorithm='auto'. HMAC-MD5 dan HMAC-SHA1 diberi nilai konservatif.
+ALGORITHM_SECURITY_BITS = {
+    'md5': 64,
+    'sha1': 80,
+    'sha256': 128,
+    'sha512': 256,
+    'blake2s': 128,
+    'blake2b': 256,
+    'sha3_256': 128,
+    'sha3_512': 256,
+}
+
+# Tag yang dipotong tidak boleh lebih pendek dari ini
+MIN_TAG_BITS = 64
+
+
+def _compare_tag(digest: bytes, received_mac: Union[str, bytes, MacTag]) -> bool:
+    """Bandingkan tag secara constant-time dalam format yang sama"""
+    if isinstance(received_mac, MacTag):
+        received_mac = received_mac.digest
+    elif isinstance(received_mac, str):
+        return hmac.compare_digest(digest.hex(), received_mac)
+    return hmac.compare_digest(digest, received_mac)
+
+
+def _finish(inner, outer, tag_length: Optional[int] = None) -> bytes:
+    """
+    Selesaikan MAC
+    
+    Untuk HMAC: H(K ^ opad || H(K ^ ipad || m)). Algoritma keyed native
+    (outer None) cukup mengambil digest state. Tag dipotong ke tag_length
+    bytes jika diberikan.
+    """
+    if outer is None:
+        return inner.digest()[:tag_length]
+    outer = outer.copy()
+    outer.update(inner.digest())
+    return outer.digest()[:tag_length]
+
+
+def _encode_length(value: int) -> bytes:
+    """left_encode dari NIST SP 800-185"""
+    encoded = value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+    return bytes([len(encoded)]) + encoded
+
+
+def _kmac_prefix(key: bytes, rate: int) -> bytes:
+    """bytepad(encode_string(K), rate) seperti pada KMAC (SP 800-185)"""
+    prefix = _encode_length(rate) + _encode_length(len(key) * 8) + key
+    return prefix + bytes(-len(prefix) % rate)
+
+
+class MACStream:
+    """
+    Konteks MAC inkremental untuk input besar atau tidak terbatas
+    
+    Pesan diberikan sedikit demi sedikit melalui update(), lalu tag
+    diambil dengan finalize() (bytes) atau hexdigest() (hex).
+    """
+    
+    def __init__(self, inner, outer, tag_length: Optional[int] = None):
+        self._inner = inner
+        self._outer = outer
+        self._tag_length = tag_length
+        self.bytes_processed = 0
+    
+    def update(self, chunk) -> 'MACStream':
+        """
+        Tambahkan potongan pesan ke perhitungan MAC
+        
+        Args:
+            chunk: Potongan pesan (bytes, bytearray, memoryview)
+            
+        Returns:
+            Konteks ini sendiri agar dapat dirangkai
+        """
+        self._inner.update(chunk)
+        self.bytes_processed += len(chunk)
+        return self
+    
+    def finalize(self) -> bytes:
+        """Kembalikan MAC dalam bentuk bytes"""
+        return _finish(self._inner, self._outer, self._tag_length)
+    
+    def hexdigest(self) -> str:
+        """Kembalikan MAC dalam format hexadecimal"""
+        return self.finalize().hex()
+    
+    def verify(self, received_mac: Union[str, bytes, MacTag]) -> bool:
+        """
+        Bandingkan MAC saat ini dengan MAC yang diterima
+        
+        Args:
+            received_mac: MAC yang diterima (hex str atau bytes)
+            
+        Returns:
+            True jika MAC valid, False jika tidak
+        """
+        return _compare_tag(self.finalize(), received_mac)
+
+
+class MACContext:
+    """
+    Konteks MAC yang sudah terikat pada satu kunci
+    
+    State hash inner (K ^ ipad) dan outer (K ^ opad) dihitung sekali saat
+    dibuat, lalu di-copy() untuk setiap pesan sehingga tidak ada setup
+    kunci berulang. Untuk algoritma keyed native, outer adalah None.
+    """
+    
+    def __init__(self, inner, outer, fingerprint: bytes,
+                 tag_length: Optional[int] = None):
+        self._inner = inner
+        self._outer = outer
+        self._tag_length = tag_length
+        self.fingerprint = fingerprint
+    
+    def compute(self, message: MessageInput, raw: bool = False) -> Union[str, bytes]:
+        """
+        Menghitung MAC dari pesan dengan kunci yang terikat
+        
+        Args:
+            message: Pesan yang akan di-MAC (str atau objek buffer)
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+            
+        Returns:
+            MAC dalam format hexadecimal (atau bytes jika raw=True)
+        """
+        inner = self._inner.copy()
+        inner.update(as_buffer(message))
+        digest = _finish(inner, self._outer, self._tag_length)
+        return digest if raw else digest.hex()
+    
+    def verify(self, message: MessageInput, received_mac: Union[str, bytes, MacTag]) -> bool:
+        """
+        Verifikasi MAC pesan dengan kunci yang terikat
+        
+        Args:
+            message: Pesan asli (str atau objek buffer)
+            received_mac: MAC yang diterima (hex str atau bytes)
+            
+        Returns:
+            True jika MAC valid, False jika tidak
+        """
+        inner = self._inner.copy()
+        inner.update(as_buffer(message))
+        return _compare_tag(_finish(inner, self._outer, self._tag_length), received_mac)
+    
+    def stream(self) -> MACStream:
+        """Buat konteks MAC inkremental dari state kunci ini"""
+        return MACStream(self._inner.copy(), self._outer, self._tag_length)
+
+
+class MACContextCache:
+    """
+    Cache LRU terbatas untuk MACContext, diindeks dengan fingerprint kunci
+    
+    Kunci mentah tidak dipakai sebagai indeks cache; indeksnya adalah
+    BLAKE2s dari kunci.
+    """
+    
+    def __init__(self, factory, maxsize: int = DEFAULT_CONTEXT_CACHE_SIZE,
+                 tag_length: Optional[int] = None):
+        """
+        Args:
+            factory: Fungsi key -> (inner, outer) state hash yang sudah
+                     diinisialisasi (outer None untuk algoritma keyed native)
+            maxsize: Jumlah konteks maksimum dalam cache
+            tag_length: Panjang tag dalam bytes (None = digest penuh)
+        """
+        self._factory = factory
+        self.maxsize = maxsize
+        self.tag_length = tag_length
+        self._contexts: "OrderedDict[bytes, MACContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def fingerprint(key: bytes) -> bytes:
+        """Hitung fingerprint kunci untuk indeks cache"""
+        return hashlib.blake2s(key).digest()
+    
+    def get(self, key: bytes) -> MACContext:
+        """
+        Ambil konteks untuk kunci, buat baru jika belum ada di cache
+        
+        Args:
+            key: Kunci rahasia
+            
+        Returns:
+            MACContext yang terikat pada kunci
+        """
+        fingerprint = self.fingerprint(key)
+        # Lookup, urutan LRU, dan counter hit diperbarui di bawah lock agar
+        # stats() akurat; lock hanya dipegang untuk operasi dictionary
+        with self._lock:
+            context = self._contexts.get(fingerprint)
+            if context is not None:
+                self._contexts.move_to_end(fingerprint)
+                self.hits += 1
+                return context
+        
+        # State hash dibuat di luar lock; thread lain boleh membuat konteks
+        # yang sama secara bersamaan, yang terakhir disimpan
+        context = MACContext(*self._factory(key), fingerprint, self.tag_length)
+        with self._lock:
+            self.misses += 1
+            if self.maxsize <= 0:
+                return context
+            self._contexts[fingerprint] = context
+            self._contexts.move_to_end(fingerprint)
+            while len(self._contexts) > self.maxsize:
+                self._contexts.popitem(last=False)
+                self.evictions += 1
+        return context
+    
+    def invalidate(self, key: bytes) -> bool:
+        """
+        Hapus konteks kunci dari cache
+        
+        Returns:
+            True jika kunci ada di cache
+        """
+        with self._lock:
+            return self._contexts.pop(self.fingerprint(key), None) is not None
+    
+    def clear(self):
+        """Kosongkan cache"""
+        with self._lock:
+            self._contexts.clear()
+    
+    def stats(self) -> dict:
+        """Statistik cache: ukuran, hits, misses, evictions"""
+        with self._lock:
+            return {
+                'size': len(self._contexts),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
 
 class MACImplementation:
     """
@@ -15,18 +282,63 @@ class MACImplementation:
     dan Martin Hellman sebagai bagian dari kriptografi kunci publik.
     """
     
-    def __init__(self, algorithm: str = 'sha256'):
+    def __init__(self, algorithm: str = 'sha256',
+                 cache_size: int = DEFAULT_CONTEXT_CACHE_SIZE,
+                 tag_bits: Optional[int] = None, security_bits: int = 128):
         """
         Inisialisasi MAC dengan algoritma hash tertentu
         
         Args:
-            algorithm: Algoritma hash yang digunakan (sha256, sha1, md5)
+            algorithm: Algoritma yang digunakan (sha256, sha1, md5, sha512,
+                       blake2b, blake2s, sha3_256, sha3_512, atau auto)
+            cache_size: Jumlah konteks kunci dalam cache LRU (0 = tanpa cache)
+            tag_bits: Panjang tag dalam bit untuk tag yang dipotong
+                      (None = digest penuh)
+            security_bits: Tingkat keamanan minimum untuk algorithm='auto';
+                           tag_bits ikut dihitung karena pemalsuan tag
+                           terpotong hanya butuh sekitar 2**tag_bits tebakan
+
+        Algoritma hasil 'auto' bergantung pada cache benchmark di mesin
+        host, sehingga mesin lain bisa memilih algoritma berbeda. Pemanggil
+        yang menyimpan tag harus mencatat .algorithm agar verifikasi
+        memakai algoritma yang sama.
+
+        Raises:
+            ValueError: Jika algoritma tidak didukung, tag_bits tidak valid,
+                        atau tag_bits di bawah security_bits untuk 'auto'
         """
-        self.algorithm = algorithm
-        self.supported_algorithms = ['sha256', 'sha1', 'md5', 'sha512']
+        self.supported_algorithms = list(HMAC_ALGORITHMS + BLAKE2_ALGORITHMS
+                                         + SHA3_ALGORITHMS)
+        
+        if algorithm == 'auto':
+            if tag_bits is not None and tag_bits < security_bits:
+                raise ValueError(f"Tag {tag_bits} bit di bawah tingkat keamanan "
+                                 f"{security_bits} bit")
+            from mac_autoselect import select_algorithm
+            algorithm = select_algorithm(security_bits, self.supported_algorithms)
         
         if algorithm not in self.supported_algorithms:
             raise ValueError(f"Algorithm {algorithm} not supported")
+        self.algorithm = algorithm
+        
+        self.digest_size = self._digest_size(algorithm)
+        self.tag_bits = tag_bits
+        tag_length = None
+        if tag_bits is not None:
+            if tag_bits % 8 or not MIN_TAG_BITS <= tag_bits <= self.digest_size * 8:
+                raise ValueError(f"Tag {tag_bits} bit tidak valid untuk {algorithm} "
+                                 f"({MIN_TAG_BITS}-{self.digest_size * 8}, kelipatan 8)")
+            tag_length = tag_bits // 8
+        # Keamanan efektif terhadap pemalsuan: dibatasi algoritma dan panjang tag
+        self.security_bits = min(ALGORITHM_SECURITY_BITS[algorithm],
+                                 tag_bits or self.digest_size * 8)
+        
+        self.context_cache = MACContextCache(self._new_context, cache_size, tag_length)
+    
+    @staticmethod
+    def _digest_size(algorithm: str) -> int:
+        """Ukuran digest penuh algoritma dalam bytes"""
+        return getattr(hashlib, algorithm)().digest_size
     
     def generate_key(self, length: int = 32) -> bytes:
         """
@@ -40,35 +352,303 @@ class MACImplementation:
         """
         return secrets.token_bytes(length)
     
-    def compute_mac(self, message: str, key: bytes) -> str:
+    def compute_mac(self, message: MessageInput, key: bytes,
+                    raw: bool = False) -> Union[str, bytes]:
         """
         Menghitung MAC dari pesan menggunakan HMAC
         
         Args:
-            message: Pesan yang akan di-MAC
+            message: Pesan yang akan di-MAC (str atau objek buffer)
             key: Kunci rahasia
+            raw: True untuk mengembalikan tag dalam bentuk bytes
             
         Returns:
-            MAC dalam format hexadecimal
+            MAC dalam format hexadecimal (atau bytes jika raw=True)
+        """
+        return self.bind(key).compute(message, raw)
+    
+    def compute_mac_tag(self, message: MessageInput, key: bytes) -> MacTag:
+        """
+        Menghitung MAC dalam bentuk MacTag (digest mentah + ID algoritma)
+        
+        Args:
+            message: Pesan yang akan di-MAC (str atau objek buffer)
+            key: Kunci rahasia
+            
+        Returns:
+            MacTag untuk pesan
         """
-        message_bytes = message.encode('utf-8')
-        mac_object = hmac.new(key, message_bytes, getattr(hashlib, self.algorithm))
-        return mac_object.hexdigest()
+        return MacTag(self.algorithm, self.bind(key).compute(message, True))
     
-    def verify_mac(self, message: str, key: bytes, received_mac: str) -> bool:
+    def verify_mac(self, message: MessageInput, key: bytes,
+                   received_mac: Union[str, bytes, MacTag]) -> bool:
         """
         Verifikasi MAC untuk memastikan integritas pesan
         
         Args:
-            message: Pesan asli
+            message: Pesan asli (str atau objek buffer)
+            key: Kunci rahasia
+            received_mac: MAC yang diterima (MacTag, bytes, atau hex str)
+            
+        Returns:
+            True jika MAC valid, False jika tidak
+        """
+        if (isinstance(received_mac, MacTag)
+                and received_mac.algorithm_id != algorithm_id(self.algorithm)):
+            return False
+        return self.bind(key).verify(message, received_mac)
+    
+    def bind(self, key: bytes) -> MACContext:
+        """
+        Ambil konteks MAC yang terikat pada kunci (melalui cache LRU)
+        
+        Args:
+            key: Kunci rahasia
+            
+        Returns:
+            MACContext untuk kunci tersebut
+        """
+        return self.context_cache.get(key)
+    
+    def invalidate_key(self, key: bytes) -> bool:
+        """
+        Hapus konteks kunci dari cache, misalnya setelah kunci dicabut
+        
+        Args:
+            key: Kunci rahasia
+            
+        Returns:
+            True jika kunci ada di cache
+        """
+        return self.context_cache.invalidate(key)
+    
+    def compute_mac_batch(self, messages: Sequence[MessageInput], key: bytes,
+                          raw: bool = False,
+                          max_workers: Optional[int] = None) -> List[Union[str, bytes]]:
+        """
+        Menghitung MAC untuk banyak pesan dengan kunci yang sama
+        
+        Konteks kunci diambil sekali lalu di-copy() untuk setiap pesan.
+        Batch besar dijalankan di ThreadPoolExecutor.
+        
+        Args:
+            messages: Daftar pesan (str atau objek buffer)
+            key: Kunci rahasia
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+            max_workers: Jumlah thread maksimum (None = default executor)
+            
+        Returns:
+            Daftar MAC dengan urutan yang sama dengan messages
+        """
+        buffers = [as_buffer(message) for message in messages]
+        context = self.bind(key)
+        
+        def tag(buffer):
+            return context.compute(buffer, raw)
+        
+        return self._map_batch(tag, buffers, buffers, max_workers)
+    
+    def compute_mac_array(self, messages: Sequence[MessageInput], key: bytes,
+                          names: Optional[Sequence[str]] = None,
+                          max_workers: Optional[int] = None) -> TagArray:
+        """
+        Menghitung MAC banyak pesan ke dalam satu TagArray kontinu
+        
+        Args:
+            messages: Daftar pesan (str atau objek buffer)
+            key: Kunci rahasia
+            names: Nama slot opsional, satu per pesan
+            max_workers: Jumlah thread maksimum (None = default executor)
+            
+        Returns:
+            TagArray dengan slot i berisi tag messages[i]
+        """
+        if names is not None and len(names) != len(messages):
+            raise ValueError("Jumlah pesan dan nama harus sama")
+        tags = self.compute_mac_batch(messages, key, True, max_workers)
+        array = TagArray(self.algorithm, self.tag_bits // 8 if self.tag_bits else self.digest_size)
+        for index, tag in enumerate(tags):
+            array.append(tag, None if names is None else names[index])
+        return array
+    
+    def verify_mac_batch(self, messages: Sequence[MessageInput], key: bytes,
+                         received_macs: Sequence[Union[str, bytes]],
+                         max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Verifikasi MAC untuk banyak pesan dengan kunci yang sama
+        
+        Args:
+            messages: Daftar pesan (str atau objek buffer)
+            key: Kunci rahasia
+            received_macs: Daftar MAC yang diterima (hex str atau bytes)
+            max_workers: Jumlah thread maksimum (None = default executor)
+            
+        Returns:
+            Daftar boolean, True untuk setiap pesan yang MAC-nya valid
+        """
+        if len(messages) != len(received_macs):
+            raise ValueError("Jumlah pesan dan MAC harus sama")
+        
+        buffers = [as_buffer(message) for message in messages]
+        context = self.bind(key)
+        
+        def check(item):
+            buffer, received_mac = item
+            return context.verify(buffer, received_mac)
+        
+        return self._map_batch(check, list(zip(buffers, received_macs)),
+                               buffers, max_workers)
+    
+    @staticmethod
+    def _map_batch(func, items: list, buffers: list, max_workers: Optional[int]) -> list:
+        """Jalankan func untuk setiap item, paralel jika batch cukup besar"""
+        total = sum(len(buffer) for buffer in buffers)
+        parallel = (len(items) > 1 and max_workers != 1
+                    and total >= PARALLEL_MIN_BATCH_BYTES
+                    and total // len(items) >= PARALLEL_MIN_MESSAGE_SIZE)
+        if not parallel:
+            return [func(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(func, items))
+    
+    def _new_context(self, key: bytes) -> Tuple:
+        """
+        Hitung state MAC untuk kunci
+        
+        HMAC (RFC 2104): inner dan outer sudah memproses blok K ^ ipad dan
+        K ^ opad. BLAKE2: state keyed native dengan digest_size sebesar tag.
+        SHA-3: state yang sudah memproses prefix kunci bergaya KMAC. Dua
+        jenis terakhir tidak memerlukan hash outer.
+        
+        Returns:
+            Tuple (inner, outer), outer None untuk algoritma keyed native
+        """
+        digest_cons = getattr(hashlib, self.algorithm)
+        if self.algorithm in BLAKE2_ALGORITHMS:
+            if len(key) > digest_cons.MAX_KEY_SIZE:
+                key = digest_cons(key, digest_size=digest_cons.MAX_KEY_SIZE).digest()
+            digest_size = self.context_cache.tag_length or digest_cons.MAX_DIGEST_SIZE
+            return digest_cons(key=key, digest_size=digest_size), None
+        if self.algorithm in SHA3_ALGORITHMS:
+            inner = digest_cons()
+            inner.update(_kmac_prefix(bytes(key), inner.block_size))
+            return inner, None
+        
+        inner = digest_cons()
+        outer = digest_cons()
+        block_size = inner.block_size
+        if len(key) > block_size:
+            key = digest_cons(key).digest()
+        key = bytes(key).ljust(block_size, b'\0')
+        inner.update(key.translate(hmac.trans_36))
+        outer.update(key.translate(hmac.trans_5C))
+        return inner, outer
+    
+    def new_stream(self, key: bytes) -> MACStream:
+        """
+        Buat konteks MAC inkremental
+        
+        Args:
             key: Kunci rahasia
-            received_mac: MAC yang diterima
+            
+        Returns:
+            MACStream yang siap menerima update()
+        """
+        return self.bind(key).stream()
+    
+    def compute_mac_stream(self, chunks: Iterable, key: bytes) -> str:
+        """
+        Menghitung MAC dari rangkaian potongan pesan
+        
+        Args:
+            chunks: Iterable berisi potongan pesan (bytes-like)
+            key: Kunci rahasia
+            
+        Returns:
+            MAC dalam format hexadecimal
+        """
+        return self._digest_stream(chunks, key).hexdigest()
+    
+    def _digest_stream(self, chunks: Iterable, key: bytes) -> MACStream:
+        """Masukkan semua potongan ke stream baru"""
+        stream = self.new_stream(key)
+        for chunk in chunks:
+            stream.update(as_buffer(chunk))
+        return stream
+    
+    def compute_mac_file(self, source: Union[str, BinaryIO], key: bytes,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """
+        Menghitung MAC dari file dengan memori konstan
+        
+        File dibaca dengan readinto() ke satu buffer yang dipakai ulang.
+        
+        Args:
+            source: Path file atau objek file biner yang sudah terbuka
+            key: Kunci rahasia
+            chunk_size: Ukuran buffer baca dalam bytes
+            
+        Returns:
+            MAC dalam format hexadecimal
+        """
+        return self._digest_file(source, key, chunk_size).hexdigest()
+    
+    def _digest_file(self, source: Union[str, BinaryIO], key: bytes,
+                     chunk_size: int) -> MACStream:
+        """Baca seluruh file ke stream baru"""
+        stream = self.new_stream(key)
+        view = memoryview(bytearray(chunk_size))
+        
+        if isinstance(source, str):
+            with open(source, 'rb', buffering=0) as f:
+                self._feed_file(stream, f, view)
+        else:
+            self._feed_file(stream, source, view)
+        return stream
+    
+    @staticmethod
+    def _feed_file(stream: MACStream, f: BinaryIO, view: memoryview):
+        """Baca file ke buffer yang dipakai ulang dan update stream"""
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            stream.update(view[:n])
+    
+    def verify_mac_stream(self, chunks: Iterable, key: bytes,
+                          received_mac: Union[str, bytes, MacTag]) -> bool:
+        """
+        Verifikasi MAC dari rangkaian potongan pesan
+        
+        Args:
+            chunks: Iterable berisi potongan pesan
+            key: Kunci rahasia
+            received_mac: MAC yang diterima (hex str atau bytes)
             
         Returns:
             True jika MAC valid, False jika tidak
         """
-        computed_mac = self.compute_mac(message, key)
-        return hmac.compare_digest(computed_mac, received_mac)
+        stream = self._digest_stream(chunks, key)
+        return stream.verify(received_mac)
+    
+    def verify_mac_file(self, source: Union[str, BinaryIO], key: bytes,
+                        received_mac: Union[str, bytes, MacTag],
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> bool:
+        """
+        Verifikasi MAC dari file dengan memori konstan
+        
+        Args:
+            source: Path file atau objek file biner
+            key: Kunci rahasia
+            received_mac: MAC yang diterima (hex str atau bytes)
+            chunk_size: Ukuran buffer baca dalam bytes
+            
+        Returns:
+            True jika MAC valid, False jika tidak
+        """
+        stream = self._digest_file(source, key, chunk_size)
+        return stream.verify(received_mac)
     
     def demonstrate_mac(self):
         """Demonstrasi penggunaan MAC"""
@@ -103,7 +683,7 @@ class MACImplementation:
         
         
         print("\n--- Perbandingan Algoritma MAC ---")
-        algorithms = ['md5', 'sha1', 'sha256', 'sha512']
+        algorithms = ['md5', 'sha1', 'sha256', 'sha512', 'blake2b', 'blake2s', 'sha3_256']
         
         for algo in algorithms:
             try:
@@ -115,7 +695,3 @@ class MACImplementation:
                 print(f"{algo.upper():>8}: {mac_result} ({(end_time - start_time) * 1000:.4f} ms)")
             except Exception as e:
                 print(f"{algo.upper():>8}: Error - {e}")
-
-
-mac_demo = MACImplementation()
-mac_demo.demonstrate_mac()
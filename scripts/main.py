@@ -1,7 +1,29 @@
 """
 Program Utama - Demonstrasi MAC dan USAC
+
+Modul library (mac_implementation, usac_implementation, comparison_analysis,
+educational_demo) tidak menjalankan apa pun saat di-import; semua demo
+dijalankan dari entry point di sini.
 """
 
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+# Modul yang harus bebas efek samping dan cepat di-import
+LIBRARY_MODULES = ['mac_implementation', 'usac_implementation',
+                   'comparison_analysis', 'educational_demo']
+
+DEFAULT_IMPORT_BUDGET_MS = 150.0
+# Dependensi berat yang hanya boleh dimuat saat dipakai
+HEAVY_MODULES = ('numpy', 'matplotlib')
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
 def print_header():
     print("\n" + "=" * 80)
     print("KRIPTOGRAFI HASH - MESSAGE AUTHENTICATION CODE & UNCONDITIONAL SECURE AUTHENTICATION CODE")
@@ -11,23 +33,180 @@ def print_header():
     print("2. Unconditional Secure Authentication Code (USAC)")
     print("-" * 80)
 
-if __name__ == "__main__":
-    print_header()
-    
+
+def run_mac_demo():
     print("\nMenjalankan demonstrasi MAC...")
     from mac_implementation import MACImplementation
     mac_demo = MACImplementation()
     mac_demo.demonstrate_mac()
-    
+
+
+def run_usac_demo():
     print("\nMenjalankan demonstrasi USAC...")
     from usac_implementation import USACImplementation
     usac_demo = USACImplementation()
     usac_demo.demonstrate_usac()
-    
+
+
+def run_educational_demo():
     print("\nMenjalankan demonstrasi edukatif...")
     from educational_demo import educational_demonstration
     educational_demonstration()
-    
+
+
+def run_comparison():
+    print("\nMenjalankan analisis perbandingan...")
+    from comparison_analysis import CryptographicComparison
+    comparison = CryptographicComparison()
+    comparison.run_complete_analysis()
+
+
+def import_report(module: str) -> dict:
+    """
+    Import satu modul di interpreter baru dan laporkan efek sampingnya
+
+    Import dijalankan dua kali (yang pertama hanya untuk meng-cache
+    bytecode) dan hasil kedua yang dilaporkan.
+
+    Args:
+        module: Nama modul di direktori scripts
+
+    Returns:
+        Dictionary {ok, ms, stdout, heavy, error}: heavy adalah dependensi
+        berat (HEAVY_MODULES) yang ikut ter-import
+    """
+    code = ("import json, sys, time; start = time.perf_counter(); import {0}; "
+            "elapsed = (time.perf_counter() - start) * 1000; "
+            "sys.stderr.write(json.dumps([elapsed, sorted(set({1}) & set(sys.modules))]))")
+    command = [sys.executable, '-c', code.format(module, list(HEAVY_MODULES))]
+    subprocess.run(command, capture_output=True, cwd=SCRIPTS_DIR)
+    result = subprocess.run(command, capture_output=True, text=True, cwd=SCRIPTS_DIR)
+    if result.returncode != 0:
+        return {'ok': False, 'ms': 0.0, 'stdout': result.stdout, 'heavy': [],
+                'error': result.stderr}
+    elapsed, heavy = json.loads(result.stderr.strip().splitlines()[-1])
+    return {'ok': True, 'ms': elapsed, 'stdout': result.stdout, 'heavy': heavy, 'error': ''}
+
+
+def check_import_budget(budget_ms: float = DEFAULT_IMPORT_BUDGET_MS,
+                        modules: Optional[List[str]] = None) -> bool:
+    """
+    Pastikan setiap modul library cepat di-import dan tanpa efek samping
+
+    Modul tidak boleh mencetak apa pun atau ikut meng-import dependensi
+    berat (HEAVY_MODULES). Waktu import dibandingkan dengan budget;
+    budget bergantung pada beban mesin, sehingga test otomatis hanya
+    memeriksa syarat deterministik lewat import_report().
+
+    Args:
+        budget_ms: Batas waktu import per modul dalam milidetik
+        modules: Daftar modul (default LIBRARY_MODULES)
+
+    Returns:
+        True jika semua modul memenuhi budget, tanpa output dan tanpa
+        dependensi berat
+    """
+    ok = True
+    for module in modules or LIBRARY_MODULES:
+        report = import_report(module)
+        if not report['ok']:
+            print(f"{module:<22} GAGAL import\n{report['error']}")
+            ok = False
+            continue
+        notes = []
+        if report['stdout']:
+            notes.append("mencetak output saat import")
+        if report['heavy']:
+            notes.append(f"meng-import {', '.join(report['heavy'])}")
+        passed = report['ms'] <= budget_ms and not notes
+        ok = ok and passed
+        note = f" ({'; '.join(notes)})" if notes else ""
+        print(f"{module:<22} {report['ms']:>8.1f} ms / {budget_ms:.0f} ms "
+              f"{'OK' if passed else 'GAGAL'}{note}")
+    return ok
+
+
+def print_metrics(output_format: str = 'text'):
+    """Cetak metrik instrumentasi yang terkumpul selama demo"""
+    import instrumentation
+    print("\n" + "=" * 80)
+    print("METRIK OPERASI")
+    print("=" * 80)
+    if output_format == 'prometheus':
+        print(instrumentation.export_prometheus(), end='')
+        return
+    for operation, stats in instrumentation.snapshot().items():
+        latency = stats['latency_ns']
+        print(f"{operation:<20} {stats['count']:>8} ops {stats['errors']:>4} err "
+              f"{stats['bytes']:>12} B  p50 {latency['p50'] / 1e3:>10.1f} us  "
+              f"p99 {latency['p99'] / 1e3:>10.1f} us")
+
+
+DEMOS = {
+    'mac': run_mac_demo,
+    'usac': run_usac_demo,
+    'edu': run_educational_demo,
+    'compare': run_comparison,
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Demonstrasi MAC dan USAC")
+    parser.add_argument('demos', nargs='*', metavar='DEMO',
+                        help=f"Demo yang dijalankan: {', '.join(DEMOS)}, all "
+                             "(default: mac usac edu)")
+    parser.add_argument('--import-budget', type=float, nargs='?',
+                        const=DEFAULT_IMPORT_BUDGET_MS, metavar='MS',
+                        help="Periksa waktu import modul library lalu keluar")
+    parser.add_argument('--metrics', choices=['text', 'prometheus'], nargs='?',
+                        const='text', help="Aktifkan instrumentasi dan cetak metrik di akhir")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="Profil setiap demo (cProfile + sampling) dan tulis hasil ke DIR; "
+                             "demo juga boleh berupa api-mac, api-usac, api-usac-loop, "
+                             "api-keygen")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="Lacak alokasi dengan tracemalloc saat --profile")
+    parser.add_argument('--profile-interval', type=float, default=0.005, metavar='DETIK',
+                        help="Interval sampling profiler (default 0.005)")
+    args = parser.parse_args(argv)
+
+    if args.import_budget is not None:
+        return 0 if check_import_budget(args.import_budget) else 1
+
+    targets = dict(DEMOS)
+    if args.profile:
+        from profiling import API_WORKLOADS
+        targets.update(API_WORKLOADS)
+    unknown = [name for name in args.demos if name not in targets and name != 'all']
+    if unknown:
+        parser.error(f"demo tidak dikenal: {', '.join(unknown)}")
+    demos = args.demos or ['mac', 'usac', 'edu']
+    if 'all' in demos:
+        demos = list(DEMOS)
+
+    if args.metrics:
+        import instrumentation
+        instrumentation.enable()
+
+    print_header()
+    if args.profile:
+        import profiling
+        results = [profiling.profile_call(name, targets[name], args.profile,
+                                          args.profile_interval, args.profile_memory)
+                   for name in demos]
+        profiling.print_summary(results)
+    else:
+        for name in demos:
+            DEMOS[name]()
+
+    if args.metrics:
+        print_metrics(args.metrics)
+
     print("\n" + "=" * 80)
     print("PROGRAM SELESAI")
     print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
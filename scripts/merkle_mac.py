@@ -0,0 +1,307 @@
+"""
+Merkle-tree MAC untuk input sangat besar
+
+HMAC biasa bersifat sekuensial sehingga satu file besar hanya memakai satu
+core. Mode ini memecah input menjadi leaf berukuran tetap, menghitung MAC
+setiap leaf secara paralel (thread atau proses, di atas mmap untuk file),
+lalu menggabungkannya menjadi tag akar berkunci:
+
+    leaf_i  = MAC(K, 0x00 || i u64 || data_i)
+    node    = MAC(K, 0x01 || kiri || kanan)
+    root    = MAC(K, 0x02 || algorithm_id || leaf_size u64 || panjang u64 || puncak)
+
+Node tanpa pasangan di suatu level dinaikkan apa adanya. Prefix domain
+dan algorithm_id ('merkle-<hash>') memastikan tag mode ini tidak pernah
+sama dengan tag HMAC biasa untuk data yang sama, dan leaf_size serta
+panjang total ikut terautentikasi.
+
+MerkleTree menyimpan semua level sehingga verifikasi atau pembaruan satu
+leaf hanya menghitung ulang O(log n) node.
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Sequence, Union
+
+from buffer_utils import MessageInput, as_buffer
+from mac_implementation import MACImplementation, _compare_tag
+
+DEFAULT_LEAF_SIZE = 1024 * 1024
+MIN_LEAF_SIZE = 1024
+# Jumlah leaf per tugas worker
+LEAVES_PER_TASK = 16
+
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+ROOT_PREFIX = b'\x02'
+U64 = struct.Struct('>Q')
+
+
+def algorithm_id(algorithm: str) -> str:
+    """ID algoritma mode Merkle (berbeda dari nama algoritma HMAC)"""
+    return f"merkle-{algorithm}"
+
+
+def _leaf_tag(context, index: int, leaf) -> bytes:
+    return context.stream().update(LEAF_PREFIX + U64.pack(index)).update(leaf).finalize()
+
+
+def _node_tag(context, left: bytes, right: bytes) -> bytes:
+    return context.compute(NODE_PREFIX + left + right, True)
+
+
+def _root_tag(context, algorithm: str, leaf_size: int, length: int, top: bytes) -> bytes:
+    header = (ROOT_PREFIX + algorithm_id(algorithm).encode('ascii')
+              + U64.pack(leaf_size) + U64.pack(length))
+    return context.compute(header + top, True)
+
+
+def _hash_file_leaves(path: str, algorithm: str, key: bytes, leaf_size: int,
+                      first: int, count: int) -> List[bytes]:
+    """Worker proses: hitung tag leaf [first, first + count) dari file via mmap"""
+    context = MACImplementation(algorithm, cache_size=0).bind(key)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return [_leaf_tag(context, 0, b'')]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return [_leaf_tag(context, index,
+                                  view[index * leaf_size:(index + 1) * leaf_size])
+                        for index in range(first, first + count)]
+            finally:
+                view.release()
+
+
+class MerkleTree:
+    """
+    Pohon tag Merkle untuk satu input, dengan akses leaf O(log n)
+    """
+
+    def __init__(self, context, algorithm: str, leaf_size: int, length: int,
+                 leaves: List[bytes]):
+        self._context = context
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.length = length
+        self.levels: List[List[bytes]] = [leaves]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parent = [_node_tag(context, level[i], level[i + 1])
+                      for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parent.append(level[-1])
+            self.levels.append(parent)
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.levels[0])
+
+    def root(self, raw: bool = False) -> Union[str, bytes]:
+        """Tag akar (hex atau bytes jika raw=True)"""
+        tag = _root_tag(self._context, self.algorithm, self.leaf_size, self.length,
+                        self.levels[-1][0])
+        return tag if raw else tag.hex()
+
+    def _leaf_length(self, index: int) -> int:
+        """Panjang leaf pada indeks tertentu"""
+        if index == self.leaf_count - 1:
+            return self.length - index * self.leaf_size
+        return self.leaf_size
+
+    def proof(self, index: int) -> List[Optional[bytes]]:
+        """
+        Daftar tag saudara dari leaf sampai puncak (None jika tidak berpasangan)
+
+        Args:
+            index: Indeks leaf
+
+        Returns:
+            Bukti inklusi sepanjang O(log n)
+        """
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"Leaf {index} di luar jangkauan")
+        siblings = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            siblings.append(level[sibling] if sibling < len(level) else None)
+            index //= 2
+        return siblings
+
+    def _climb(self, index: int, leaf_tag: bytes, proof: Sequence[Optional[bytes]]) -> bytes:
+        """Hitung tag puncak dari tag leaf dan bukti inklusinya"""
+        node = leaf_tag
+        for sibling in proof:
+            if sibling is not None:
+                node = (_node_tag(self._context, node, sibling) if index % 2 == 0
+                        else _node_tag(self._context, sibling, node))
+            index //= 2
+        return node
+
+    def verify_leaf(self, index: int, data: MessageInput) -> bool:
+        """
+        Verifikasi satu leaf terhadap pohon dalam O(log n)
+
+        Args:
+            index: Indeks leaf
+            data: Isi leaf
+
+        Returns:
+            True jika leaf cocok dengan tag akar
+        """
+        data = as_buffer(data)
+        if len(data) != self._leaf_length(index):
+            return False
+        top = self._climb(index, _leaf_tag(self._context, index, data), self.proof(index))
+        return _compare_tag(top, self.levels[-1][0])
+
+    def update_leaf(self, index: int, data: MessageInput) -> bytes:
+        """
+        Ganti isi satu leaf dan hitung ulang jalurnya ke akar dalam O(log n)
+
+        Hanya leaf terakhir yang boleh berubah panjang (1..leaf_size bytes);
+        leaf kosong hanya sah untuk pesan kosong (satu leaf), sehingga akar
+        tetap sama dengan akar dari MAC ulang pesan lengkap.
+
+        Args:
+            index: Indeks leaf
+            data: Isi leaf yang baru
+
+        Returns:
+            Tag akar baru (bytes)
+        """
+        data = as_buffer(data)
+        last = index == self.leaf_count - 1
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"Leaf {index} di luar jangkauan")
+        if len(data) > self.leaf_size or (not last and len(data) != self.leaf_size):
+            raise ValueError("Panjang leaf tidak valid")
+        if not data and self.leaf_count > 1:
+            raise ValueError("Leaf terakhir tidak boleh kosong")
+        if last:
+            self.length = index * self.leaf_size + len(data)
+
+        node = _leaf_tag(self._context, index, data)
+        for level, parent in zip(self.levels, self.levels[1:]):
+            level[index] = node
+            sibling = index ^ 1
+            if sibling < len(level):
+                node = (_node_tag(self._context, node, level[sibling]) if index % 2 == 0
+                        else _node_tag(self._context, level[sibling], node))
+            index //= 2
+        self.levels[-1][index] = node
+        return self.root(raw=True)
+
+
+class MerkleMAC:
+    """
+    MAC mode pohon Merkle dengan hashing leaf paralel
+    """
+
+    def __init__(self, algorithm: str = 'sha256', leaf_size: int = DEFAULT_LEAF_SIZE,
+                 workers: Optional[int] = None, use_processes: bool = False):
+        """
+        Args:
+            algorithm: Algoritma MAC untuk leaf dan node (lihat MACImplementation)
+            leaf_size: Ukuran leaf dalam bytes
+            workers: Jumlah worker (None = os.cpu_count(), 1 = sekuensial)
+            use_processes: True untuk worker proses (hanya file), bukan thread
+        """
+        if leaf_size < MIN_LEAF_SIZE:
+            raise ValueError(f"leaf_size minimum {MIN_LEAF_SIZE}")
+        self.mac = MACImplementation(algorithm)
+        self.algorithm = self.mac.algorithm
+        self.algorithm_id = algorithm_id(self.algorithm)
+        self.leaf_size = leaf_size
+        self.workers = workers or os.cpu_count() or 1
+        self.use_processes = use_processes
+
+    def _leaf_ranges(self, length: int) -> List[tuple]:
+        """Bagi leaf menjadi rentang tugas (first, count)"""
+        leaves = max(1, -(-length // self.leaf_size))
+        return [(first, min(LEAVES_PER_TASK, leaves - first))
+                for first in range(0, leaves, LEAVES_PER_TASK)]
+
+    def build_tree(self, message: MessageInput, key: bytes) -> MerkleTree:
+        """
+        Bangun pohon Merkle untuk data di memori (leaf di-hash dengan thread)
+
+        Args:
+            message: Pesan (str atau objek buffer)
+            key: Kunci rahasia
+
+        Returns:
+            MerkleTree untuk pesan
+        """
+        view = memoryview(as_buffer(message))
+        context = self.mac.bind(key)
+        leaf_size = self.leaf_size
+
+        def hash_range(task):
+            first, count = task
+            return [_leaf_tag(context, index, view[index * leaf_size:(index + 1) * leaf_size])
+                    for index in range(first, first + count)]
+
+        tasks = self._leaf_ranges(len(view))
+        if self.workers > 1 and len(tasks) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(hash_range, tasks))
+        else:
+            results = [hash_range(task) for task in tasks]
+        leaves = [tag for chunk in results for tag in chunk]
+        return MerkleTree(context, self.algorithm, leaf_size, len(view), leaves)
+
+    def build_tree_file(self, path: str, key: bytes) -> MerkleTree:
+        """
+        Bangun pohon Merkle untuk file melalui mmap
+
+        Args:
+            path: Path file
+            key: Kunci rahasia
+
+        Returns:
+            MerkleTree untuk isi file
+        """
+        size = os.path.getsize(path)
+        if not self.use_processes or self.workers == 1 or size == 0:
+            if size == 0:
+                return self.build_tree(b'', key)
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    return self.build_tree(view, key)
+                finally:
+                    view.release()
+
+        from concurrent.futures import ProcessPoolExecutor
+        tasks = self._leaf_ranges(size)
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(_hash_file_leaves, path, self.algorithm, bytes(key),
+                                       self.leaf_size, first, count)
+                       for first, count in tasks]
+            leaves = [tag for future in futures for tag in future.result()]
+        return MerkleTree(self.mac.bind(key), self.algorithm, self.leaf_size, size, leaves)
+
+    def compute_mac(self, message: MessageInput, key: bytes,
+                    raw: bool = False) -> Union[str, bytes]:
+        """Tag akar Merkle untuk pesan (hex atau bytes jika raw=True)"""
+        return self.build_tree(message, key).root(raw)
+
+    def compute_mac_file(self, path: str, key: bytes,
+                         raw: bool = False) -> Union[str, bytes]:
+        """Tag akar Merkle untuk file (hex atau bytes jika raw=True)"""
+        return self.build_tree_file(path, key).root(raw)
+
+    def verify_mac(self, message: MessageInput, key: bytes,
+                   received_mac: Union[str, bytes]) -> bool:
+        """Verifikasi tag akar Merkle untuk pesan"""
+        return _compare_tag(self.compute_mac(message, key, True), received_mac)
+
+    def verify_mac_file(self, path: str, key: bytes,
+                        received_mac: Union[str, bytes]) -> bool:
+        """Verifikasi tag akar Merkle untuk file"""
+        return _compare_tag(self.compute_mac_file(path, key, True), received_mac)
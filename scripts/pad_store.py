@@ -0,0 +1,210 @@
+"""
+Pad Store - penyimpanan materi one-time pad berbasis file dan mmap
+
+Pad yang sudah dibagikan antar lokasi disimpan sebagai file lokal dan
+dipetakan dengan mmap, sehingga pad yang jauh lebih besar dari RAM dapat
+dipakai tanpa menyalin materi kunci per pesan (region diberikan sebagai
+memoryview).
+
+Kursor konsumsi disimpan di file terpisah dan di-persist (fsync + rename
+atomik) SEBELUM region diberikan. Jika proses crash, region yang sudah
+dicadangkan dianggap terpakai, sehingga tidak ada region yang dipakai dua
+kali.
+"""
+
+import mmap
+import os
+import threading
+from typing import Optional, Tuple
+
+WIPE_CHUNK_SIZE = 1024 * 1024
+
+
+class PadStore:
+    """
+    Pad one-time di atas file lokal dengan kursor konsumsi persisten
+    """
+
+    def __init__(self, pad_path: str, cursor_path: Optional[str] = None,
+                 wipe: bool = False):
+        """
+        Args:
+            pad_path: Path file pad
+            cursor_path: Path file kursor (default: pad_path + '.cursor')
+            wipe: Timpa region yang sudah dipakai dengan nol (file dibuka
+                  read-write)
+        """
+        self.pad_path = pad_path
+        self.cursor_path = cursor_path or pad_path + '.cursor'
+        self.wipe_enabled = wipe
+        self._lock = threading.Lock()
+
+        self._file = open(pad_path, 'r+b' if wipe else 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        if self.size == 0:
+            self._file.close()
+            raise ValueError("File pad kosong")
+        access = mmap.ACCESS_WRITE if wipe else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        self._view = memoryview(self._mmap)
+        self.cursor = self._load_cursor()
+
+    def __enter__(self) -> 'PadStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def create(pad_path: str, size: int, chunk_size: int = 1024 * 1024) -> str:
+        """
+        Buat file pad baru berisi materi acak dari os.urandom
+
+        Args:
+            pad_path: Path file pad
+            size: Ukuran pad dalam bytes
+            chunk_size: Ukuran tulis per langkah
+
+        Returns:
+            Path file pad
+        """
+        with open(pad_path, 'xb') as f:
+            remaining = size
+            while remaining:
+                n = min(chunk_size, remaining)
+                f.write(os.urandom(n))
+                remaining -= n
+            f.flush()
+            os.fsync(f.fileno())
+        return pad_path
+
+    def _load_cursor(self) -> int:
+        """Baca kursor konsumsi dari disk (0 jika belum ada)"""
+        try:
+            with open(self.cursor_path, 'r') as f:
+                cursor = int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+        if not 0 <= cursor <= self.size:
+            raise ValueError(f"Kursor pad tidak valid: {cursor}")
+        return cursor
+
+    def _persist_cursor(self, cursor: int):
+        """Simpan kursor secara atomik dan tahan crash"""
+        tmp_path = self.cursor_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(str(cursor))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.cursor_path)
+        directory = os.path.dirname(os.path.abspath(self.cursor_path))
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+        self.cursor = cursor
+
+    def remaining(self) -> int:
+        """Jumlah bytes pad yang belum dipakai"""
+        return self.size - self.cursor
+
+    def reserve(self, length: int) -> Tuple[int, memoryview]:
+        """
+        Cadangkan region berikutnya untuk pengirim
+
+        Args:
+            length: Jumlah bytes yang dibutuhkan
+
+        Returns:
+            Tuple berisi (offset, memoryview region pad)
+        """
+        with self._lock:
+            offset = self.cursor
+            if offset + length > self.size:
+                raise ValueError("Materi pad tidak cukup")
+            self._persist_cursor(offset + length)
+            return offset, self._view[offset:offset + length]
+
+    def _check_region(self, offset: int, length: int):
+        """Tolak region di bawah kursor atau melewati akhir pad"""
+        if offset < self.cursor:
+            raise ValueError(f"Region pad pada offset {offset} sudah dipakai")
+        if offset + length > self.size:
+            raise ValueError("Region melewati akhir pad")
+
+    def claim(self, offset: int, length: int) -> memoryview:
+        """
+        Klaim region pada offset tertentu untuk penerima
+
+        Region sebelum kursor dianggap sudah terpakai dan ditolak. Kursor
+        langsung maju; untuk offset dari data yang belum terautentikasi,
+        pakai peek() lalu commit() setelah tag diverifikasi.
+
+        Args:
+            offset: Offset region yang dipakai pengirim
+            length: Panjang region
+
+        Returns:
+            memoryview region pad
+        """
+        with self._lock:
+            self._check_region(offset, length)
+            self._persist_cursor(offset + length)
+            return self._view[offset:offset + length]
+
+    def peek(self, offset: int, length: int) -> memoryview:
+        """
+        Baca region yang belum terpakai tanpa memajukan kursor
+
+        Args:
+            offset: Offset region
+            length: Panjang region
+
+        Returns:
+            memoryview region pad
+        """
+        with self._lock:
+            self._check_region(offset, length)
+            return self._view[offset:offset + length]
+
+    def commit(self, offset: int, length: int):
+        """
+        Tandai region hasil peek() sebagai terpakai (kursor maju dan di-persist)
+
+        Raises:
+            ValueError: Jika region sudah terpakai (misalnya diklaim lebih dulu)
+        """
+        with self._lock:
+            self._check_region(offset, length)
+            self._persist_cursor(offset + length)
+
+    def wipe(self, offset: int, length: int):
+        """
+        Timpa region yang sudah dipakai dengan nol (jika wipe diaktifkan)
+
+        Args:
+            offset: Offset region
+            length: Panjang region
+        """
+        if not self.wipe_enabled or length <= 0:
+            return
+        end = offset + length
+        if offset < 0 or end > self.cursor:
+            raise ValueError("Hanya region yang sudah dipakai dapat di-wipe")
+        zeros = bytes(min(length, WIPE_CHUNK_SIZE))
+        for position in range(offset, end, len(zeros)):
+            n = min(len(zeros), end - position)
+            self._mmap[position:position + n] = zeros[:n]
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        self._mmap.flush(start, end - start)
+
+    def close(self):
+        """
+        Tutup mmap dan file pad
+
+        Semua memoryview region harus sudah dilepas (release()).
+        """
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
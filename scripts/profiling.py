@@ -0,0 +1,327 @@
+"""
+Profiling demo dan jalur API MAC/USAC
+
+Setiap target dijalankan sekali di bawah cProfile dan sampling profiler
+sekaligus, dengan pelacakan alokasi tracemalloc opsional. Hasil per
+target ditulis ke direktori output:
+
+    <nama>.prof        data pstats (snakeviz, gprof2dot, pstats)
+    <nama>.txt         fungsi teratas menurut waktu kumulatif cProfile
+    <nama>.collapsed   stack sampel format collapsed ('a;b;c jumlah'),
+                       siap untuk flamegraph.pl, speedscope, atau inferno
+    <nama>.alloc.txt   tabel alokasi per fungsi (jika track_memory)
+
+Sampling profiler memakai thread terpisah yang membaca stack thread
+target melalui sys._current_frames() pada interval wall-clock, sehingga
+waktu tunggu I/O (print ke terminal) ikut terlihat, bukan hanya waktu CPU.
+Karena sampler perlu GIL, interval efektif minimal sekitar
+sys.getswitchinterval().
+"""
+
+import ast
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_OUTPUT_DIR = 'profiles'
+DEFAULT_SAMPLE_INTERVAL = 0.005
+DEFAULT_TOP = 25
+# Kedalaman traceback tracemalloc; frame terdalam yang dipakai untuk atribusi
+TRACEMALLOC_FRAMES = 1
+# Alokasi milik sampler sendiri tidak dimasukkan ke tabel
+SAMPLER_LABEL = 'profiling.py:SamplingProfiler.'
+
+
+class SamplingProfiler:
+    """
+    Profiler sampling wall-clock untuk satu thread
+
+    Frame dicatat sebagai 'file:fungsi' dari akar ke daun, sehingga hasil
+    collapsed() dapat langsung diubah menjadi flame graph.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._labels: Dict[object, str] = {}
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{os.path.basename(code.co_filename)}:{name}"
+            self._labels[code] = label
+        return label
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        if stack:
+            self.samples[';'.join(reversed(stack))] += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        """Mulai sampling thread target (default thread pemanggil)"""
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Hentikan sampling"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def collapsed(self) -> str:
+        """Stack dalam format collapsed, diurutkan dari yang paling sering"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def self_time(self, top: int = DEFAULT_TOP) -> List[Tuple[str, int]]:
+        """Frame daun yang paling sering tersampel (self time)"""
+        leaves: Counter = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return leaves.most_common(top)
+
+
+class _FunctionIndex:
+    """Pemetaan (file, baris) -> nama fungsi yang memuat baris tersebut"""
+
+    def __init__(self):
+        self._ranges: Dict[str, List[Tuple[int, int, str]]] = {}
+
+    def _load(self, filename: str) -> List[Tuple[int, int, str]]:
+        ranges = []
+        try:
+            with open(filename, encoding='utf-8') as f:
+                tree = ast.parse(f.read(), filename)
+        except (OSError, SyntaxError, ValueError):
+            return ranges
+
+        def visit(node, prefix: str):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    name = prefix + child.name
+                    if not isinstance(child, ast.ClassDef):
+                        ranges.append((child.lineno, child.end_lineno, name))
+                    visit(child, name + '.')
+                else:
+                    visit(child, prefix)
+
+        visit(tree, '')
+        return ranges
+
+    def lookup(self, filename: str, lineno: int) -> str:
+        ranges = self._ranges.get(filename)
+        if ranges is None:
+            ranges = self._ranges[filename] = self._load(filename)
+        # Rentang terdalam = rentang terpendek yang memuat baris
+        best = None
+        for first, last, name in ranges:
+            if first <= lineno <= last and (best is None or last - first < best[1] - best[0]):
+                best = (first, last, name)
+        label = best[2] if best else '<module>'
+        return f"{os.path.basename(filename)}:{label}"
+
+
+def allocation_table(snapshot: tracemalloc.Snapshot,
+                     top: int = DEFAULT_TOP) -> List[dict]:
+    """
+    Kelompokkan alokasi tracemalloc per fungsi
+
+    Snapshot hanya memuat alokasi yang masih hidup saat diambil; puncak
+    memori selama eksekusi dilaporkan terpisah oleh profile_call.
+
+    Args:
+        snapshot: Snapshot tracemalloc (alokasi yang masih hidup)
+        top: Jumlah fungsi teratas menurut ukuran
+
+    Returns:
+        Daftar dictionary {function, size, count}, terbesar lebih dulu
+    """
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+    ])
+    index = _FunctionIndex()
+    totals: Dict[str, List[int]] = {}
+    for stat in snapshot.statistics('lineno'):
+        frame = stat.traceback[0]
+        name = index.lookup(frame.filename, frame.lineno)
+        if name.startswith(SAMPLER_LABEL):
+            continue
+        entry = totals.setdefault(name, [0, 0])
+        entry[0] += stat.size
+        entry[1] += stat.count
+    rows = [{'function': name, 'size': size, 'count': count}
+            for name, (size, count) in totals.items()]
+    rows.sort(key=lambda row: row['size'], reverse=True)
+    return rows[:top]
+
+
+def format_allocation_table(rows: List[dict], peak: int) -> str:
+    """Tabel alokasi per fungsi sebagai teks"""
+    lines = [f"Puncak memori terlacak: {peak / 1024:.1f} KiB",
+             f"{'fungsi':<60} {'KiB':>10} {'blok':>8}"]
+    for row in rows:
+        lines.append(f"{row['function']:<60} {row['size'] / 1024:>10.1f} {row['count']:>8}")
+    return '\n'.join(lines) + '\n'
+
+
+def profile_call(name: str, func: Callable[[], object],
+                 output_dir: str = DEFAULT_OUTPUT_DIR,
+                 interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 track_memory: bool = False, top: int = DEFAULT_TOP) -> dict:
+    """
+    Jalankan func di bawah cProfile, sampling profiler, dan tracemalloc
+
+    Args:
+        name: Nama target (dipakai sebagai nama file output)
+        func: Callable tanpa argumen yang diprofil
+        output_dir: Direktori file hasil
+        interval: Interval sampling dalam detik
+        track_memory: True untuk melacak alokasi dengan tracemalloc
+        top: Jumlah baris pada tabel teratas
+
+    Returns:
+        Dictionary ringkasan: waktu, jumlah sampel, path file, fungsi
+        teratas (self time sampel), dan tabel alokasi
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, name)
+    profiler = cProfile.Profile()
+    sampler = SamplingProfiler(interval)
+
+    if track_memory:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    start = time.perf_counter()
+    sampler.start()
+    profiler.enable()
+    try:
+        func()
+    finally:
+        profiler.disable()
+        sampler.stop()
+        elapsed = time.perf_counter() - start
+        if track_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    profiler.dump_stats(base + '.prof')
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(top)
+    with open(base + '.txt', 'w', encoding='utf-8') as f:
+        f.write(text.getvalue())
+    with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+        f.write(sampler.collapsed())
+
+    result = {
+        'name': name,
+        'seconds': elapsed,
+        'samples': sum(sampler.samples.values()),
+        'files': [base + '.prof', base + '.txt', base + '.collapsed'],
+        'self_time': sampler.self_time(top),
+        'allocations': None,
+    }
+    if track_memory:
+        rows = allocation_table(snapshot, top)
+        with open(base + '.alloc.txt', 'w', encoding='utf-8') as f:
+            f.write(format_allocation_table(rows, peak))
+        result['files'].append(base + '.alloc.txt')
+        result['allocations'] = rows
+        result['peak_memory'] = peak
+    return result
+
+
+def _api_mac():
+    from mac_implementation import MACImplementation
+    mac = MACImplementation()
+    key = mac.generate_key()
+    message = os.urandom(64 * 1024)
+    for _ in range(200):
+        mac.verify_mac(message, key, mac.compute_mac(message, key, raw=True))
+
+
+def _api_usac():
+    from usac_implementation import POLY_TAG_BITS, USACImplementation
+    usac = USACImplementation(tag_bits=POLY_TAG_BITS)
+    message = os.urandom(64 * 1024)
+    for _ in range(50):
+        key = usac.generate_one_time_key(usac.required_key_length(len(message)))
+        encoded, tag = usac.encode_message(message, key, raw=True)
+        usac.verify_authenticity(encoded, key, tag, len(message))
+        usac.decode_message(encoded, key[:len(message)], as_bytes=True)
+
+
+def _api_usac_loop():
+    from usac_implementation import USACImplementation
+    usac = USACImplementation(xor_backend='loop')
+    message = os.urandom(16 * 1024)
+    key = usac.generate_one_time_key(usac.required_key_length(len(message)))
+    encoded, _ = usac.encode_message(message, key)
+    usac.decode_message(encoded, key[:len(message)], as_bytes=True)
+
+
+def _api_keygen():
+    from mac_implementation import MACImplementation
+    from usac_implementation import USACImplementation
+    mac = MACImplementation()
+    usac = USACImplementation()
+    for _ in range(2000):
+        mac.generate_key()
+        usac.generate_one_time_key(1024)
+
+
+# Beban kerja API tanpa output, untuk dibandingkan dengan demo
+API_WORKLOADS = {
+    'api-mac': _api_mac,
+    'api-usac': _api_usac,
+    'api-usac-loop': _api_usac_loop,
+    'api-keygen': _api_keygen,
+}
+
+
+def print_summary(results: List[dict], top: int = 10):
+    """Cetak ringkasan hasil profiling ke stderr"""
+    out = sys.stderr
+    for result in results:
+        print(f"\n[{result['name']}] {result['seconds']:.3f} s, "
+              f"{result['samples']} sampel", file=out)
+        total = result['samples'] or 1
+        for label, count in result['self_time'][:top]:
+            print(f"  {count / total * 100:>5.1f}%  {label}", file=out)
+        if result['allocations'] is not None:
+            print(f"  puncak memori {result['peak_memory'] / 1024:.1f} KiB; "
+                  f"alokasi terbesar:", file=out)
+            for row in result['allocations'][:5]:
+                print(f"  {row['size'] / 1024:>8.1f} KiB  {row['function']}", file=out)
+        print(f"  file: {', '.join(result['files'])}", file=out)
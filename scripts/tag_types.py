@@ -0,0 +1,340 @@
+"""
+Representasi ringkas tag MAC dan envelope USAC
+
+MacTag menyimpan digest mentah beserta ID algoritma (bukan string hex yang
+dua kali lebih besar), UsacEnvelope menyimpan ciphertext, tag, lebar tag,
+dan panjang pesan asli dalam satu objek. Keduanya memakai __slots__ dan
+memiliki format biner tetap:
+
+    MacTag      : algorithm_id u8 | panjang u8 | digest
+    UsacEnvelope: MAGIC 'USE1' | tag_bits u8 | panjang u64 | tag | ciphertext
+
+TagArray menyimpan banyak tag dengan lebar sama dalam satu bytearray
+kontinu (tanpa objek per tag) dengan indeks nama -> slot opsional:
+
+    TagArray    : MAGIC 'MTA1' | algorithm_id u8 | tag_size u8 | jumlah u32
+                  | tag_0 ... tag_n-1 | (panjang_nama u16 | nama utf-8)*
+
+Panjang nama 0xFFFF menandai slot tanpa nama, sehingga nama dibatasi
+paling banyak MAX_NAME_BYTES bytes UTF-8.
+"""
+
+import hmac
+import struct
+from typing import Dict, Iterator, List, Optional, Union
+
+from buffer_utils import as_buffer
+
+# ID algoritma dalam format biner; jangan diubah (hanya ditambah)
+ALGORITHM_IDS = {
+    'md5': 1,
+    'sha1': 2,
+    'sha256': 3,
+    'sha512': 4,
+    'blake2b': 5,
+    'blake2s': 6,
+    'sha3_256': 7,
+    'sha3_512': 8,
+}
+ALGORITHM_NAMES = {value: name for name, value in ALGORITHM_IDS.items()}
+
+MAC_TAG_HEADER = struct.Struct('!BB')
+ENVELOPE_MAGIC = b'USE1'
+ENVELOPE_HEADER = struct.Struct('!4sBQ')
+TAG_ARRAY_MAGIC = b'MTA1'
+TAG_ARRAY_HEADER = struct.Struct('!4sBBI')
+NAME_LENGTH = struct.Struct('!H')
+NO_NAME = 0xFFFF
+MAX_NAME_BYTES = NO_NAME - 1
+
+
+def algorithm_id(algorithm: str) -> int:
+    """ID biner untuk nama algoritma MAC"""
+    try:
+        return ALGORITHM_IDS[algorithm]
+    except KeyError:
+        raise ValueError(f"Algoritma {algorithm} tidak memiliki ID biner") from None
+
+
+def algorithm_name(identifier: int) -> str:
+    """Nama algoritma MAC untuk ID biner"""
+    try:
+        return ALGORITHM_NAMES[identifier]
+    except KeyError:
+        raise ValueError(f"ID algoritma tidak dikenal: {identifier}") from None
+
+
+class MacTag:
+    """
+    Tag MAC dalam bentuk digest mentah beserta ID algoritmanya
+    """
+
+    __slots__ = ('algorithm_id', 'digest')
+
+    def __init__(self, algorithm: Union[str, int], digest: bytes):
+        self.algorithm_id = algorithm if isinstance(algorithm, int) else algorithm_id(algorithm)
+        self.digest = bytes(digest)
+        if not 0 < len(self.digest) <= 255:
+            raise ValueError("Panjang digest harus 1..255 bytes")
+
+    @property
+    def algorithm(self) -> str:
+        return algorithm_name(self.algorithm_id)
+
+    @classmethod
+    def from_hex(cls, algorithm: Union[str, int], text: str) -> 'MacTag':
+        """Buat MacTag dari tag hex lama"""
+        return cls(algorithm, bytes.fromhex(text))
+
+    def hex(self) -> str:
+        """Digest dalam format hexadecimal"""
+        return self.digest.hex()
+
+    def to_bytes(self) -> bytes:
+        """Serialisasi biner: algorithm_id u8 | panjang u8 | digest"""
+        return MAC_TAG_HEADER.pack(self.algorithm_id, len(self.digest)) + self.digest
+
+    @classmethod
+    def from_bytes(cls, data) -> 'MacTag':
+        """
+        Deserialisasi MacTag dari bytes hasil to_bytes
+
+        Raises:
+            ValueError: Jika data terpotong atau memiliki sisa
+        """
+        data = as_buffer(data)
+        if len(data) < MAC_TAG_HEADER.size:
+            raise ValueError("Data MacTag terpotong")
+        identifier, length = MAC_TAG_HEADER.unpack_from(data)
+        if len(data) != MAC_TAG_HEADER.size + length:
+            raise ValueError("Panjang MacTag tidak cocok")
+        algorithm_name(identifier)
+        return cls(identifier, data[MAC_TAG_HEADER.size:])
+
+    def matches(self, other: Union['MacTag', str, bytes]) -> bool:
+        """Bandingkan secara constant-time dengan MacTag, bytes, atau hex"""
+        if isinstance(other, MacTag):
+            if other.algorithm_id != self.algorithm_id:
+                return False
+            other = other.digest
+        elif isinstance(other, str):
+            return hmac.compare_digest(self.digest.hex(), other)
+        return hmac.compare_digest(self.digest, other)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MacTag):
+            return NotImplemented
+        return self.matches(other)
+
+    def __hash__(self) -> int:
+        return hash((self.algorithm_id, self.digest))
+
+    def __len__(self) -> int:
+        return len(self.digest)
+
+    def __repr__(self) -> str:
+        return f"MacTag({self.algorithm!r}, {self.digest.hex()!r})"
+
+
+class UsacEnvelope:
+    """
+    Hasil encode USAC: ciphertext, tag mentah, lebar tag, dan panjang asli
+    """
+
+    __slots__ = ('encoded', 'tag', 'tag_bits', 'original_length')
+
+    def __init__(self, encoded, tag: bytes, tag_bits: int,
+                 original_length: Optional[int] = None):
+        self.encoded = encoded
+        self.tag = bytes(tag)
+        self.tag_bits = tag_bits
+        self.original_length = len(encoded) if original_length is None else original_length
+        if len(self.tag) * 8 != tag_bits:
+            raise ValueError(f"Panjang tag tidak cocok dengan {tag_bits} bit")
+
+    def to_bytes(self) -> bytes:
+        """Serialisasi biner: MAGIC | tag_bits u8 | panjang u64 | tag | ciphertext"""
+        return b''.join((ENVELOPE_HEADER.pack(ENVELOPE_MAGIC, self.tag_bits,
+                                              self.original_length),
+                         self.tag, self.encoded))
+
+    @classmethod
+    def from_bytes(cls, data) -> 'UsacEnvelope':
+        """
+        Deserialisasi envelope; ciphertext berupa memoryview atas data
+
+        Raises:
+            ValueError: Jika header tidak dikenal atau data terpotong
+        """
+        view = memoryview(as_buffer(data))
+        if len(view) < ENVELOPE_HEADER.size:
+            raise ValueError("Data envelope terpotong")
+        magic, tag_bits, length = ENVELOPE_HEADER.unpack_from(view)
+        if magic != ENVELOPE_MAGIC:
+            raise ValueError("Header envelope tidak dikenal")
+        start = ENVELOPE_HEADER.size + tag_bits // 8
+        if len(view) != start + length:
+            raise ValueError("Panjang envelope tidak cocok")
+        return cls(view[start:], view[ENVELOPE_HEADER.size:start], tag_bits, length)
+
+    def __len__(self) -> int:
+        return self.original_length
+
+    def __repr__(self) -> str:
+        return (f"UsacEnvelope(length={self.original_length}, tag_bits={self.tag_bits}, "
+                f"tag={self.tag.hex()!r})")
+
+
+class TagArray:
+    """
+    Kontainer tag MAC berlebar tetap dalam satu bytearray kontinu
+
+    Slot i menempati bytes [i * tag_size, (i + 1) * tag_size). Nama slot
+    bersifat opsional; indeks nama -> slot disimpan dalam dictionary.
+    """
+
+    __slots__ = ('algorithm_id', 'tag_size', '_data', '_names', '_index')
+
+    def __init__(self, algorithm: Union[str, int], tag_size: int):
+        self.algorithm_id = algorithm if isinstance(algorithm, int) else algorithm_id(algorithm)
+        if not 0 < tag_size <= 255:
+            raise ValueError("tag_size harus 1..255 bytes")
+        self.tag_size = tag_size
+        self._data = bytearray()
+        self._names: List[Optional[str]] = []
+        self._index: Dict[str, int] = {}
+
+    @property
+    def algorithm(self) -> str:
+        return algorithm_name(self.algorithm_id)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def _digest(self, tag) -> bytes:
+        """Digest mentah dari MacTag, bytes, atau hex dengan lebar yang sesuai"""
+        if isinstance(tag, MacTag):
+            if tag.algorithm_id != self.algorithm_id:
+                raise ValueError(f"Tag {tag.algorithm} tidak cocok dengan {self.algorithm}")
+            tag = tag.digest
+        elif isinstance(tag, str):
+            tag = bytes.fromhex(tag)
+        if len(tag) != self.tag_size:
+            raise ValueError(f"Tag harus {self.tag_size} bytes")
+        return tag
+
+    def append(self, tag, name: Optional[str] = None) -> int:
+        """
+        Tambahkan tag ke akhir array
+
+        Args:
+            tag: MacTag, digest bytes, atau hex
+            name: Nama slot opsional (unik)
+
+        Returns:
+            Nomor slot
+
+        Raises:
+            ValueError: Jika tag tidak valid atau nama lebih dari
+                        MAX_NAME_BYTES bytes UTF-8
+            KeyError: Jika nama sudah ada
+        """
+        digest = self._digest(tag)
+        if name is not None and name in self._index:
+            raise KeyError(f"Nama sudah ada: {name}")
+        if name is not None and len(name.encode('utf-8')) > MAX_NAME_BYTES:
+            raise ValueError(f"Nama slot maksimal {MAX_NAME_BYTES} bytes UTF-8")
+        slot = len(self._names)
+        self._data += digest
+        self._names.append(name)
+        if name is not None:
+            self._index[name] = slot
+        return slot
+
+    def slot(self, key: Union[int, str]) -> int:
+        """Nomor slot untuk nama atau nomor slot"""
+        if isinstance(key, str):
+            return self._index[key]
+        if not 0 <= key < len(self._names):
+            raise IndexError(f"Slot {key} di luar jangkauan")
+        return key
+
+    def digest(self, key: Union[int, str]) -> bytes:
+        """Digest mentah pada slot atau nama"""
+        start = self.slot(key) * self.tag_size
+        return bytes(self._data[start:start + self.tag_size])
+
+    def __getitem__(self, key: Union[int, str]) -> MacTag:
+        return MacTag(self.algorithm_id, self.digest(key))
+
+    def __setitem__(self, key: Union[int, str], tag):
+        start = self.slot(key) * self.tag_size
+        self._data[start:start + self.tag_size] = self._digest(tag)
+
+    def verify(self, key: Union[int, str], received) -> bool:
+        """Bandingkan tag tersimpan dengan MacTag/bytes/hex secara constant-time"""
+        try:
+            received = self._digest(received)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self.digest(key), received)
+
+    def names(self) -> Iterator[Optional[str]]:
+        """Nama setiap slot sesuai urutan (None untuk slot tanpa nama)"""
+        return iter(self._names)
+
+    def to_bytes(self) -> bytes:
+        """Serialisasi biner (lihat docstring modul)"""
+        parts = [TAG_ARRAY_HEADER.pack(TAG_ARRAY_MAGIC, self.algorithm_id, self.tag_size,
+                                       len(self._names)),
+                 bytes(self._data)]
+        for name in self._names:
+            encoded = b'' if name is None else name.encode('utf-8')
+            parts.append(NAME_LENGTH.pack(NO_NAME if name is None else len(encoded)))
+            parts.append(encoded)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data) -> 'TagArray':
+        """
+        Deserialisasi TagArray dari bytes hasil to_bytes
+
+        Raises:
+            ValueError: Jika header atau ID algoritma tidak dikenal, atau data
+                        terpotong
+        """
+        view = memoryview(as_buffer(data))
+        if len(view) < TAG_ARRAY_HEADER.size:
+            raise ValueError("Data TagArray terpotong")
+        magic, identifier, tag_size, count = TAG_ARRAY_HEADER.unpack_from(view)
+        if magic != TAG_ARRAY_MAGIC:
+            raise ValueError("Header TagArray tidak dikenal")
+        algorithm_name(identifier)
+        array = cls(identifier, tag_size)
+        position = TAG_ARRAY_HEADER.size + count * tag_size
+        if len(view) < position:
+            raise ValueError("Data TagArray terpotong")
+        array._data = bytearray(view[TAG_ARRAY_HEADER.size:position])
+        for slot in range(count):
+            if len(view) < position + NAME_LENGTH.size:
+                raise ValueError("Data TagArray terpotong")
+            (length,) = NAME_LENGTH.unpack_from(view, position)
+            position += NAME_LENGTH.size
+            if length == NO_NAME:
+                array._names.append(None)
+                continue
+            if len(view) < position + length:
+                raise ValueError("Data TagArray terpotong")
+            name = bytes(view[position:position + length]).decode('utf-8')
+            position += length
+            array._names.append(name)
+            array._index[name] = slot
+        if position != len(view):
+            raise ValueError("Data tambahan setelah TagArray")
+        return array
+
+    def __repr__(self) -> str:
+        return f"TagArray({self.algorithm!r}, tag_size={self.tag_size}, count={len(self)})"
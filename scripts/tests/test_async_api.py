@@ -0,0 +1,132 @@
+"""Facade asyncio: inline vs executor, micro-batching, dan semaphore"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from async_api import AsyncMAC, AsyncUSAC
+from mac_implementation import MACImplementation
+
+KEY = b'k' * 32
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Executor yang mencatat jumlah tugas yang dikirim"""
+
+    def __init__(self, max_workers: int = 4):
+        super().__init__(max_workers=max_workers)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.fixture
+def executor():
+    pool = CountingExecutor()
+    yield pool
+    pool.shutdown()
+
+
+def test_small_inputs_inline_large_offloaded(executor):
+    mac = MACImplementation()
+    facade = AsyncMAC(mac, executor=executor, inline_threshold=1024)
+
+    async def run():
+        small = await facade.compute(b'x' * 100, KEY)
+        assert executor.submitted == 0
+        large = await facade.compute(b'y' * 4096, KEY)
+        assert executor.submitted == 1
+        return small, large
+
+    small, large = asyncio.run(run())
+    assert small == mac.compute_mac(b'x' * 100, KEY)
+    assert large == mac.compute_mac(b'y' * 4096, KEY)
+
+
+def _counting_batches(mac: MACImplementation) -> list:
+    """Catat ukuran setiap pemanggilan compute_mac_batch"""
+    calls = []
+    original = mac.compute_mac_batch
+
+    def compute_mac_batch(messages, *args, **kwargs):
+        calls.append(len(messages))
+        return original(messages, *args, **kwargs)
+
+    mac.compute_mac_batch = compute_mac_batch
+    return calls
+
+
+def test_concurrent_small_requests_are_batched(executor):
+    mac = MACImplementation()
+    calls = _counting_batches(mac)
+    facade = AsyncMAC(mac, executor=executor, batch_window=0.01, max_batch_size=8)
+    messages = [b'pesan %d' % i for i in range(20)]
+
+    async def run():
+        return await asyncio.gather(*(facade.compute(message, KEY) for message in messages))
+
+    assert asyncio.run(run()) == [mac.compute_mac(message, KEY) for message in messages]
+    assert calls == [8, 8, 4]
+    assert executor.submitted == 0
+
+
+def test_size_flush_cancels_batch_timer(executor):
+    mac = MACImplementation()
+    calls = _counting_batches(mac)
+    facade = AsyncMAC(mac, executor=executor, batch_window=0.2, max_batch_size=2)
+
+    async def run():
+        await asyncio.gather(facade.compute(b'a', KEY), facade.compute(b'b', KEY))
+        started = time.perf_counter()
+        # Timer batch pertama tidak boleh mem-flush batch kedua lebih awal
+        await asyncio.sleep(0.1)
+        await facade.compute(b'c', KEY)
+        return time.perf_counter() - started
+
+    assert asyncio.run(run()) >= 0.25
+    assert calls == [2, 1]
+
+
+def test_large_batch_is_offloaded(executor):
+    mac = MACImplementation()
+    facade = AsyncMAC(mac, executor=executor, inline_threshold=1024,
+                      batch_window=0.01, max_batch_size=4)
+    messages = [bytes([i]) * 1000 for i in range(4)]
+
+    async def run():
+        return await asyncio.gather(*(facade.compute(message, KEY) for message in messages))
+
+    assert asyncio.run(run()) == [mac.compute_mac(message, KEY) for message in messages]
+    assert executor.submitted == 1
+
+
+def test_semaphore_bounds_executor_concurrency(executor):
+    facade = AsyncUSAC(executor=executor, max_concurrency=2, inline_threshold=1)
+    active = []
+    peak = []
+    lock = threading.Lock()
+    original = facade.usac.encode_message
+
+    def encode_message(*args):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return original(*args)
+
+    facade.usac.encode_message = encode_message
+    key = facade.usac.generate_one_time_key(facade.usac.required_key_length(16))
+
+    async def run():
+        await asyncio.gather(*(facade.encode(b'x' * 16, key) for _ in range(8)))
+
+    asyncio.run(run())
+    assert executor.submitted == 8
+    assert max(peak) == 2
@@ -0,0 +1,30 @@
+"""Simulasi brute force: kunci kecil ditemukan dan pencarian berhenti"""
+
+import hmac
+import threading
+
+import pytest
+
+from attack_simulation import candidate_key, search_range, simulate_bruteforce
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_bruteforce_finds_small_keys(workers):
+    result = simulate_bruteforce(key_bits=12, workers=workers, slice_size=1 << 10,
+                                 max_seconds=60)
+    assert result['found']
+    assert result['attempts'] <= result['keyspace']
+
+
+def test_search_range_honours_stop_event():
+    target = hmac.digest(candidate_key(5000), b'pesan', 'sha256')
+    stop = threading.Event()
+    stop.set()
+    assert search_range(b'pesan', target, 'sha256', 32, 0, 1 << 16, float('inf'),
+                        stop) == (None, 0, pytest.approx(0, abs=1))
+
+    stop.clear()
+    counter, attempts, _ = search_range(b'pesan', target, 'sha256', 32, 0, 1 << 16,
+                                        float('inf'), stop)
+    assert (counter, attempts) == (5000, 5001)
+    assert stop.is_set()
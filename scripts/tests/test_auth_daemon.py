@@ -0,0 +1,163 @@
+"""AuthDaemon: protokol pipelined, handle kunci, operasi pad, dan akses"""
+
+import asyncio
+import os
+import socket
+import stat
+import threading
+
+import pytest
+
+from auth_daemon import (OFFSET_TAG, OP_USAC_DECODE, AuthClient, AuthDaemon, DaemonError,
+                         parse_address)
+from pad_store import PadStore
+
+
+class RunningDaemon:
+    """AuthDaemon yang berjalan di event loop thread terpisah"""
+
+    def __init__(self, daemon: AuthDaemon, address: str):
+        self.address = address
+        self.loop = asyncio.new_event_loop()
+        self._stop = self.loop.create_future()
+        started = threading.Event()
+        errors = []
+
+        async def run():
+            try:
+                server = await daemon.start(address)
+            except Exception as error:
+                errors.append(error)
+                return
+            finally:
+                started.set()
+            async with server:
+                await self._stop
+
+        self._thread = threading.Thread(target=self.loop.run_until_complete, args=(run(),),
+                                        daemon=True)
+        self._thread.start()
+        assert started.wait(10)
+        if errors:
+            self._thread.join(10)
+            self.loop.close()
+            raise errors[0]
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join(10)
+        self.loop.close()
+
+
+@pytest.fixture
+def pads(tmp_path):
+    pad_path = PadStore.create(str(tmp_path / 'pad.bin'), 1024 * 1024)
+    send_pad = PadStore(pad_path, cursor_path=pad_path + '.send')
+    recv_pad = PadStore(pad_path, cursor_path=pad_path + '.recv')
+    yield send_pad, recv_pad
+    send_pad.close()
+    recv_pad.close()
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / 'auth.sock')
+
+
+@pytest.fixture
+def client(pads, socket_path):
+    running = RunningDaemon(AuthDaemon(send_pad=pads[0], recv_pad=pads[1], max_keys=4),
+                            f"unix:{socket_path}")
+    client = AuthClient(running.address, timeout=10)
+    yield client
+    client.close()
+    running.stop()
+
+
+def test_mac_round_trip(client):
+    key_id = client.register_key(b'k' * 32)
+    tags = client.compute_mac_many(key_id, [b'satu', b'dua', b'tiga'])
+    assert len(set(tags)) == 3
+    assert client.verify_mac(key_id, b'dua', tags[1])
+    assert not client.verify_mac(key_id, b'dua', tags[0])
+
+
+def test_key_handles_are_random_per_registration(client):
+    first = client.register_key(b'k' * 32)
+    second = client.register_key(b'k' * 32)
+    assert len(first) == 16 and first != second
+    with pytest.raises(DaemonError):
+        client.compute_mac(os.urandom(16), b'pesan')
+
+
+def test_registered_keys_are_capped_and_can_be_unregistered(client):
+    key_ids = [client.register_key(os.urandom(32)) for _ in range(4)]
+    with pytest.raises(DaemonError):
+        client.register_key(os.urandom(32))
+    assert client.unregister_key(key_ids[0])
+    assert not client.unregister_key(key_ids[0])
+    with pytest.raises(DaemonError):
+        client.compute_mac(key_ids[0], b'pesan')
+    client.register_key(os.urandom(32))
+
+
+def test_pipelined_usac_decodes_are_serialized(client):
+    messages = [os.urandom(20000) for _ in range(30)]
+    encoded = [client.usac_encode(message) for message in messages]
+    requests = [(OP_USAC_DECODE, OFFSET_TAG.pack(offset, len(tag)) + tag + data)
+                for offset, data, tag in encoded]
+    assert client.pipeline(requests) == messages
+    offset, data, tag = encoded[0]
+    with pytest.raises(DaemonError):
+        client.usac_decode(offset, data, tag)
+
+
+def test_unix_socket_is_private(client, socket_path):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_tcp_requires_secret_handshake():
+    with pytest.raises(ValueError):
+        RunningDaemon(AuthDaemon(), '127.0.0.1:0')
+
+    probe = socket.socket()
+    probe.bind(('127.0.0.1', 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    address = f'127.0.0.1:{port}'
+    running = RunningDaemon(AuthDaemon(secret=b'rahasia'), address)
+    try:
+        with AuthClient(address, timeout=10, secret=b'rahasia') as client:
+            client.ping()
+        with AuthClient(address, timeout=10, secret=b'salah') as client:
+            with pytest.raises(ConnectionError):
+                client.ping()
+    finally:
+        running.stop()
+
+
+def test_remote_addresses_need_opt_in():
+    assert parse_address('127.0.0.1:7000')[1] == ('127.0.0.1', 7000)
+    with pytest.raises(ValueError):
+        parse_address('0.0.0.0:7000')
+    assert parse_address('0.0.0.0:7000', allow_remote=True)[1] == ('0.0.0.0', 7000)
+
+
+def test_start_refuses_to_replace_non_socket(tmp_path):
+    path = tmp_path / 'bukan-socket'
+    path.write_bytes(b'data penting')
+    with pytest.raises(FileExistsError):
+        RunningDaemon(AuthDaemon(), f"unix:{path}")
+    assert path.read_bytes() == b'data penting'
+
+
+def test_start_replaces_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX)
+    stale.bind(socket_path)
+    stale.close()
+    running = RunningDaemon(AuthDaemon(), f"unix:{socket_path}")
+    try:
+        with AuthClient(running.address, timeout=10) as client:
+            client.ping()
+    finally:
+        running.stop()
@@ -0,0 +1,19 @@
+"""Suite benchmark: target dan pengukuran (user-011)"""
+
+import benchmark
+
+
+def test_usac_targets_cover_poly_tag_widths():
+    names = {name for name, _, _ in benchmark._usac_targets([16])}
+    for bits in benchmark.POLY_TAG_WIDTHS:
+        assert {f'usac-encode-poly{bits}', f'usac-verify-poly{bits}'} <= names
+    assert 'usac-verify' in names
+
+
+def test_run_suite_measures_selected_targets():
+    report = benchmark.run_suite([64], warmup=1, repeat=3, max_seconds=1.0,
+                                 targets=['mac-', 'usac-verify-poly64'])
+    names = [result['name'] for result in report['results']]
+    assert 'usac-verify-poly64' in names
+    assert all(name.startswith(('mac-', 'usac-verify-poly64')) for name in names)
+    assert all(result['size'] == 64 for result in report['results'])
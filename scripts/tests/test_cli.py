@@ -0,0 +1,101 @@
+"""CLI bulk: tag/verify sidecar/manifest dan round trip usac-encode/usac-decode"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import cli
+from pad_store import PadStore
+
+
+def _tree(root):
+    return {os.path.relpath(os.path.join(directory, name), root):
+            open(os.path.join(directory, name), 'rb').read()
+            for directory, _, names in os.walk(root) for name in names}
+
+
+def test_tag_and_verify_sidecars(tmp_path, capsys):
+    key_file = tmp_path / 'key'
+    key_file.write_bytes(os.urandom(32))
+    data = tmp_path / 'data'
+    data.mkdir()
+    (data / 'a.txt').write_bytes(b'satu')
+    (data / 'b.txt').write_bytes(b'dua')
+    common = ['--key-file', str(key_file)]
+    assert cli.main(['tag', str(data), '--sidecar'] + common) == 0
+    targets = [str(data / 'a.txt'), str(data / 'b.txt')]
+    assert cli.main(['verify'] + targets + common) == 0
+    (data / 'b.txt').write_bytes(b'tiga')
+    assert cli.main(['verify'] + targets + common) == 1
+    capsys.readouterr()
+
+
+def test_usac_directory_round_trip(tmp_path):
+    source = tmp_path / 'source'
+    (source / 'sub').mkdir(parents=True)
+    (source / 'a.bin').write_bytes(os.urandom(200000))
+    (source / 'sub' / 'b.bin').write_bytes(b'')
+    send_pad = PadStore.create(str(tmp_path / 'send.pad'), 1024 * 1024)
+    recv_pad = str(tmp_path / 'recv.pad')
+    shutil.copyfile(send_pad, recv_pad)
+
+    encoded, restored = tmp_path / 'encoded', tmp_path / 'restored'
+    assert cli.main(['usac-encode', str(source), '--pad', send_pad,
+                     '-o', str(encoded), '--frame-size', '65536']) == 0
+    # Lebar tag ditentukan penerima, bukan header stream
+    assert cli.main(['usac-decode', str(encoded), '--pad', recv_pad,
+                     '-o', str(tmp_path / 'wrong'), '--tag-bits', '32']) == 1
+    # Decode gagal tidak meninggalkan output parsial maupun file sementara
+    assert _tree(tmp_path / 'wrong') == {}
+    assert cli.main(['usac-decode', str(encoded), '--pad', recv_pad,
+                     '-o', str(restored)]) == 0
+    assert _tree(restored) == _tree(source)
+
+
+@pytest.fixture
+def key_file(tmp_path):
+    path = tmp_path / 'key'
+    path.write_bytes(os.urandom(32))
+    return path
+
+
+def test_malformed_manifest_reports_line(tmp_path, key_file, capsys):
+    manifest = tmp_path / 'manifest'
+    manifest.write_text('# algorithm: sha256\nabcd  a.txt\nrusak\n', encoding='utf-8')
+    assert cli.main(['verify', '--manifest', str(manifest),
+                     '--key-file', str(key_file)]) == 2
+    assert 'Baris 3' in capsys.readouterr().err
+
+
+def test_non_ascii_tag_marks_file_failed(tmp_path, key_file, capsys):
+    target = tmp_path / 'a.txt'
+    target.write_bytes(b'isi')
+    bad = tmp_path / 'b.txt'
+    bad.write_bytes(b'isi')
+    common = ['--key-file', str(key_file)]
+    assert cli.main(['tag', str(target), str(bad), '--sidecar'] + common) == 0
+    (tmp_path / 'b.txt.mac').write_text('\u00e9\u00e9  b.txt\n', encoding='utf-8')
+    assert cli.main(['verify', str(target), str(bad), '--json'] + common) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [failure['path'] for failure in report['failures']] == [str(bad)]
+
+
+def test_failed_decode_leaves_no_output(tmp_path):
+    source = tmp_path / 'data.bin'
+    source.write_bytes(os.urandom(3 * 65536))
+    send_pad = PadStore.create(str(tmp_path / 'send.pad'), 1024 * 1024)
+    recv_pad = str(tmp_path / 'recv.pad')
+    shutil.copyfile(send_pad, recv_pad)
+    encoded = tmp_path / 'data.usf'
+    assert cli.main(['usac-encode', str(source), '--pad', send_pad,
+                     '-o', str(encoded), '--frame-size', '65536']) == 0
+    frames = bytearray(encoded.read_bytes())
+    frames[-40] ^= 1
+    encoded.write_bytes(bytes(frames))
+    output = tmp_path / 'restored.bin'
+    assert cli.main(['usac-decode', str(encoded), '--pad', recv_pad,
+                     '-o', str(output)]) == 1
+    assert not output.exists()
+    assert not (tmp_path / 'restored.bin.tmp').exists()
@@ -0,0 +1,12 @@
+"""Estimasi peluang pemalsuan tag"""
+
+import pytest
+
+
+@pytest.mark.parametrize('tag_bits', [1, 4])
+def test_reference_tag_guess_matches_theory(tag_bits):
+    pytest.importorskip('numpy')
+    from forgery_analysis import estimate
+
+    result = estimate('reference', 'tag_guess', trials=4000, tag_bits=tag_bits, seed=1)
+    assert result['ci_low'] <= 2.0 ** -tag_bits <= result['ci_high']
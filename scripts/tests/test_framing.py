@@ -0,0 +1,90 @@
+"""Format USAC berbingkai: round trip, tamper, truncation, downgrade, replay"""
+
+import os
+
+import pytest
+
+from usac_framing import (STREAM_HEADER, BufferPad, FrameAuthenticationError,
+                          decode_stream, encode_stream)
+from usac_implementation import POLY_TAG_BITS, USACImplementation
+
+FRAME_SIZE = 1000
+
+
+@pytest.fixture
+def usac():
+    return USACImplementation(tag_bits=POLY_TAG_BITS)
+
+
+@pytest.fixture
+def key():
+    return os.urandom(64 * 1024)
+
+
+def _encode(message: bytes, key: bytes, usac) -> list:
+    chunks = [message[i:i + 700] for i in range(0, len(message), 700)]
+    return list(encode_stream(chunks, BufferPad(key), usac, frame_size=FRAME_SIZE))
+
+
+def _decode(frames, key: bytes, usac, pad=None) -> bytes:
+    return b''.join(decode_stream(frames, pad or BufferPad(key), usac))
+
+
+@pytest.mark.parametrize('length', [0, 1, FRAME_SIZE, 5 * FRAME_SIZE + 17])
+def test_round_trip(usac, key, length):
+    message = os.urandom(length)
+    frames = _encode(message, key, usac)
+    assert _decode(frames, key, usac) == message
+    # Ukuran potongan input decoder bebas
+    data = b''.join(frames)
+    assert _decode((data[i:i + 333] for i in range(0, len(data), 333)), key, usac) == message
+
+
+def test_tampered_frame_rejected_before_release(usac, key):
+    frames = _encode(os.urandom(3 * FRAME_SIZE), key, usac)
+    tampered = bytearray(frames[2])
+    tampered[-20] ^= 1
+    frames[2] = bytes(tampered)
+    pad = BufferPad(key)
+    released = []
+    with pytest.raises(FrameAuthenticationError):
+        for plaintext in decode_stream(frames, pad, usac):
+            released.append(plaintext)
+    assert len(released) == 1
+
+
+@pytest.mark.parametrize('drop', ['final', 'middle'])
+def test_truncation_and_reordering_detected(usac, key, drop):
+    frames = _encode(os.urandom(3 * FRAME_SIZE), key, usac)
+    del frames[-1 if drop == 'final' else 2]
+    with pytest.raises(FrameAuthenticationError):
+        _decode(frames, key, usac)
+
+
+def test_tag_width_comes_from_caller_not_header(usac, key):
+    frames = _encode(b'data', key, usac)
+    magic, version, _, frame_size, offset = STREAM_HEADER.unpack(frames[0])
+    frames[0] = STREAM_HEADER.pack(magic, version, 32, frame_size, offset)
+    with pytest.raises(FrameAuthenticationError):
+        _decode(frames, key, usac)
+    with pytest.raises(FrameAuthenticationError):
+        _decode(_encode(b'data', key, usac), key, USACImplementation(tag_bits=32))
+
+
+def test_forged_frame_does_not_advance_pad(usac, key):
+    frames = _encode(os.urandom(2 * FRAME_SIZE), key, usac)
+    forged = bytearray(frames[1])
+    forged[-1] ^= 1
+    pad = BufferPad(key)
+    with pytest.raises(FrameAuthenticationError):
+        _decode([frames[0], bytes(forged)] + frames[2:], key, usac, pad)
+    assert pad.cursor == 0
+    assert len(_decode(frames, key, usac, pad)) == 2 * FRAME_SIZE
+
+
+def test_replay_rejected(usac, key):
+    frames = _encode(b'sekali saja', key, usac)
+    pad = BufferPad(key)
+    assert _decode(frames, key, usac, pad) == b'sekali saja'
+    with pytest.raises(FrameAuthenticationError):
+        _decode(frames, key, usac, pad)
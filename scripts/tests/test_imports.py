@@ -0,0 +1,13 @@
+"""Import library tanpa efek samping (user-012)"""
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize('module', main.LIBRARY_MODULES)
+def test_library_import_has_no_side_effects(module):
+    report = main.import_report(module)
+    assert report['ok'], report['error']
+    assert report['stdout'] == ''
+    assert report['heavy'] == []
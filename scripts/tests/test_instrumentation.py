@@ -0,0 +1,54 @@
+"""Instrumentasi: histogram, argumen keyword, dan enable/disable"""
+
+import pytest
+
+import instrumentation
+from instrumentation import LatencyHistogram, MetricsRegistry
+from mac_implementation import MACImplementation
+from usac_implementation import USACImplementation
+
+
+@pytest.fixture
+def registry():
+    target = MetricsRegistry()
+    instrumentation.enable(target)
+    yield target
+    instrumentation.disable()
+
+
+def test_histogram_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+    for fraction in (0.5, 0.9, 0.99):
+        exact = fraction * 10000 * 1000
+        assert abs(histogram.percentile(fraction) - exact) <= exact / instrumentation.SUB_BUCKETS
+
+
+def test_keyword_arguments_are_counted(registry):
+    mac = MACImplementation()
+    key = mac.generate_key(length=48)
+    mac.generate_key()
+    mac.compute_mac(message=b'a' * 100, key=key)
+    mac.bind(key).stream().update(b'b' * 7).verify('00')
+    usac = USACImplementation()
+    usac.generate_one_time_key(length=21)
+    stats = registry.snapshot()
+    assert stats['mac.keygen']['bytes'] == 48 + 32
+    assert stats['mac.compute']['bytes'] == 100
+    assert stats['mac.context.compute']['bytes'] == 100
+    assert stats['mac.stream.update']['bytes'] == 7
+    assert stats['mac.stream.verify']['count'] == 1
+    assert stats['usac.keygen']['bytes'] == 21
+
+
+def test_errors_recorded_and_disable_restores(registry):
+    usac = USACImplementation()
+    with pytest.raises(ValueError):
+        usac.encode_message(b'abc', b'k')
+    assert registry.snapshot()['usac.encode']['errors'] == 1
+    assert hasattr(MACImplementation.compute_mac, '__wrapped__')
+    instrumentation.disable()
+    assert not instrumentation.is_enabled()
+    assert not hasattr(MACImplementation.compute_mac, '__wrapped__')
+    assert 'crypto_errors_total{operation="usac.encode"} 1' in registry.export_prometheus()
@@ -0,0 +1,64 @@
+"""IntegrityIndex: scan inkremental, deteksi korupsi, dan algoritma indeks"""
+
+import os
+
+import pytest
+
+from integrity_index import (STATUS_CORRUPT, STATUS_MISSING, STATUS_MODIFIED, STATUS_NEW,
+                             STATUS_OK, STATUS_UNCHANGED, AlgorithmMismatchError,
+                             IntegrityIndex)
+
+KEY = b'k' * 32
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = []
+    for name in ('a.bin', 'b.bin', 'c.bin'):
+        path = tmp_path / name
+        path.write_bytes(os.urandom(10000))
+        paths.append(str(path))
+    return paths
+
+
+def _statuses(index, **kwargs):
+    return {os.path.basename(result['path']): result['status']
+            for result in index.scan(**kwargs)}
+
+
+def test_scan_reports_changes(tmp_path, files):
+    with IntegrityIndex(str(tmp_path / 'index.db'), KEY, chunk_size=4096) as index:
+        index.add(files)
+        assert set(_statuses(index).values()) == {STATUS_UNCHANGED}
+        assert set(_statuses(index, full=True).values()) == {STATUS_OK}
+
+        # Isi berubah tanpa perubahan ukuran/mtime: hanya terdeteksi oleh scan penuh
+        stat = os.stat(files[0])
+        with open(files[0], 'r+b') as f:
+            f.seek(5000)
+            f.write(b'\xff')
+        os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        with open(files[1], 'ab') as f:
+            f.write(b'tambahan')
+        os.remove(files[2])
+
+        assert _statuses(index) == {'a.bin': STATUS_UNCHANGED, 'b.bin': STATUS_MODIFIED,
+                                    'c.bin': STATUS_MISSING}
+        results = {os.path.basename(result['path']): result
+                   for result in index.scan(full=True)}
+        assert results['a.bin']['status'] == STATUS_CORRUPT
+        assert results['a.bin']['changed_chunks'] == [1]
+
+        new = tmp_path / 'd.bin'
+        new.write_bytes(b'baru')
+        assert _statuses(index, paths=[str(new)], update=True) == {'d.bin': STATUS_NEW}
+        assert _statuses(index, paths=[str(new)], full=True) == {'d.bin': STATUS_OK}
+
+
+def test_algorithm_mismatch_is_rejected(tmp_path, files):
+    db_path = str(tmp_path / 'index.db')
+    with IntegrityIndex(db_path, KEY) as index:
+        index.add(files)
+    with IntegrityIndex(db_path, KEY, algorithm='blake2b') as index:
+        with pytest.raises(AlgorithmMismatchError):
+            list(index.scan(full=True))
@@ -0,0 +1,40 @@
+"""KeyPool: materi tidak pernah berulang dan jalur request tidak menunggu"""
+
+import threading
+
+from key_pool import KeyPool
+from usac_implementation import USACImplementation
+
+
+def _counter_entropy():
+    counter = iter(range(1 << 30))
+
+    def entropy(length: int) -> bytes:
+        return b''.join(next(counter).to_bytes(4, 'big') for _ in range(length // 4))
+    return entropy
+
+
+def test_material_never_repeats():
+    with KeyPool(capacity=1024, refill_chunk=256, entropy=_counter_entropy()) as pool:
+        taken = b''.join(pool.take(64, timeout=5) for _ in range(40))
+    words = [taken[i:i + 4] for i in range(0, len(taken), 4)]
+    assert len(set(words)) == len(words)
+
+
+def test_stalled_pool_falls_back_to_direct_draw():
+    # Tanpa thread pengisi pool tidak pernah terisi: encode tidak boleh menunggu
+    pool = KeyPool(capacity=1024, entropy=_counter_entropy(), start=False)
+    usac = USACImplementation(key_pool=pool)
+    result = {}
+
+    def encode():
+        key = usac.generate_one_time_key(usac.required_key_length(64))
+        result['tag'] = usac.encode_message(b'x' * 64, key)[1]
+
+    thread = threading.Thread(target=encode, daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive() and 'tag' in result
+    metrics = pool.metrics()
+    assert (metrics['stalls'], metrics['direct_draws'], metrics['bytes_served']) == (1, 1, 0)
+    pool.close()
@@ -0,0 +1,53 @@
+"""KeyRing: rotasi berversi, retensi, pencabutan, dan isolasi tenant"""
+
+import pytest
+
+from key_ring import KeyRing, parse_tag
+
+
+def test_rotation_keeps_retained_versions():
+    ring = KeyRing(retain=1)
+    ring.add_key('tenant-a', b'k1' * 16)
+    old_tag = ring.compute_mac('tenant-a', b'pesan')
+    ring.rotate('tenant-a')
+    new_tag = ring.compute_mac('tenant-a', b'pesan')
+    assert parse_tag(new_tag)[1] == 2
+    assert ring.verify_mac(b'pesan', old_tag) and ring.verify_mac(b'pesan', new_tag)
+
+    ring.rotate('tenant-a')
+    assert ring.versions('tenant-a') == [2, 3]
+    assert not ring.verify_mac(b'pesan', old_tag)
+    assert ring.verify_mac(b'pesan', new_tag)
+
+
+def test_version_gap_does_not_drop_previous_key():
+    ring = KeyRing(retain=1)
+    ring.add_key('tenant-a', b'k1' * 16, version=1)
+    tag = ring.compute_mac('tenant-a', b'pesan')
+    ring.add_key('tenant-a', b'k10' * 11, version=10)
+    assert ring.versions('tenant-a') == [1, 10]
+    assert ring.verify_mac(b'pesan', tag)
+    with pytest.raises(ValueError):
+        ring.add_key('tenant-a', b'k' * 32, version=10)
+
+
+def test_tag_bound_to_key_id_and_message():
+    ring = KeyRing()
+    ring.add_key('a', b'x' * 32)
+    ring.add_key('b', b'x' * 32)
+    tag = ring.compute_mac('a', b'pesan', raw=True)
+    assert not ring.verify_mac(b'pesan lain', tag)
+    # Prefix ikut di-MAC: mengganti key ID dengan kunci sama tetap ditolak
+    moved = bytes([1]) + b'b' + tag[2:]
+    assert not ring.verify_mac(b'pesan', moved)
+    assert not ring.verify_mac(b'pesan', b'\x05ab')
+
+
+def test_revoke():
+    ring = KeyRing()
+    ring.add_key('a', b'x' * 32)
+    tag = ring.compute_mac('a', b'pesan')
+    assert ring.revoke('a', 1)
+    assert not ring.verify_mac(b'pesan', tag)
+    with pytest.raises(KeyError):
+        ring.compute_mac('a', b'pesan')
@@ -0,0 +1,85 @@
+"""MACImplementation: BLAKE2, SHA-3 bergaya KMAC, tag terpotong, dan 'auto'"""
+
+import hashlib
+import hmac
+
+import pytest
+
+import mac_autoselect
+from mac_implementation import (ALGORITHM_SECURITY_BITS, MACImplementation,
+                                _kmac_prefix)
+
+MESSAGE = b'pesan uji algoritma MAC' * 50
+
+
+@pytest.mark.parametrize('algorithm', ['blake2b', 'blake2s'])
+def test_blake2_uses_native_keyed_mode(algorithm):
+    mac = MACImplementation(algorithm)
+    key = mac.generate_key(32)
+    expected = getattr(hashlib, algorithm)(MESSAGE, key=key).hexdigest()
+    assert mac.compute_mac(MESSAGE, key) == expected
+    assert mac.verify_mac(MESSAGE, key, expected)
+    assert not mac.verify_mac(MESSAGE + b'!', key, expected)
+
+
+@pytest.mark.parametrize('algorithm', ['sha3_256', 'sha3_512'])
+def test_sha3_uses_kmac_style_key_prefix(algorithm):
+    mac = MACImplementation(algorithm)
+    key = mac.generate_key(32)
+    digest = getattr(hashlib, algorithm)
+    expected = digest(_kmac_prefix(key, digest().block_size) + MESSAGE).hexdigest()
+    assert mac.compute_mac(MESSAGE, key) == expected
+    assert mac.compute_mac_stream([MESSAGE[:7], MESSAGE[7:]], key) == expected
+    assert not mac.verify_mac(MESSAGE, mac.generate_key(32), expected)
+
+
+def test_hmac_matches_stdlib():
+    mac = MACImplementation('sha512')
+    key = mac.generate_key(200)
+    assert mac.compute_mac(MESSAGE, key) == hmac.new(key, MESSAGE, 'sha512').hexdigest()
+
+
+@pytest.mark.parametrize('algorithm', ['sha256', 'blake2b', 'sha3_256'])
+def test_truncated_tags(algorithm):
+    mac = MACImplementation(algorithm, tag_bits=64)
+    key = mac.generate_key()
+    tag = mac.compute_mac(MESSAGE, key, raw=True)
+    assert len(tag) == 8
+    assert mac.security_bits == 64
+    assert mac.verify_mac(MESSAGE, key, tag)
+    assert not mac.verify_mac(MESSAGE, key, bytes([tag[0] ^ 1]) + tag[1:])
+    assert mac.compute_mac_stream([MESSAGE], key) == tag.hex()
+    if algorithm == 'sha256':
+        full = MACImplementation(algorithm).compute_mac(MESSAGE, key, raw=True)
+        assert full[:8] == tag
+
+
+@pytest.mark.parametrize('tag_bits', [32, 68, 264])
+def test_invalid_tag_bits_rejected(tag_bits):
+    with pytest.raises(ValueError):
+        MACImplementation('sha256', tag_bits=tag_bits)
+
+
+def test_auto_selects_eligible_algorithm(tmp_path, monkeypatch):
+    monkeypatch.setenv(mac_autoselect.CACHE_ENV, str(tmp_path / 'autoselect.json'))
+    monkeypatch.setattr(mac_autoselect, '_selected', {})
+    mac = MACImplementation('auto', security_bits=256)
+    assert ALGORITHM_SECURITY_BITS[mac.algorithm] >= 256
+    assert mac.security_bits >= 256
+    assert (tmp_path / 'autoselect.json').exists()
+    key = mac.generate_key()
+    tag = mac.compute_mac(MESSAGE, key)
+    assert MACImplementation(mac.algorithm).verify_mac(MESSAGE, key, tag)
+
+
+def test_auto_rejects_tag_shorter_than_security_level():
+    with pytest.raises(ValueError):
+        MACImplementation('auto', tag_bits=64, security_bits=128)
+
+
+def test_auto_with_sufficient_tag(tmp_path, monkeypatch):
+    monkeypatch.setenv(mac_autoselect.CACHE_ENV, str(tmp_path / 'autoselect.json'))
+    monkeypatch.setattr(mac_autoselect, '_selected', {})
+    mac = MACImplementation('auto', tag_bits=128, security_bits=128)
+    assert mac.security_bits == 128
+    assert len(mac.compute_mac(MESSAGE, mac.generate_key(), raw=True)) == 16
@@ -0,0 +1,76 @@
+"""MACImplementation: stream, input buffer, batch, dan cache konteks"""
+
+import io
+import os
+import threading
+
+from mac_implementation import MACImplementation
+
+
+def test_stream_matches_one_shot(tmp_path):
+    mac = MACImplementation()
+    key = mac.generate_key()
+    message = bytes(range(256)) * 1000
+    chunks = [message[i:i + 4096] for i in range(0, len(message), 4096)]
+    expected = mac.compute_mac(message, key)
+    assert mac.compute_mac_stream(chunks, key) == expected
+    assert mac.compute_mac_file(io.BytesIO(message), key) == expected
+    path = tmp_path / 'data.bin'
+    path.write_bytes(message)
+    assert mac.verify_mac_file(str(path), key, expected)
+    stream = mac.new_stream(key)
+    for chunk in chunks:
+        stream.update(chunk)
+    assert stream.bytes_processed == len(message)
+    assert stream.verify(expected)
+
+
+def test_buffer_inputs_and_raw_tags():
+    mac = MACImplementation()
+    key = mac.generate_key()
+    message = os.urandom(1000)
+    expected = mac.compute_mac(message, key)
+    for view in (bytearray(message), memoryview(message)):
+        assert mac.compute_mac(view, key) == expected
+    raw = mac.compute_mac(message, key, raw=True)
+    assert raw.hex() == expected
+    assert mac.verify_mac(memoryview(message), key, raw)
+    assert mac.compute_mac('teks', key) == mac.compute_mac(b'teks', key)
+
+
+def test_batch_matches_single():
+    mac = MACImplementation()
+    key = mac.generate_key()
+    messages = [b'pesan %d' % i for i in range(50)]
+    tags = mac.compute_mac_batch(messages, key, max_workers=4)
+    assert tags == [mac.compute_mac(message, key) for message in messages]
+    tags[3] = '00' * 32
+    results = mac.verify_mac_batch(messages, key, tags, max_workers=4)
+    assert results.count(False) == 1 and not results[3]
+
+
+def test_context_cache_counts_hits_under_contention():
+    mac = MACImplementation()
+    key = mac.generate_key()
+    mac.compute_mac(b'x', key)
+
+    def worker():
+        for _ in range(2000):
+            mac.compute_mac(b'x', key)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = mac.context_cache.stats()
+    assert (stats['hits'], stats['misses']) == (8000, 1)
+
+
+def test_context_cache_is_bounded():
+    mac = MACImplementation(cache_size=2)
+    keys = [os.urandom(32) for _ in range(3)]
+    tags = [mac.compute_mac(b'pesan', key) for key in keys]
+    assert mac.context_cache.stats()['evictions'] == 1
+    assert mac.compute_mac(b'pesan', keys[0]) == tags[0]
+    assert mac.bind(keys[1]).verify(b'pesan', tags[1])
@@ -0,0 +1,53 @@
+"""MerkleMAC: tag akar kanonik, bukti leaf, dan update leaf O(log n)"""
+
+import os
+
+import pytest
+
+from merkle_mac import MerkleMAC
+
+LEAF = 1024
+KEY = b'k' * 32
+
+
+@pytest.fixture
+def merkle():
+    return MerkleMAC(leaf_size=LEAF)
+
+
+def test_file_and_memory_agree(merkle, tmp_path):
+    message = os.urandom(5 * LEAF + 3)
+    path = tmp_path / 'data.bin'
+    path.write_bytes(message)
+    assert merkle.compute_mac_file(str(path), KEY) == merkle.compute_mac(message, KEY)
+    assert merkle.verify_mac(message, KEY, merkle.compute_mac(message, KEY))
+    assert not merkle.verify_mac(message[:-1], KEY, merkle.compute_mac(message, KEY))
+
+
+def test_leaf_verification(merkle):
+    message = os.urandom(4 * LEAF)
+    tree = merkle.build_tree(message, KEY)
+    assert tree.verify_leaf(2, message[2 * LEAF:3 * LEAF])
+    assert not tree.verify_leaf(2, os.urandom(LEAF))
+
+
+def test_update_leaf_matches_full_recompute(merkle):
+    message = bytearray(os.urandom(2 * LEAF + 2))
+    tree = merkle.build_tree(bytes(message), KEY)
+    tree.update_leaf(0, b'\0' * LEAF)
+    tree.update_leaf(2, b'x')
+    message[:LEAF] = b'\0' * LEAF
+    del message[2 * LEAF:]
+    message += b'x'
+    assert tree.root() == merkle.compute_mac(bytes(message), KEY)
+
+
+def test_update_leaf_rejects_non_canonical_lengths(merkle):
+    tree = merkle.build_tree(os.urandom(2 * LEAF + 2), KEY)
+    with pytest.raises(ValueError):
+        tree.update_leaf(2, b'')
+    with pytest.raises(ValueError):
+        tree.update_leaf(0, b'short')
+    empty = merkle.build_tree(b'', KEY)
+    empty.update_leaf(0, b'')
+    assert empty.root() == merkle.compute_mac(b'', KEY)
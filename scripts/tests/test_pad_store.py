@@ -0,0 +1,56 @@
+"""PadStore: kursor persisten, replay ditolak, peek/commit (user-008)"""
+
+import pytest
+
+from pad_store import PadStore
+from usac_implementation import POLY_TAG_BITS, USACImplementation
+
+
+@pytest.fixture
+def pad_path(tmp_path):
+    return PadStore.create(str(tmp_path / 'pad.bin'), 4096)
+
+
+def test_reserve_never_reuses_region(pad_path):
+    with PadStore(pad_path) as pad:
+        first, region = pad.reserve(100)
+        region.release()
+    with PadStore(pad_path) as pad:
+        second, region = pad.reserve(100)
+        region.release()
+        assert (first, second) == (0, 100)
+        with pytest.raises(ValueError):
+            pad.reserve(4096)
+
+
+def test_wipe_zeroes_used_region(pad_path):
+    with PadStore(pad_path, wipe=True) as pad:
+        offset, region = pad.reserve(64)
+        region.release()
+        pad.wipe(offset, 64)
+    with open(pad_path, 'rb') as f:
+        assert f.read(64) == bytes(64)
+
+
+def test_decode_rejects_replay_and_forgery(pad_path):
+    usac = USACImplementation(tag_bits=POLY_TAG_BITS)
+    with PadStore(pad_path, cursor_path=pad_path + '.send') as send, \
+            PadStore(pad_path, cursor_path=pad_path + '.recv') as recv:
+        offset, encoded, tag = usac.encode_from_pad(b'halo dunia', send, raw=True)
+
+        forged = bytearray(encoded)
+        forged[0] ^= 0xFF
+        with pytest.raises(ValueError):
+            usac.decode_from_pad(bytes(forged), recv, offset, tag)
+        # Pesan palsu tidak membakar pad penerima
+        assert recv.cursor == 0
+
+        assert usac.decode_from_pad(encoded, recv, offset, tag, as_bytes=True) == b'halo dunia'
+        with pytest.raises(ValueError):
+            usac.decode_from_pad(encoded, recv, offset, tag)
+
+    # Kursor tersimpan di disk: replay tetap ditolak setelah dibuka ulang
+    with PadStore(pad_path, cursor_path=pad_path + '.recv') as recv:
+        assert recv.cursor == offset + usac.required_key_length(len(encoded))
+        with pytest.raises(ValueError):
+            recv.peek(offset, 1)
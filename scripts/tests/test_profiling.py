@@ -0,0 +1,27 @@
+"""profile_call: file hasil cProfile, sampling, dan tracemalloc"""
+
+import os
+import time
+
+from profiling import profile_call
+
+
+def _busy_loop():
+    deadline = time.perf_counter() + 0.1
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return [bytes(1000) for _ in range(100)]
+
+
+def test_profile_call_writes_outputs(tmp_path):
+    result = profile_call('trivial', _busy_loop, str(tmp_path), interval=0.001,
+                          track_memory=True)
+    base = os.path.join(str(tmp_path), 'trivial')
+    for suffix in ('.prof', '.txt', '.collapsed', '.alloc.txt'):
+        assert os.path.getsize(base + suffix) > 0
+        assert base + suffix in result['files']
+    assert result['samples'] > 0
+    assert result['seconds'] >= 0.1
+    assert result['allocations'] and result['peak_memory'] > 0
+    assert '_busy_loop' in open(base + '.collapsed', encoding='utf-8').read()
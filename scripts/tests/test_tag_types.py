@@ -0,0 +1,61 @@
+"""Record tag ringkas: MacTag, TagArray, dan UsacEnvelope"""
+
+import os
+
+import pytest
+
+from mac_implementation import MACImplementation
+from tag_types import (MAX_NAME_BYTES, TAG_ARRAY_HEADER, MacTag, TagArray,
+                       UsacEnvelope)
+from usac_implementation import POLY_TAG_BITS, USACImplementation
+
+
+def test_mac_tag_round_trip():
+    mac = MACImplementation()
+    key = mac.generate_key()
+    tag = mac.compute_mac_tag(b'pesan', key)
+    assert MacTag.from_bytes(tag.to_bytes()).digest == tag.digest
+    assert mac.verify_mac(b'pesan', key, tag)
+    with pytest.raises(ValueError):
+        MacTag.from_bytes(tag.to_bytes()[:-1])
+
+
+def test_tag_array_round_trip():
+    mac = MACImplementation()
+    key = mac.generate_key()
+    messages = [b'a', b'b', b'c']
+    tags = mac.compute_mac_array(messages, key, names=['x', 'y', 'z'])
+    restored = TagArray.from_bytes(tags.to_bytes())
+    assert list(restored.names()) == ['x', 'y', 'z']
+    assert restored.verify('y', mac.compute_mac(b'b', key, raw=True))
+    assert not restored.verify('y', mac.compute_mac(b'c', key, raw=True))
+
+
+def test_tag_array_name_length_limit():
+    tags = TagArray('sha256', 4)
+    longest = 'n' * MAX_NAME_BYTES
+    tags.append(b'\0' * 4, longest)
+    tags.append(b'\1' * 4)
+    restored = TagArray.from_bytes(tags.to_bytes())
+    assert list(restored.names()) == [longest, None]
+    # 0xFFFF adalah penanda slot tanpa nama; panjang UTF-8 yang dihitung
+    for name in ('n' * (MAX_NAME_BYTES + 1), 'é' * (MAX_NAME_BYTES // 2 + 1)):
+        with pytest.raises(ValueError):
+            tags.append(b'\2' * 4, name)
+    assert len(tags) == 2
+
+
+def test_tag_array_rejects_unknown_algorithm_id():
+    data = bytearray(TagArray('sha256', 4).to_bytes())
+    magic, _, tag_size, count = TAG_ARRAY_HEADER.unpack_from(data)
+    data[:TAG_ARRAY_HEADER.size] = TAG_ARRAY_HEADER.pack(magic, 200, tag_size, count)
+    with pytest.raises(ValueError):
+        TagArray.from_bytes(bytes(data))
+
+
+def test_usac_envelope_round_trip():
+    usac = USACImplementation(tag_bits=POLY_TAG_BITS)
+    message = os.urandom(100)
+    key = usac.generate_one_time_key(usac.required_key_length(len(message)))
+    envelope = UsacEnvelope.from_bytes(usac.encode_envelope(message, key).to_bytes())
+    assert usac.decode_envelope(envelope, key, as_bytes=True) == message
@@ -0,0 +1,34 @@
+"""Encode/decode USAC paralel identik dengan jalur satu proses (user-006)"""
+
+import os
+
+import pytest
+
+from usac_implementation import POLY_TAG_BITS, USACImplementation
+
+MESSAGE_LENGTH = 9 * 1024 * 1024 + 5
+# Bukan kelipatan ukuran blok tag polinomial
+CHUNK_SIZE = 1024 * 1024 + 3
+
+
+@pytest.fixture(scope='module')
+def message():
+    return os.urandom(MESSAGE_LENGTH)
+
+
+@pytest.mark.parametrize('tag_bits', [8, POLY_TAG_BITS])
+def test_bulk_matches_single_process(message, tag_bits):
+    usac = USACImplementation(tag_bits=tag_bits)
+    key = os.urandom(usac.required_key_length(len(message)))
+    expected = usac.encode_message(message, key, raw=True)
+    encoded, tag = usac.encode_message_bulk(message, key, raw=True, workers=2,
+                                            chunk_size=CHUNK_SIZE)
+    assert (encoded, tag) == expected
+    assert usac.decode_message_bulk(encoded, key[:len(message)], as_bytes=True,
+                                    workers=2, chunk_size=CHUNK_SIZE) == message
+
+
+def test_bulk_rejects_short_key():
+    usac = USACImplementation()
+    with pytest.raises(ValueError):
+        usac.encode_message_bulk(b'x' * 100, b'k' * 99, workers=1)
@@ -0,0 +1,64 @@
+"""USACImplementation: verifikasi satu pass dan lebar tag"""
+
+import os
+
+import pytest
+
+from usac_implementation import POLY_TAG_BITS, USACImplementation, VerifyResult
+from usac_tag import LEGACY_TAG_BITS
+
+
+def _encode(usac, length: int = 1000):
+    message = os.urandom(length)
+    key = usac.generate_one_time_key(usac.required_key_length(length))
+    encoded, tag = usac.encode_message(message, key, raw=True)
+    return message, key, encoded, tag
+
+
+def test_verify_reports_failure_reason():
+    usac = USACImplementation()
+    message, key, encoded, tag = _encode(usac)
+    verify = usac.verify_authenticity_detailed
+    assert verify(encoded, key, tag, len(message)) is VerifyResult.VALID
+    assert verify(encoded, key, tag.hex(), len(message)) is VerifyResult.VALID
+    assert verify(encoded, key, tag, len(message) - 1) is VerifyResult.LENGTH_MISMATCH
+    assert verify(encoded, key[:10], tag, len(message)) is VerifyResult.KEY_TOO_SHORT
+    assert verify(encoded, key, 'zz', len(message)) is VerifyResult.MALFORMED_TAG
+    wrong = bytes([tag[0] ^ 1]) + tag[1:]
+    assert verify(encoded, key, wrong, len(message)) is VerifyResult.TAG_MISMATCH
+    assert not usac.verify_authenticity(encoded, key, wrong, len(message))
+
+
+def _legacy_tag(message: bytes, tag_key: bytes) -> str:
+    """Tag XOR-fold skema lama (sebelum tag polinomial)"""
+    tag = 0
+    for i, byte in enumerate(message):
+        tag ^= byte ^ tag_key[i] if i < len(tag_key) else byte
+    return format(tag, '02x')
+
+
+def test_default_is_legacy_tag():
+    usac = USACImplementation()
+    assert usac.tag_bits == LEGACY_TAG_BITS
+    message = b'Transfer $1000 ke rekening 12345'
+    key = os.urandom(usac.required_key_length(len(message)))
+    encoded, tag = usac.encode_message(message, key)
+    assert tag == _legacy_tag(message, key[len(message):])
+    assert usac.decode_message(encoded, key, as_bytes=True) == message
+
+
+@pytest.mark.parametrize('tag_bits', [32, POLY_TAG_BITS, 128])
+def test_poly_tag_detects_tampering(tag_bits):
+    usac = USACImplementation(tag_bits=tag_bits)
+    message, key, encoded, tag = _encode(usac)
+    assert len(tag) == tag_bits // 8
+    assert usac.verify_authenticity(encoded, key, tag, len(message))
+    for position in (0, 500, len(encoded) - 1):
+        tampered = bytearray(encoded)
+        tampered[position] ^= 1
+        assert not usac.verify_authenticity(bytes(tampered), key, tag, len(message))
+
+
+def test_unsupported_tag_width_rejected():
+    with pytest.raises(ValueError):
+        USACImplementation(tag_bits=48)
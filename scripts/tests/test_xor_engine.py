@@ -0,0 +1,34 @@
+"""Backend XOR: hasil identik di semua backend (user-001)"""
+
+import os
+
+import pytest
+
+from usac_implementation import USACImplementation
+from xor_engine import available_backends, select_backend, xor_bytes
+
+
+@pytest.mark.parametrize('length', [0, 1, 7, 4096 + 3])
+def test_backends_agree(length):
+    data, key = os.urandom(length), os.urandom(length + 5)
+    expected = bytes(a ^ b for a, b in zip(data, key))
+    for backend in available_backends():
+        result, name = xor_bytes(data, key, backend)
+        assert (bytes(result), name) == (expected, backend)
+
+
+def test_short_key_and_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        xor_bytes(b'abc', b'ab')
+    with pytest.raises(ValueError):
+        select_backend(10, 'simd')
+
+
+@pytest.mark.parametrize('backend', ['loop', 'int', 'auto'])
+def test_usac_backend_round_trip(backend):
+    usac = USACImplementation(xor_backend=backend)
+    message = os.urandom(3000)
+    key = usac.generate_one_time_key(usac.required_key_length(len(message)))
+    encoded, tag = usac.encode_message(message, key)
+    assert usac.verify_authenticity(encoded, key, tag, len(message))
+    assert usac.decode_message(encoded, key, as_bytes=True) == message
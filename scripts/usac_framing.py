@@ -0,0 +1,317 @@
+"""
+Format wire USAC berbingkai (framed) untuk transport streaming
+
+Pesan dipecah menjadi frame berukuran tetap. Setiap frame membawa offset
+pad dan panjangnya sendiri serta tag polinomial, sehingga penerima dapat
+memverifikasi dan melepas setiap frame tanpa menunggu seluruh pesan, dan
+frame yang dimanipulasi ditolak saat itu juga. Frame penutup membawa
+jumlah frame dan panjang total beserta tag akhir atas semua tag frame,
+sehingga pemotongan atau penyusunan ulang stream terdeteksi.
+
+Layout (big-endian):
+
+    header stream : MAGIC 'USF1' | versi u8 (2) | tag_bits u8 | frame_size u32
+                    | offset_kunci_stream u64
+    frame data    : tipe u8 (0) | seq u32 | offset_pad u64 | panjang u32
+                    | ciphertext | tag
+    frame akhir   : tipe u8 (1) | jumlah_frame u32 | offset_kunci_stream u64 | 8
+                    | panjang_total u64 | tag
+
+Kunci tag stream dicadangkan paling awal (offset terendah). Tag frame data
+= PolyHash(header_frame || plaintext) dengan kunci tag dari region pad frame
+tersebut; tag akhir = PolyHash dengan kunci stream atas header_stream ||
+tag_1 || ... || tag_n || header_frame_akhir || panjang_total, dihitung
+berjalan sehingga memori tidak bergantung pada jumlah frame.
+
+Penerima wajib menentukan lebar tag sendiri (USACImplementation); header
+dengan lebar lain ditolak. Region pad dibaca dengan peek() dan kursor pad
+baru maju setelah tag frame valid, sehingga header palsu tidak dapat
+melompati atau membakar pad.
+"""
+
+import hmac
+import struct
+from typing import Iterable, Iterator, Optional
+
+from buffer_utils import as_buffer
+from usac_tag import LEGACY_TAG_BITS, PolyHash
+from xor_engine import xor_bytes
+
+MAGIC = b'USF1'
+VERSION = 2
+STREAM_HEADER = struct.Struct('!4sBBIQ')
+FRAME_HEADER = struct.Struct('!BIQI')
+TOTAL_LENGTH = struct.Struct('!Q')
+
+FRAME_DATA = 0
+FRAME_FINAL = 1
+
+DEFAULT_FRAME_SIZE = 64 * 1024
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+
+class FrameAuthenticationError(ValueError):
+    """Frame atau stream USAC gagal diverifikasi"""
+
+
+class BufferPad:
+    """
+    Sumber pad dari buffer di memori dengan antarmuka seperti PadStore
+
+    Offset dihitung dari awal buffer. Region sebelum kursor dianggap sudah
+    terpakai, sehingga frame yang diputar ulang ditolak.
+    """
+
+    def __init__(self, key):
+        self._view = memoryview(as_buffer(key))
+        self.size = len(self._view)
+        self.cursor = 0
+
+    def remaining(self) -> int:
+        """Jumlah bytes pad yang belum dipakai"""
+        return self.size - self.cursor
+
+    def reserve(self, length: int):
+        """Cadangkan region berikutnya: (offset, memoryview)"""
+        offset = self.cursor
+        if offset + length > self.size:
+            raise ValueError("Materi pad tidak cukup")
+        self.cursor = offset + length
+        return offset, self._view[offset:offset + length]
+
+    def peek(self, offset: int, length: int) -> memoryview:
+        """Region pada offset tertentu (tidak boleh di bawah kursor), kursor tetap"""
+        if offset < self.cursor:
+            raise ValueError(f"Region pad pada offset {offset} sudah dipakai")
+        if offset + length > self.size:
+            raise ValueError("Region melewati akhir pad")
+        return self._view[offset:offset + length]
+
+    def commit(self, offset: int, length: int):
+        """Tandai region hasil peek() sebagai terpakai"""
+        self.peek(offset, length).release()
+        self.cursor = offset + length
+
+    def claim(self, offset: int, length: int) -> memoryview:
+        """Klaim region pada offset tertentu (tidak boleh di bawah kursor)"""
+        region = self.peek(offset, length)
+        self.cursor = offset + length
+        return region
+
+    def wipe(self, offset: int, length: int):
+        """Buffer di memori tidak di-wipe"""
+
+
+def _stream_hash(region, usac) -> PolyHash:
+    """PolyHash dengan kunci tag stream; region langsung dilepas"""
+    try:
+        return PolyHash(region, usac.tag_bits)
+    finally:
+        region.release()
+
+
+def _frame_tag(pad_region, message_length: int, header: bytes, payload, usac) -> bytes:
+    """Tag frame: PolyHash(header || payload) dengan kunci tag setelah region pesan"""
+    tag_key = pad_region[message_length:usac.required_key_length(message_length)]
+    return PolyHash(tag_key, usac.tag_bits).update(header).update(payload).digest()
+
+
+def _rechunk(chunks: Iterable, frame_size: int) -> Iterator[memoryview]:
+    """Potong ulang input menjadi blok frame_size (blok terakhir boleh lebih pendek)"""
+    pending = bytearray()
+    for chunk in chunks:
+        view = memoryview(as_buffer(chunk))
+        if not pending and len(view) >= frame_size:
+            full = len(view) - len(view) % frame_size
+            for start in range(0, full, frame_size):
+                yield view[start:start + frame_size]
+            view = view[full:]
+        pending += view
+        while len(pending) >= frame_size:
+            yield memoryview(bytes(pending[:frame_size]))
+            del pending[:frame_size]
+    if pending:
+        yield memoryview(bytes(pending))
+
+
+def encode_stream(chunks: Iterable, pad, usac=None,
+                  frame_size: int = DEFAULT_FRAME_SIZE) -> Iterator[bytes]:
+    """
+    Encode stream pesan menjadi frame USAC
+
+    Args:
+        chunks: Iterable potongan pesan (str atau objek buffer)
+        pad: PadStore atau BufferPad sumber one-time key
+        usac: USACImplementation (default tag polinomial 64 bit)
+        frame_size: Ukuran plaintext maksimum per frame
+
+    Yields:
+        Header stream, lalu setiap frame data, lalu frame akhir (bytes)
+    """
+    if usac is None:
+        from usac_implementation import POLY_TAG_BITS, USACImplementation
+        usac = USACImplementation(tag_bits=POLY_TAG_BITS)
+    if usac.tag_bits == LEGACY_TAG_BITS:
+        raise ValueError("Format berbingkai memerlukan tag polinomial (32/64/128 bit)")
+    if not 0 < frame_size <= MAX_FRAME_SIZE:
+        raise ValueError(f"frame_size harus 1..{MAX_FRAME_SIZE}")
+
+    stream_offset, region = pad.reserve(usac.tag_key_length)
+    stream_hash = _stream_hash(region, usac)
+    pad.wipe(stream_offset, usac.tag_key_length)
+    stream_header = STREAM_HEADER.pack(MAGIC, VERSION, usac.tag_bits, frame_size, stream_offset)
+    stream_hash.update(stream_header)
+    yield stream_header
+
+    total = 0
+    seq = 0
+    for frame in _rechunk(chunks, frame_size):
+        length = len(frame)
+        region_length = usac.required_key_length(length)
+        offset, region = pad.reserve(region_length)
+        try:
+            header = FRAME_HEADER.pack(FRAME_DATA, seq, offset, length)
+            encoded, _ = xor_bytes(frame, region, usac.xor_backend)
+            tag = _frame_tag(region, length, header, frame, usac)
+        finally:
+            region.release()
+        pad.wipe(offset, region_length)
+        stream_hash.update(tag)
+        total += length
+        seq += 1
+        yield header + encoded + tag
+
+    header = FRAME_HEADER.pack(FRAME_FINAL, seq, stream_offset, TOTAL_LENGTH.size)
+    body = TOTAL_LENGTH.pack(total)
+    yield header + body + stream_hash.update(header).update(body).digest()
+
+
+class _Reader:
+    """Buffer input untuk membaca sejumlah bytes dari iterable potongan data"""
+
+    def __init__(self, chunks: Iterable):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+
+    def read(self, length: int) -> Optional[bytes]:
+        """Baca tepat length bytes; None jika input habis sebelum ada data"""
+        while len(self._buffer) < length:
+            try:
+                self._buffer += as_buffer(next(self._chunks))
+            except StopIteration:
+                if not self._buffer:
+                    return None
+                raise FrameAuthenticationError("Stream terpotong di tengah frame")
+        data = bytes(self._buffer[:length])
+        del self._buffer[:length]
+        return data
+
+    def at_end(self) -> bool:
+        """True jika tidak ada data tersisa"""
+        while not self._buffer:
+            try:
+                self._buffer += as_buffer(next(self._chunks))
+            except StopIteration:
+                return True
+        return False
+
+
+def decode_stream(data: Iterable, pad, usac) -> Iterator[bytes]:
+    """
+    Verifikasi dan decode stream frame USAC
+
+    Setiap frame diverifikasi sebelum plaintext-nya dilepas dan sebelum
+    region pad-nya ditandai terpakai. Memori yang dipakai dibatasi oleh
+    frame_size dari header stream.
+
+    Args:
+        data: Iterable potongan bytes stream (ukuran bebas)
+        pad: PadStore atau BufferPad dengan materi pad yang sama dengan pengirim
+        usac: USACImplementation dengan lebar tag yang disepakati; lebar tag
+              di header stream harus sama (tidak pernah diambil dari header)
+
+    Yields:
+        Plaintext setiap frame (bytes)
+
+    Raises:
+        FrameAuthenticationError: Jika header, urutan, tag, atau akhir stream tidak valid
+    """
+    if usac is None or usac.tag_bits == LEGACY_TAG_BITS:
+        raise ValueError("decode_stream memerlukan USACImplementation dengan tag polinomial")
+    tag_size = usac.tag_bits // 8
+
+    reader = _Reader(data)
+    stream_header = reader.read(STREAM_HEADER.size)
+    if stream_header is None:
+        raise FrameAuthenticationError("Stream kosong")
+    magic, version, tag_bits, frame_size, stream_offset = STREAM_HEADER.unpack(stream_header)
+    if magic != MAGIC or version != VERSION:
+        raise FrameAuthenticationError("Header stream tidak dikenal")
+    if tag_bits != usac.tag_bits:
+        raise FrameAuthenticationError(f"Lebar tag stream {tag_bits} bit, "
+                                       f"diharapkan {usac.tag_bits} bit")
+    if not 0 < frame_size <= MAX_FRAME_SIZE:
+        raise FrameAuthenticationError(f"frame_size tidak valid: {frame_size}")
+    try:
+        stream_hash = _stream_hash(pad.peek(stream_offset, usac.tag_key_length), usac)
+    except ValueError as error:
+        raise FrameAuthenticationError(str(error)) from None
+    stream_hash.update(stream_header)
+
+    total = 0
+    seq = 0
+    while True:
+        header = reader.read(FRAME_HEADER.size)
+        if header is None:
+            raise FrameAuthenticationError("Stream berakhir tanpa frame akhir")
+        frame_type, frame_seq, offset, length = FRAME_HEADER.unpack(header)
+        if frame_seq != seq:
+            raise FrameAuthenticationError(f"Urutan frame salah: {frame_seq}, diharapkan {seq}")
+
+        if frame_type == FRAME_FINAL:
+            if length != TOTAL_LENGTH.size or offset != stream_offset:
+                raise FrameAuthenticationError("Frame akhir tidak valid")
+            body = reader.read(length + tag_size)
+            if body is None:
+                raise FrameAuthenticationError("Stream terpotong di frame akhir")
+            tag = stream_hash.update(header).update(body[:length]).digest()
+            if not hmac.compare_digest(tag, body[length:]):
+                raise FrameAuthenticationError("Tag akhir tidak valid")
+            if TOTAL_LENGTH.unpack(body[:length])[0] != total:
+                raise FrameAuthenticationError("Panjang total stream tidak cocok")
+            if not reader.at_end():
+                raise FrameAuthenticationError("Data tambahan setelah frame akhir")
+            if not seq:
+                # Tanpa frame data, region kunci stream belum dilewati kursor
+                pad.commit(stream_offset, usac.tag_key_length)
+            pad.wipe(stream_offset, usac.tag_key_length)
+            return
+
+        if frame_type != FRAME_DATA or not 0 < length <= frame_size:
+            raise FrameAuthenticationError(f"Frame {seq} tidak valid")
+        body = reader.read(length + tag_size)
+        if body is None:
+            raise FrameAuthenticationError(f"Stream terpotong di frame {seq}")
+        encoded = memoryview(body)[:length]
+        received_tag = body[length:]
+        region_length = usac.required_key_length(length)
+        try:
+            region = pad.peek(offset, region_length)
+        except ValueError as error:
+            raise FrameAuthenticationError(str(error)) from None
+        try:
+            decoded, _ = xor_bytes(encoded, region, usac.xor_backend)
+            tag = _frame_tag(region, length, header, decoded, usac)
+        finally:
+            region.release()
+        if not hmac.compare_digest(tag, received_tag):
+            raise FrameAuthenticationError(f"Tag frame {seq} tidak valid")
+        try:
+            pad.commit(offset, region_length)
+        except ValueError as error:
+            raise FrameAuthenticationError(str(error)) from None
+        pad.wipe(offset, region_length)
+        stream_hash.update(received_tag)
+        total += length
+        seq += 1
+        yield decoded
@@ -1,6 +1,35 @@
+import enum
+import functools
+import hmac
 import secrets
 import time
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
+
+from buffer_utils import MessageInput, as_buffer
+from key_pool import KeyPool
+from pad_store import PadStore
+from tag_types import UsacEnvelope
+from usac_parallel import DEFAULT_CHUNK_SIZE, parallel_xor
+from usac_tag import (BLOCK_SIZE, LEGACY_TAG_BITS, block_count, compute_tag,
+                      poly_accumulate, poly_combine, poly_finish, split_tag_key,
+                      tag_key_length)
+from xor_engine import xor_bytes, xor_fold
+
+# Default tetap skema lama (XOR fold 8 bit) agar kontrak panjang kunci
+# (kunci >= pesan) dan tag yang sudah ada tetap berlaku; tag polinomial
+# bersifat opt-in dengan tag_bits=32/64/128 (disarankan POLY_TAG_BITS)
+DEFAULT_TAG_BITS = LEGACY_TAG_BITS
+POLY_TAG_BITS = 64
+
+
+class VerifyResult(enum.Enum):
+    """Hasil verifikasi autentisitas USAC"""
+    VALID = 'valid'
+    LENGTH_MISMATCH = 'length_mismatch'
+    KEY_TOO_SHORT = 'key_too_short'
+    MALFORMED_TAG = 'malformed_tag'
+    TAG_MISMATCH = 'tag_mismatch'
+
 
 class USACImplementation:
     """
@@ -15,115 +44,389 @@ class USACImplementation:
     Kategori: Information-theoretic cryptography
     """
     
-    def __init__(self):
-        """Inisialisasi USAC"""
+    def __init__(self, xor_backend: str = 'auto', key_pool: Optional[KeyPool] = None,
+                 tag_bits: int = DEFAULT_TAG_BITS):
+        """
+        Inisialisasi USAC
+        
+        Args:
+            xor_backend: Backend XOR (auto, int, numpy, loop)
+            key_pool: KeyPool opsional sebagai sumber one-time key
+            tag_bits: Lebar authentication tag (8 = skema lama, default;
+                      32, 64, 128 = tag polinomial)
+        """
         self.name = "Unconditional Secure Authentication Code"
         self.security_level = "Information-theoretic"
+        self.xor_backend = xor_backend
+        self.key_pool = key_pool
+        self.last_xor_backend: Optional[str] = None
+        self.tag_key_length = tag_key_length(tag_bits)
+        self.tag_bits = tag_bits
+    
+    def required_key_length(self, message_length: int) -> int:
+        """
+        Panjang one-time key untuk pesan (region pesan + kunci tag)
+        
+        Args:
+            message_length: Panjang pesan dalam bytes
+            
+        Returns:
+            Panjang kunci minimum dalam bytes
+        """
+        return message_length + self.tag_key_length
+    
+    def _check_key_length(self, key, message_length: int) -> bool:
+        """Skema lama hanya memerlukan kunci >= pesan; skema polinomial juga kunci tag penuh"""
+        if self.tag_bits == LEGACY_TAG_BITS:
+            return len(key) >= message_length
+        return len(key) >= self.required_key_length(message_length)
     
     def generate_one_time_key(self, length: int) -> bytes:
         """
         Generate one-time pad key untuk USAC
         
+        Dengan key_pool, kunci diambil tanpa menunggu: jika pool sedang
+        kosong, kunci langsung dibuat dari entropi OS (direct draw) dan
+        pool diisi ulang di latar belakang.
+        
         Args:
             length: Panjang kunci (harus >= panjang pesan)
             
         Returns:
             One-time key dalam bentuk bytes
         """
+        if self.key_pool is not None:
+            return self.key_pool.take(length, timeout=0)
         return secrets.token_bytes(length)
     
-    def encode_message(self, message: str, key: bytes) -> Tuple[bytes, str]:
+    def encode_message(self, message: MessageInput, key: bytes,
+                       raw: bool = False) -> Tuple[bytes, Union[str, bytes]]:
         """
         Encode pesan menggunakan one-time pad
         
         Args:
-            message: Pesan yang akan di-encode
-            key: One-time key
+            message: Pesan yang akan di-encode (str atau objek buffer)
+            key: One-time key (bytes atau objek buffer)
+            raw: True untuk mengembalikan tag dalam bentuk bytes
             
         Returns:
             Tuple berisi (encoded_message, authentication_tag)
         """
-        if len(key) < len(message):
-            raise ValueError("USAC memerlukan kunci dengan panjang >= pesan")
+        message_bytes = as_buffer(message)
+        key = as_buffer(key)
+        if not self._check_key_length(key, len(message_bytes)):
+            raise ValueError("USAC memerlukan kunci dengan panjang >= pesan + kunci tag")
         
-        message_bytes = message.encode('utf-8')
-        encoded = bytearray()
+        encoded, self.last_xor_backend = xor_bytes(message_bytes, key, self.xor_backend)
         
         
-        for i, byte in enumerate(message_bytes):
-            encoded.append(byte ^ key[i])
+        auth_tag_key = key[len(message_bytes):self.required_key_length(len(message_bytes))]
+        auth_tag = self._generate_auth_tag(message_bytes, auth_tag_key, raw)
         
+        return encoded, auth_tag
+    
+    def decode_message(self, encoded_message, key: bytes,
+                       as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Decode pesan yang telah di-encode
         
-        auth_tag_key = key[len(message_bytes):len(message_bytes)+16]  
-        auth_tag = self._generate_auth_tag(message_bytes, auth_tag_key)
+        Args:
+            encoded_message: Pesan yang telah di-encode (objek buffer)
+            key: One-time key yang sama
+            as_bytes: True untuk mengembalikan bytes tanpa decode UTF-8
+            
+        Returns:
+            Pesan asli
+        """
+        decoded, self.last_xor_backend = xor_bytes(as_buffer(encoded_message),
+                                                   as_buffer(key), self.xor_backend)
+        return decoded if as_bytes else decoded.decode('utf-8')
+    
+    def encode_message_bulk(self, message: MessageInput, key: bytes, raw: bool = False,
+                            workers: Optional[int] = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[bytes, Union[str, bytes]]:
+        """
+        Encode pesan besar secara paralel di beberapa proses
         
-        return bytes(encoded), auth_tag
+        Output identik dengan encode_message. Tag digabungkan dari hasil
+        parsial setiap chunk.
+        
+        Args:
+            message: Pesan yang akan di-encode (str atau objek buffer)
+            key: One-time key (bytes atau objek buffer)
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+            workers: Jumlah proses (None = jumlah CPU)
+            chunk_size: Ukuran chunk per tugas worker
+            
+        Returns:
+            Tuple berisi (encoded_message, authentication_tag)
+        """
+        message_bytes = as_buffer(message)
+        key = as_buffer(key)
+        length = len(message_bytes)
+        if not self._check_key_length(key, length):
+            raise ValueError("USAC memerlukan kunci dengan panjang >= pesan + kunci tag")
+        tag_key = key[length:self.required_key_length(length)]
+        
+        if self.tag_bits == LEGACY_TAG_BITS:
+            encoded, partials = parallel_xor(message_bytes, key, workers,
+                                             chunk_size, self.xor_backend)
+            tag = functools.reduce(lambda a, b: a ^ b, partials, xor_fold(tag_key[:length]))
+            tag = bytes([tag])
+        else:
+            # Chunk harus sejajar dengan blok polinomial agar akumulator
+            # setiap chunk dapat digabungkan
+            chunk_size = max(BLOCK_SIZE, chunk_size - chunk_size % BLOCK_SIZE)
+            r, s = split_tag_key(tag_key, self.tag_bits)
+            encoded, partials = parallel_xor(message_bytes, key, workers, chunk_size,
+                                             self.xor_backend,
+                                             functools.partial(poly_accumulate, r=r))
+            acc = 0
+            for start, partial in zip(range(0, length, chunk_size), partials):
+                chunk_blocks = block_count(min(chunk_size, length - start))
+                acc = poly_combine(acc, partial, chunk_blocks, r)
+            tag = poly_finish(acc, s, self.tag_bits)
+        return encoded, tag if raw else tag.hex()
     
-    def decode_message(self, encoded_message: bytes, key: bytes) -> str:
+    def decode_message_bulk(self, encoded_message, key: bytes, as_bytes: bool = False,
+                            workers: Optional[int] = None,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Union[str, bytes]:
         """
-        Decode pesan yang telah di-encode
+        Decode pesan besar secara paralel di beberapa proses
         
         Args:
-            encoded_message: Pesan yang telah di-encode
+            encoded_message: Pesan yang telah di-encode (objek buffer)
             key: One-time key yang sama
+            as_bytes: True untuk mengembalikan bytes tanpa decode UTF-8
+            workers: Jumlah proses (None = jumlah CPU)
+            chunk_size: Ukuran chunk per tugas worker
             
         Returns:
             Pesan asli
         """
-        decoded = bytearray()
+        decoded, _ = parallel_xor(as_buffer(encoded_message), as_buffer(key),
+                                  workers, chunk_size, self.xor_backend, len)
+        return decoded if as_bytes else decoded.decode('utf-8')
+    
+    def encode_envelope(self, message: MessageInput, key: bytes) -> UsacEnvelope:
+        """
+        Encode pesan ke UsacEnvelope (ciphertext, tag mentah, panjang asli)
         
+        Args:
+            message: Pesan yang akan di-encode (str atau objek buffer)
+            key: One-time key (bytes atau objek buffer)
+            
+        Returns:
+            UsacEnvelope yang dapat diserialisasi dengan to_bytes()
+        """
+        encoded, tag = self.encode_message(message, key, raw=True)
+        return UsacEnvelope(encoded, tag, self.tag_bits, len(encoded))
+    
+    def verify_envelope(self, envelope: UsacEnvelope, key: bytes) -> 'VerifyResult':
+        """
+        Verifikasi UsacEnvelope tanpa decode pesan
         
-        for i, byte in enumerate(encoded_message):
-            decoded.append(byte ^ key[i])
+        Args:
+            envelope: Envelope yang diterima
+            key: One-time key
+            
+        Returns:
+            VerifyResult.VALID atau alasan kegagalan
+        """
+        if envelope.tag_bits != self.tag_bits:
+            return VerifyResult.MALFORMED_TAG
+        return self.verify_authenticity_detailed(envelope.encoded, key, envelope.tag,
+                                                 envelope.original_length)
+    
+    def decode_envelope(self, envelope: UsacEnvelope, key: bytes,
+                        as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Verifikasi lalu decode UsacEnvelope
         
-        return decoded.decode('utf-8')
+        Args:
+            envelope: Envelope yang diterima
+            key: One-time key
+            as_bytes: True untuk mengembalikan bytes tanpa decode UTF-8
+            
+        Returns:
+            Pesan asli
+            
+        Raises:
+            ValueError: Jika envelope tidak autentik
+        """
+        result = self.verify_envelope(envelope, key)
+        if result is not VerifyResult.VALID:
+            raise ValueError(f"Envelope USAC tidak valid: {result.value}")
+        return self.decode_message(envelope.encoded, as_buffer(key)[:envelope.original_length],
+                                   as_bytes)
+    
+    def encode_from_pad(self, message: MessageInput, pad: PadStore,
+                        raw: bool = False) -> Tuple[int, bytes, Union[str, bytes]]:
+        """
+        Encode pesan dengan region pad berikutnya dari PadStore
+        
+        Region (pesan + kunci tag) dicadangkan dan kursor pad di-persist
+        sebelum dipakai, lalu di-wipe jika PadStore mengaktifkan wipe.
+        
+        Args:
+            message: Pesan yang akan di-encode (str atau objek buffer)
+            pad: PadStore sumber one-time key
+            raw: True untuk mengembalikan tag dalam bentuk bytes
+            
+        Returns:
+            Tuple berisi (offset_pad, encoded_message, authentication_tag)
+        """
+        message_bytes = as_buffer(message)
+        length = self.required_key_length(len(message_bytes))
+        offset, key = pad.reserve(length)
+        try:
+            encoded, auth_tag = self.encode_message(message_bytes, key, raw)
+        finally:
+            key.release()
+        pad.wipe(offset, length)
+        return offset, encoded, auth_tag
+    
+    def decode_from_pad(self, encoded_message, pad: PadStore, offset: int,
+                        received_tag: Union[str, bytes],
+                        as_bytes: bool = False) -> Union[str, bytes]:
+        """
+        Verifikasi dan decode pesan dengan region pad pada offset tertentu
+        
+        Region dibaca dengan peek() dan baru ditandai terpakai (kursor pad
+        di-persist) setelah tag valid, sehingga pesan dengan offset yang
+        sama tidak dapat diproses dua kali dan pesan palsu tidak membakar pad.
+        
+        Args:
+            encoded_message: Pesan yang telah di-encode (objek buffer)
+            pad: PadStore dengan materi pad yang sama dengan pengirim
+            offset: Offset pad yang dipakai pengirim
+            received_tag: Tag autentikasi yang diterima (hex str atau bytes)
+            as_bytes: True untuk mengembalikan bytes tanpa decode UTF-8
+            
+        Returns:
+            Pesan asli
+        """
+        length = len(encoded_message)
+        key = pad.peek(offset, self.required_key_length(length))
+        try:
+            result = self.verify_authenticity_detailed(encoded_message, key,
+                                                       received_tag, length)
+            if result is not VerifyResult.VALID:
+                raise ValueError(f"Verifikasi USAC gagal: {result.value}")
+            pad.commit(offset, self.required_key_length(length))
+            decoded = self.decode_message(encoded_message, key, as_bytes)
+        finally:
+            key.release()
+        pad.wipe(offset, self.required_key_length(length))
+        return decoded
+    
+    def encode_stream(self, chunks, pad, frame_size: Optional[int] = None):
+        """
+        Encode stream pesan ke format berbingkai (lihat usac_framing)
+        
+        Args:
+            chunks: Iterable potongan pesan (str atau objek buffer)
+            pad: PadStore atau usac_framing.BufferPad sumber one-time key
+            frame_size: Ukuran plaintext per frame (default 64 KB)
+            
+        Returns:
+            Generator bytes: header stream, frame data, frame akhir
+        """
+        import usac_framing
+        return usac_framing.encode_stream(chunks, pad, self,
+                                          frame_size or usac_framing.DEFAULT_FRAME_SIZE)
+    
+    def decode_stream(self, data, pad):
+        """
+        Verifikasi dan decode stream berbingkai frame demi frame
+        
+        Args:
+            data: Iterable potongan bytes stream
+            pad: PadStore atau usac_framing.BufferPad dengan pad yang sama
+            
+        Returns:
+            Generator plaintext per frame; FrameAuthenticationError
+            dilempar pada frame pertama yang tidak valid
+        """
+        import usac_framing
+        return usac_framing.decode_stream(data, pad, self)
     
-    def _generate_auth_tag(self, message: bytes, tag_key: bytes) -> str:
+    def _generate_auth_tag(self, message, tag_key, raw: bool = False) -> Union[str, bytes]:
         """
         Generate authentication tag untuk USAC
         
+        Tag polinomial (Wegman-Carter) selebar self.tag_bits, lihat usac_tag.
+        
         Args:
             message: Pesan dalam bytes
             tag_key: Kunci untuk authentication tag
+            raw: True untuk mengembalikan tag dalam bentuk bytes
             
         Returns:
-            Authentication tag dalam hex
+            Authentication tag dalam hex (atau bytes jika raw=True)
         """
-        tag = 0
-        for i, byte in enumerate(message):
-            if i < len(tag_key):
-                tag ^= byte ^ tag_key[i]
-            else:
-                tag ^= byte
-        
-        return format(tag, '02x')
+        tag = compute_tag(message, tag_key, self.tag_bits)
+        return tag if raw else tag.hex()
     
-    def verify_authenticity(self, encoded_message: bytes, key: bytes, 
-                          received_tag: str, original_length: int) -> bool:
+    def verify_authenticity(self, encoded_message, key: bytes, 
+                          received_tag: Union[str, bytes], original_length: int) -> bool:
         """
         Verifikasi autentisitas pesan
         
         Args:
-            encoded_message: Pesan yang di-encode
+            encoded_message: Pesan yang di-encode (objek buffer)
             key: One-time key
-            received_tag: Tag autentikasi yang diterima
+            received_tag: Tag autentikasi yang diterima (hex str atau bytes)
             original_length: Panjang pesan asli
             
         Returns:
             True jika autentik, False jika tidak
         """
-        try:
-            
-            decoded_message = self.decode_message(encoded_message, key)
-            message_bytes = decoded_message.encode('utf-8')
-            
-            
-            auth_tag_key = key[original_length:original_length+16]
-            expected_tag = self._generate_auth_tag(message_bytes, auth_tag_key)
+        result = self.verify_authenticity_detailed(encoded_message, key,
+                                                   received_tag, original_length)
+        return result is VerifyResult.VALID
+    
+    def verify_authenticity_detailed(self, encoded_message, key: bytes,
+                                     received_tag: Union[str, bytes],
+                                     original_length: int) -> 'VerifyResult':
+        """
+        Verifikasi autentisitas dalam satu pass tanpa decode pesan
+        
+        Blok plaintext dihitung sebagai XOR word ciphertext dan kunci saat
+        tag diakumulasi, sehingga tag dapat dihitung langsung dari buffer
+        ciphertext dan kunci tanpa membuat plaintext. Tag dibandingkan
+        sebagai bytes mentah dengan hmac.compare_digest.
+        
+        Args:
+            encoded_message: Pesan yang di-encode (objek buffer)
+            key: One-time key
+            received_tag: Tag autentikasi yang diterima (hex str atau bytes)
+            original_length: Panjang pesan asli
             
-            return expected_tag == received_tag
-        except:
-            return False
+        Returns:
+            VerifyResult.VALID atau alasan kegagalan
+        """
+        encoded = as_buffer(encoded_message)
+        key = as_buffer(key)
+        length = len(encoded)
+        if length != original_length:
+            return VerifyResult.LENGTH_MISMATCH
+        if not self._check_key_length(key, length):
+            return VerifyResult.KEY_TOO_SHORT
+        
+        if isinstance(received_tag, str):
+            try:
+                received_tag = bytes.fromhex(received_tag)
+            except ValueError:
+                return VerifyResult.MALFORMED_TAG
+        if len(received_tag) != self.tag_bits // 8:
+            return VerifyResult.MALFORMED_TAG
+        
+        tag_key = key[length:self.required_key_length(length)]
+        tag = compute_tag(encoded, tag_key, self.tag_bits, pad=key[:length])
+        if not hmac.compare_digest(tag, received_tag):
+            return VerifyResult.TAG_MISMATCH
+        return VerifyResult.VALID
     
     def demonstrate_usac(self):
         """Demonstrasi penggunaan USAC"""
@@ -150,6 +453,8 @@ class USACImplementation:
         print(f"Pesan ter-encode: {encoded_msg.hex()}")
         print(f"Authentication tag: {auth_tag}")
         print(f"Waktu encoding: {(end_time - start_time) * 1000:.4f} ms")
+        print(f"Backend XOR: {self.last_xor_backend}")
+        print(f"Lebar tag: {self.tag_bits} bit")
         
         
         start_time = time.time()
@@ -182,7 +487,3 @@ class USACImplementation:
         print("3. Tidak dapat dipecahkan meski dengan komputasi tak terbatas")
         print("4. Memerlukan kunci sepanjang atau lebih dari pesan")
         print("5. Kunci hanya dapat digunakan sekali (one-time)")
-
-
-usac_demo = USACImplementation()
-usac_demo.demonstrate_usac()
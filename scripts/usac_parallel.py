@@ -0,0 +1,108 @@
+"""
+Engine USAC paralel multi-proses untuk one-time pad berukuran besar
+
+Pesan dan region kunci yang sesuai ditaruh di multiprocessing.shared_memory,
+lalu dibagi menjadi chunk yang di-XOR oleh ProcessPoolExecutor. Data pad
+dan payload tidak pernah di-pickle antar proses; setiap worker hanya
+menerima nama segmen shared memory dan batas chunk-nya.
+
+Setiap worker juga mengembalikan hasil parsial atas input chunk-nya
+(misalnya akumulator tag polinomial) sehingga authentication tag dapat
+digabungkan tanpa membaca ulang seluruh pesan.
+"""
+
+import os
+from typing import Callable, List, Optional, Tuple
+
+from xor_engine import xor_bytes, xor_fold
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Di bawah ukuran ini biaya spawn/shared memory lebih besar dari manfaatnya
+PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+
+
+def _xor_chunk(args):
+    """
+    Worker: XOR satu chunk dari shared memory ke segmen output
+
+    Returns:
+        Hasil fungsi parsial atas input chunk
+    """
+    src_name, key_name, out_name, start, end, backend, partial_fn = args
+    from multiprocessing import shared_memory
+
+    # Worker berbagi resource tracker dengan proses induk, yang memiliki
+    # segmen dan melakukan unlink setelah semua chunk selesai
+    src = shared_memory.SharedMemory(name=src_name)
+    key = shared_memory.SharedMemory(name=key_name)
+    out = shared_memory.SharedMemory(name=out_name)
+    try:
+        src_view = src.buf[start:end]
+        key_view = key.buf[start:end]
+        result, _ = xor_bytes(src_view, key_view, backend)
+        out.buf[start:end] = result
+        partial = partial_fn(src_view)
+        del src_view, key_view
+        return partial
+    finally:
+        src.close()
+        key.close()
+        out.close()
+
+
+def chunk_bounds(length: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """Bagi panjang data menjadi daftar (start, end)"""
+    return [(start, min(start + chunk_size, length))
+            for start in range(0, length, chunk_size)]
+
+
+def parallel_xor(data, key, workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, backend: str = 'auto',
+                 partial_fn: Callable = xor_fold) -> Tuple[bytes, list]:
+    """
+    XOR data dengan kunci secara paralel di beberapa proses
+
+    Args:
+        data: Data dalam bentuk bytes
+        key: Kunci, panjang harus >= panjang data
+        workers: Jumlah proses (None = os.cpu_count())
+        chunk_size: Ukuran chunk per tugas worker
+        backend: Backend XOR yang dipakai worker
+        partial_fn: Fungsi (picklable) yang dijalankan atas input setiap chunk
+
+    Returns:
+        Tuple berisi (hasil_xor, daftar hasil parsial per chunk sesuai urutan)
+    """
+    length = len(data)
+    if len(key) < length:
+        raise ValueError("Kunci XOR lebih pendek dari data")
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or length < PARALLEL_MIN_SIZE:
+        result, _ = xor_bytes(data, key, backend)
+        return result, [partial_fn(data)]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    segments = []
+    try:
+        for source in (data, key):
+            shm = shared_memory.SharedMemory(create=True, size=length)
+            segments.append(shm)
+            shm.buf[:length] = memoryview(source)[:length]
+        out = shared_memory.SharedMemory(create=True, size=length)
+        segments.append(out)
+
+        tasks = [(segments[0].name, segments[1].name, out.name, start, end,
+                  backend, partial_fn)
+                 for start, end in chunk_bounds(length, chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(_xor_chunk, tasks))
+
+        return bytes(out.buf[:length]), partials
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,201 @@
+"""
+USAC Authentication Tag - polynomial universal hash (Wegman-Carter)
+
+Tag dihitung sebagai evaluasi polinomial modulo bilangan prima
+p = 2^130 - 5 atas blok pesan 16 byte (seperti Poly1305):
+
+    h = (((m_1 * r + m_2) * r + ...) + m_k) * r  mod p
+    tag = (h + s) mod 2^w
+
+dengan r (16 byte) dan s (w/8 byte) diambil dari one-time key, dan setiap
+blok diberi bit penanda 2^(8 * panjang_blok) sehingga panjang pesan ikut
+terautentikasi. Peluang pemalsuan sekitar ceil(L / 16) / 2^w untuk pesan
+L byte. Lebar tag dapat dipilih: 32, 64 atau 128 bit.
+
+Blok dibaca per word 64-bit (bukan per byte), dan hasil parsial per chunk
+dapat digabungkan sehingga tag bisa dihitung secara paralel atau
+inkremental.
+
+Lebar 8 bit adalah skema lama (XOR fold satu byte) yang dipertahankan
+untuk kompatibilitas.
+"""
+
+import struct
+import sys
+from itertools import chain
+from typing import Iterator, Tuple
+
+from xor_engine import xor_fold
+
+BLOCK_SIZE = 16
+PRIME = (1 << 130) - 5
+LEGACY_TAG_BITS = 8
+LEGACY_TAG_KEY_LENGTH = 16
+SUPPORTED_TAG_BITS = (LEGACY_TAG_BITS, 32, 64, 128)
+
+_HIBIT = 1 << (8 * BLOCK_SIZE)
+
+
+def tag_key_length(tag_bits: int) -> int:
+    """
+    Panjang kunci tag (bytes) yang dibutuhkan setelah region pesan
+
+    Args:
+        tag_bits: Lebar tag dalam bit
+
+    Returns:
+        Panjang kunci tag dalam bytes
+    """
+    if tag_bits not in SUPPORTED_TAG_BITS:
+        raise ValueError(f"Tag width {tag_bits} not supported")
+    if tag_bits == LEGACY_TAG_BITS:
+        return LEGACY_TAG_KEY_LENGTH
+    return BLOCK_SIZE + tag_bits // 8
+
+
+def split_tag_key(tag_key, tag_bits: int) -> Tuple[int, int]:
+    """Pisahkan kunci tag menjadi (r, s)"""
+    r = int.from_bytes(tag_key[:BLOCK_SIZE], 'little') % PRIME
+    s = int.from_bytes(tag_key[BLOCK_SIZE:BLOCK_SIZE + tag_bits // 8], 'little')
+    return r, s
+
+
+def block_count(length: int) -> int:
+    """Jumlah blok polinomial untuk data sepanjang length bytes"""
+    return (length + BLOCK_SIZE - 1) // BLOCK_SIZE
+
+
+def _words(view) -> Iterator[int]:
+    """Iterasi word 64-bit little-endian dari buffer (panjang kelipatan 8)"""
+    if sys.byteorder == 'little':
+        return iter(view.cast('Q'))
+    return chain.from_iterable(struct.iter_unpack('<Q', view))
+
+
+def poly_accumulate(data, r: int, acc: int = 0, pad=None) -> int:
+    """
+    Proses data ke akumulator polinomial
+
+    Semua blok penuh diproses; blok sisa terakhir (jika ada) juga diproses
+    dengan bit penanda sesuai panjangnya. Untuk pemrosesan inkremental,
+    setiap potongan selain yang terakhir harus kelipatan BLOCK_SIZE.
+
+    Args:
+        data: Data dalam bentuk bytes
+        r: Titik evaluasi polinomial
+        acc: Nilai akumulator awal
+        pad: Buffer opsional; jika diberikan, blok pesan adalah data XOR pad
+             (dipakai untuk menghitung tag langsung dari ciphertext)
+
+    Returns:
+        Nilai akumulator baru
+    """
+    view = memoryview(data).cast('B')
+    length = len(view)
+    full = length - length % BLOCK_SIZE
+    p = PRIME
+    hibit = _HIBIT
+
+    if pad is None:
+        words = _words(view[:full])
+        for lo, hi in zip(words, words):
+            acc = (acc + (lo | hi << 64 | hibit)) * r % p
+    else:
+        pad = memoryview(pad).cast('B')
+        words = _words(view[:full])
+        pad_words = _words(pad[:full])
+        for lo, hi, pad_lo, pad_hi in zip(words, words, pad_words, pad_words):
+            acc = (acc + ((lo ^ pad_lo) | (hi ^ pad_hi) << 64 | hibit)) * r % p
+
+    if full < length:
+        block = int.from_bytes(view[full:], 'little')
+        if pad is not None:
+            block ^= int.from_bytes(pad[full:length], 'little')
+        acc = (acc + (block | 1 << (8 * (length - full)))) * r % p
+    return acc
+
+
+def poly_combine(acc: int, next_acc: int, next_blocks: int, r: int) -> int:
+    """
+    Gabungkan akumulator dua bagian pesan yang berurutan
+
+    Args:
+        acc: Akumulator bagian pertama
+        next_acc: Akumulator bagian berikutnya (dimulai dari 0)
+        next_blocks: Jumlah blok pada bagian berikutnya
+        r: Titik evaluasi polinomial
+
+    Returns:
+        Akumulator untuk gabungan kedua bagian
+    """
+    return (acc * pow(r, next_blocks, PRIME) + next_acc) % PRIME
+
+
+def poly_finish(acc: int, s: int, tag_bits: int) -> bytes:
+    """Ubah akumulator menjadi tag: (h + s) mod 2^w"""
+    mask = (1 << tag_bits) - 1
+    return ((acc + s) & mask).to_bytes(tag_bits // 8, 'little')
+
+
+def compute_tag(message, tag_key, tag_bits: int, pad=None) -> bytes:
+    """
+    Hitung authentication tag USAC
+
+    Args:
+        message: Pesan (atau ciphertext jika pad diberikan) dalam bytes
+        tag_key: Kunci tag dari one-time key
+        tag_bits: Lebar tag dalam bit
+        pad: Buffer opsional untuk menghitung tag dari ciphertext
+
+    Returns:
+        Tag dalam bentuk bytes (tag_bits / 8 byte)
+    """
+    if tag_bits == LEGACY_TAG_BITS:
+        length = len(message)
+        tag = xor_fold(message) ^ xor_fold(tag_key[:length])
+        if pad is not None:
+            tag ^= xor_fold(memoryview(pad)[:length])
+        return bytes([tag])
+    r, s = split_tag_key(tag_key, tag_bits)
+    return poly_finish(poly_accumulate(message, r, pad=pad), s, tag_bits)
+
+
+class PolyHash:
+    """
+    Perhitungan tag polinomial secara inkremental
+
+    Data boleh diberikan dalam potongan berukuran bebas; sisa yang belum
+    membentuk blok penuh disimpan sampai update berikutnya.
+    """
+
+    def __init__(self, tag_key, tag_bits: int):
+        if tag_bits == LEGACY_TAG_BITS:
+            raise ValueError("PolyHash memerlukan tag polinomial (32/64/128 bit)")
+        self.tag_bits = tag_bits
+        self._r, self._s = split_tag_key(tag_key, tag_bits)
+        self._acc = 0
+        self._pending = bytearray()
+
+    def update(self, data) -> 'PolyHash':
+        """Tambahkan potongan data"""
+        view = memoryview(data).cast('B')
+        if self._pending:
+            take = min(BLOCK_SIZE - len(self._pending), len(view))
+            self._pending += view[:take]
+            view = view[take:]
+            if len(self._pending) < BLOCK_SIZE:
+                return self
+            self._acc = poly_accumulate(self._pending, self._r, self._acc)
+            self._pending.clear()
+        full = len(view) - len(view) % BLOCK_SIZE
+        if full:
+            self._acc = poly_accumulate(view[:full], self._r, self._acc)
+        self._pending += view[full:]
+        return self
+
+    def digest(self) -> bytes:
+        """Kembalikan tag untuk semua data yang sudah diberikan"""
+        acc = self._acc
+        if self._pending:
+            acc = poly_accumulate(self._pending, self._r, acc)
+        return poly_finish(acc, self._s, self.tag_bits)
@@ -0,0 +1,138 @@
+"""
+XOR Engine - backend XOR untuk one-time pad USAC
+
+Menyediakan beberapa backend XOR yang menghasilkan output identik:
+- loop   : referensi byte-per-byte (implementasi awal USAC)
+- int    : pure-stdlib, int.from_bytes XOR int.to_bytes
+- numpy  : vektorisasi dengan numpy.frombuffer (opsional)
+
+Backend 'auto' memilih backend tercepat berdasarkan ukuran data.
+"""
+
+from typing import Callable, Dict
+
+# Di atas ukuran ini numpy lebih cepat daripada big-int (jika tersedia)
+NUMPY_THRESHOLD = 64 * 1024
+
+_numpy = None
+
+
+def _load_numpy():
+    """Import numpy secara lazy; mengembalikan None jika tidak tersedia"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def xor_loop(data, key) -> bytes:
+    """XOR byte-per-byte (referensi)"""
+    result = bytearray()
+    for i, byte in enumerate(data):
+        result.append(byte ^ key[i])
+    return bytes(result)
+
+
+def xor_int(data, key) -> bytes:
+    """XOR menggunakan aritmetika big-int dari stdlib"""
+    length = len(data)
+    if length == 0:
+        return b''
+    value = int.from_bytes(data, 'little') ^ int.from_bytes(key[:length], 'little')
+    return value.to_bytes(length, 'little')
+
+
+def xor_numpy(data, key) -> bytes:
+    """XOR tervektorisasi menggunakan numpy.frombuffer"""
+    np = _load_numpy()
+    if np is None:
+        raise RuntimeError("Backend numpy tidak tersedia")
+    length = len(data)
+    if length == 0:
+        return b''
+    a = np.frombuffer(data, dtype=np.uint8, count=length)
+    b = np.frombuffer(key, dtype=np.uint8, count=length)
+    return np.bitwise_xor(a, b).tobytes()
+
+
+def xor_fold(data) -> int:
+    """
+    XOR seluruh byte data menjadi satu byte
+
+    Args:
+        data: Data dalam bentuk bytes
+
+    Returns:
+        Hasil XOR semua byte (0-255)
+    """
+    length = len(data)
+    if length == 0:
+        return 0
+    np = _load_numpy() if length >= NUMPY_THRESHOLD else None
+    if np is not None:
+        return int(np.bitwise_xor.reduce(np.frombuffer(data, dtype=np.uint8, count=length)))
+    value = int.from_bytes(data, 'little')
+    width = length
+    while width > 1:
+        half = (width + 1) // 2
+        value = (value & ((1 << (8 * half)) - 1)) ^ (value >> (8 * half))
+        width = half
+    return value
+
+
+XOR_BACKENDS: Dict[str, Callable] = {
+    'loop': xor_loop,
+    'int': xor_int,
+    'numpy': xor_numpy,
+}
+
+
+def available_backends() -> list:
+    """Daftar backend yang dapat digunakan di environment ini"""
+    names = ['loop', 'int']
+    if _load_numpy() is not None:
+        names.append('numpy')
+    return names
+
+
+def select_backend(size: int, backend: str = 'auto') -> str:
+    """
+    Pilih nama backend XOR untuk data dengan ukuran tertentu
+
+    Args:
+        size: Panjang data dalam bytes
+        backend: Nama backend atau 'auto'
+
+    Returns:
+        Nama backend yang digunakan
+    """
+    if backend != 'auto':
+        if backend not in XOR_BACKENDS:
+            raise ValueError(f"XOR backend {backend} not supported")
+        return backend
+    if size >= NUMPY_THRESHOLD and _load_numpy() is not None:
+        return 'numpy'
+    return 'int'
+
+
+def xor_bytes(data, key, backend: str = 'auto'):
+    """
+    XOR data dengan kunci menggunakan backend yang dipilih
+
+    Args:
+        data: Data dalam bentuk bytes
+        key: Kunci, panjang harus >= panjang data
+        backend: Nama backend atau 'auto'
+
+    Returns:
+        Tuple berisi (hasil_xor, nama_backend)
+    """
+    length = len(data)
+    if len(key) < length:
+        raise ValueError("Kunci XOR lebih pendek dari data")
+    name = select_backend(length, backend)
+    return XOR_BACKENDS[name](data, key), name